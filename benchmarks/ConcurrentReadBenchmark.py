@@ -0,0 +1,105 @@
+"""
+Multithreaded read stress benchmark of ConfigParser
+
+Readers take a DatasetHandle snapshot per request and evaluate meta ship stats, dock rows and cached tables while a
+writer thread keeps swapping between two different datasets. Every request checks that the parser of its snapshot is
+the dataset published with that version. The second dataset is the dump given as second argument, or a copy of the
+first dataset with one ship record changed in memory before it is published, so both always have different hashes.
+
+The readers are pure Python threads sharing the GIL, so throughput is not expected to grow with the thread count.
+What is measured is the latency of a request under contention (median and 99th percentile per thread count). The
+99th percentile grows with the thread count because threads wait for the GIL (sys.getswitchinterval), a flat median
+shows that snapshot reads and the swapping writer add no locking of their own.
+
+usage: python benchmarks/ConcurrentReadBenchmark.py /path/to/dump/ [seconds per thread count] [/path/to/other/dump/]
+"""
+import os
+import sys
+import time
+import random
+import threading
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from main.ConfigParser import ConfigParser  # noqa: E402
+from main.DatasetHandle import DatasetHandle  # noqa: E402
+
+
+def runReaders(handle: DatasetHandle, datasetHashList, metaIdList, threadCount: int, seconds: float) -> List[float]:
+    stopEvent = threading.Event()
+    latencyLists = [[] for _ in range(threadCount)]
+    errorList = []
+
+    def read(index: int):
+        rng = random.Random(index)
+        while not stopEvent.is_set():
+            startTime = time.perf_counter()
+            version, parser = handle.getSnapshot()
+            metaId = rng.choice(metaIdList)
+            parser.getMetaShip(metaId).getStat(2, 120, 3, 12, False, True)
+            parser.evaluateDock([metaId], [120], [3], [12], [False])
+            parser.getFleetTechTable()
+            if handle.getSnapshot()[0] < version or parser.getDatasetHash() != datasetHashList[version]:
+                errorList.append("inconsistent snapshot {}".format(version))
+            latencyLists[index].append(time.perf_counter() - startTime)
+
+    threadList = [threading.Thread(target=read, args=(index,)) for index in range(threadCount)]
+    for thread in threadList:
+        thread.start()
+    time.sleep(seconds)
+    stopEvent.set()
+    for thread in threadList:
+        thread.join()
+    if errorList:
+        raise RuntimeError(errorList[0])
+    return sorted(latency for latencyList in latencyLists for latency in latencyList)
+
+
+def createModifiedParser(path: str) -> ConfigParser:
+    # changes one record before the parser is published, so its dataset hash differs from the original dataset
+    parser = ConfigParser(path)
+    record = parser.shipStatisticDict[min(parser.shipStatisticDict)]
+    record["attrs"] = [record["attrs"][0] + 1] + list(record["attrs"][1:])
+    return parser
+
+
+def main():
+    path = sys.argv[1]
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2
+    otherParser = ConfigParser(sys.argv[3]) if len(sys.argv) > 3 else createModifiedParser(path)
+    parserList = [ConfigParser(path), otherParser]
+    if parserList[0].getDatasetHash() == parserList[1].getDatasetHash():
+        raise ValueError("the two datasets must be different")
+    handle = DatasetHandle(parserList[0])
+    # datasetHashList[version] is the dataset hash of each published snapshot
+    datasetHashList = [parserList[0].getDatasetHash()]
+    metaIdList = sorted(parserList[0].getMetaIdList())
+
+    stopEvent = threading.Event()
+
+    def swap():
+        while not stopEvent.is_set():
+            parser = parserList[len(datasetHashList) % 2]
+            datasetHashList.append(parser.getDatasetHash())
+            handle.swap(parser)
+            time.sleep(0.01)
+
+    swapThread = threading.Thread(target=swap)
+    swapThread.start()
+    try:
+        for threadCount in [1, 2, 4, 8, 16]:
+            latencyList = runReaders(handle, datasetHashList, metaIdList, threadCount, seconds)
+            print("{:>3} threads {:>8} requests  median {:>8.3f} ms  p99 {:>8.3f} ms".format(
+                threadCount, len(latencyList), latencyList[len(latencyList) // 2] * 1000,
+                latencyList[min(len(latencyList) - 1, len(latencyList) * 99 // 100)] * 1000))
+    finally:
+        stopEvent.set()
+        swapThread.join()
+        for parser in parserList:
+            parser.close()
+    print("{} swaps between two datasets, no inconsistent snapshot".format(len(datasetHashList) - 1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import math
+from typing import Dict, List
+from .ConfigParser import ConfigParser
+
+# the armor types of Bullet.getArmorModifier, 0 for light, 1 for medium and 2 for heavy
+armorTypeList = [0, 1, 2]
+
+
+class AirPowerTable:
+    """
+    AirPowerTable resolves every aircraft of aircraft_template once and stores their stats as columns: the i-th element
+    of each list belongs to aircraftIdList[i]. Level dependent values are tables with one row per aircraft and one
+    column per level, row[level - 1] is the value at that level. Aircraft that fail to build are listed in
+    failedAircraftIds.
+    """
+
+    def __init__(self, parser: ConfigParser, maxLevel: int = 120):
+        """
+        Constructor of AirPowerTable class
+
+        :param parser: the ConfigParser
+        :param maxLevel: integer, the highest level of the level tables
+        """
+        if maxLevel < 1:
+            raise ValueError("maxLevel ({}) out of bound".format(maxLevel))
+        self.maxLevel = maxLevel
+        self.aircraftIdList: List[int] = []
+        self.failedAircraftIds: List[int] = []
+        self.maxHpList: List[int] = []
+        self.hpGrowthList: List[int] = []
+        self.crashDamageList: List[int] = []
+        self.evaRateList: List[int] = []
+        self.speedList: List[int] = []
+        self.ordnanceDamageList: List[List[float]] = []  # [aircraft index][armor type]
+        for aircraftId in sorted(int(aircraftId) for aircraftId in parser.aircraftDataDict):
+            try:
+                aircraft = parser.getAircraft(aircraftId)
+                ordnanceDamage = [aircraft.getOrdnanceDamageByArmorType(armorType) for armorType in armorTypeList]
+            except (KeyError, ValueError, IndexError, AttributeError):
+                self.failedAircraftIds.append(aircraftId)
+                continue
+            self.aircraftIdList.append(aircraftId)
+            self.maxHpList.append(aircraft.maxHp)
+            self.hpGrowthList.append(aircraft.hpGrowth)
+            self.crashDamageList.append(aircraft.crashDamage)
+            self.evaRateList.append(aircraft.evaRate)
+            self.speedList.append(aircraft.speed)
+            self.ordnanceDamageList.append(ordnanceDamage)
+        self.indexDict: Dict[int, int] = {aircraftId: index for index, aircraftId in enumerate(self.aircraftIdList)}
+        # hp = maxHp + (level - 1) * hpGrowth / 1000, see Aircraft.getHp
+        self.hpTable: List[List[float]] = [[maxHp + levelOffset * hpGrowth / 1000 for levelOffset in range(0, maxLevel)]
+                                           for maxHp, hpGrowth in zip(self.maxHpList, self.hpGrowthList)]
+
+    def getIndex(self, aircraftId: int) -> int:
+        return self.indexDict[aircraftId]
+
+    def getHp(self, aircraftId: int, level: int) -> float:
+        """
+        Gets the hp of an aircraft at a certain level
+
+        :param aircraftId: integer, the id of that aircraft
+        :param level: integer, range from 1 to maxLevel
+        :return: float, the hp
+        """
+        if level < 1 or level > self.maxLevel:
+            raise ValueError("level ({}) out of bound".format(level))
+        return self.hpTable[self.indexDict[aircraftId]][level - 1]
+
+    def getOrdnanceDamageColumn(self, armorType: int) -> List[float]:
+        """
+        Gets the carried ordnance damage of every aircraft against an armor type
+
+        :param armorType: integer, range from 0 to 2
+        :return: list of floats, aligned with aircraftIdList
+        """
+        if armorType not in armorTypeList:
+            raise ValueError("armorType ({}) out of bound".format(armorType))
+        return [ordnanceDamage[armorType] for ordnanceDamage in self.ordnanceDamageList]
+
+    def getHitsToDownTable(self, aaDamage: float) -> List[List[int]]:
+        """
+        Calculates how many hits of an anti-air damage value each aircraft takes to go down at every level. Dodge is not
+        counted, see evaRateList
+
+        :param aaDamage: positive number, the damage of one anti-air hit
+        :return: list of lists of integers, [aircraft index][level - 1] is the number of hits needed to shoot it down
+        """
+        if aaDamage <= 0:
+            raise ValueError("aaDamage ({}) must be positive".format(aaDamage))
+        return [[math.ceil(hp / aaDamage) for hp in hpRow] for hpRow in self.hpTable]
+
+    def getAirPowerRanking(self, armorType: int, aaDamage: float, level: int) -> List[tuple]:
+        """
+        Ranks every aircraft by carried ordnance damage against an armor type times the hits it survives at a level
+
+        :param armorType: integer, range from 0 to 2
+        :param aaDamage: positive number, the damage of one anti-air hit
+        :param level: integer, range from 1 to maxLevel
+        :return: list of (aircraftId, ordnance damage, hits to down) sorted by their product descending then id
+        """
+        if level < 1 or level > self.maxLevel:
+            raise ValueError("level ({}) out of bound".format(level))
+        if aaDamage <= 0:
+            raise ValueError("aaDamage ({}) must be positive".format(aaDamage))
+        damageColumn = self.getOrdnanceDamageColumn(armorType)
+        result = [(aircraftId, damageColumn[index], math.ceil(self.hpTable[index][level - 1] / aaDamage))
+                  for index, aircraftId in enumerate(self.aircraftIdList)]
+        return sorted(result, key=lambda row: (-row[1] * row[2], row[0]))
@@ -0,0 +1,219 @@
+import sys
+import csv
+import json
+import time
+import argparse
+from typing import List, Dict, Callable, Any, Tuple, Optional, Iterable
+from .ConfigParser import ConfigParser
+from .Parallel import mapWithParser
+from .Serialization import toJsonable
+from .Utility import parseIdRange
+
+
+def getMetaShipIdList(parser: ConfigParser) -> List[int]:
+    return sorted(parser.getMetaIdList())
+
+
+def getShipIdList(parser: ConfigParser) -> List[int]:
+    return sorted(parser.getShipIdList())
+
+
+def getWeaponIdList(parser: ConfigParser) -> List[int]:
+    return sorted(int(weaponId) for weaponId in parser.weaponDataDict)
+
+
+def getRootBuffIdList(parser: ConfigParser) -> List[int]:
+    buffIdSet = set(parser.getGameConfigIdList("buff"))
+    return sorted(int(buffId) for buffId in parser.skillDataDict if int(buffId) in buffIdSet)
+
+
+# maps the dumpable kinds to (function listing all ids, name of the ConfigParser method that builds one object)
+dumpKindDict: Dict[str, Tuple[Callable[[ConfigParser], List[int]], str]] = {
+    "metaships": (getMetaShipIdList, "getMetaShip"),
+    "ships": (getShipIdList, "getShip"),
+    "weapons": (getWeaponIdList, "getWeapon"),
+    "rootbuffs": (getRootBuffIdList, "getRootBuff"),
+}
+
+
+def dumpChunk(parser: ConfigParser, task: Tuple[str, List[int]]) -> Tuple[List[Dict], List[str], float]:
+    """
+    Builds and serializes the objects of one chunk of ids, runs in worker processes
+
+    :param parser: the ConfigParser
+    :param task: tuple of the dump kind and the list of ids
+    :return: tuple of serialized records, error messages and the time spent
+    """
+    startTime = time.perf_counter()
+    kind, idList = task
+    builder = getattr(parser, dumpKindDict[kind][1])
+    recordList = []
+    errorList = []
+    for objectId in idList:
+        try:
+            recordList.append(toJsonable(builder(objectId)))
+        except Exception as error:
+            # one bad record must not end the whole dump, every failure is reported on stderr instead
+            errorList.append("{} {}: {}: {}".format(kind, objectId, type(error).__name__, error))
+    return recordList, errorList, time.perf_counter() - startTime
+
+
+def writeRecords(recordIterable: Iterable[Dict], outputFile, outputFormat: str):
+    """
+    Writes records as json lines or csv, nested values of csv cells are json encoded. Json lines are written as the
+    records arrive. The csv columns are the union of the keys of all records (records of different classes, for example
+    SurfaceShip and Submarine, have different keys), so csv rows are written once every record has been seen
+
+    :param recordIterable: iterable of json-like dicts
+    :param outputFile: text file object
+    :param outputFormat: string, "jsonl" or "csv"
+    """
+    if outputFormat == "jsonl":
+        for record in recordIterable:
+            outputFile.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return
+
+    rowList = []
+    fieldnames = {}  # dict instead of set to keep the columns in the order they first appear
+    for record in recordIterable:
+        rowList.append({key: value if isinstance(value, (str, int, float)) or value is None
+                        else json.dumps(value, ensure_ascii=False) for key, value in record.items()})
+        fieldnames.update(dict.fromkeys(record))
+    csvWriter = csv.DictWriter(outputFile, fieldnames=list(fieldnames))
+    csvWriter.writeheader()
+    csvWriter.writerows(rowList)
+
+
+def runDump(parser: ConfigParser, arguments: argparse.Namespace, timings: Dict[str, float]):
+    idListGetter = dumpKindDict[arguments.kind][0]
+    allIdList = idListGetter(parser)
+    if arguments.ids is not None:
+        allIdSet = set(allIdList)
+        idList = [objectId for objectId in parseIdRange(arguments.ids) if objectId in allIdSet]
+    else:
+        idList = allIdList
+    taskList = [(arguments.kind, idList[start:start + arguments.chunk_size])
+                for start in range(0, len(idList), arguments.chunk_size)]
+
+    def genRecords():
+        for recordList, errorList, buildTime in mapWithParser(parser, dumpChunk, taskList, arguments.jobs):
+            timings["build"] += buildTime
+            for error in errorList:
+                print(error, file=sys.stderr)
+            startTime = time.perf_counter()
+            yield from recordList
+            timings["write"] += time.perf_counter() - startTime
+
+    timings["build"] = 0
+    timings["write"] = 0
+    if arguments.output == "-":
+        writeRecords(genRecords(), sys.stdout, arguments.format)
+    else:
+        with open(arguments.output, "w", newline="", encoding="utf-8") as outputFile:
+            writeRecords(genRecords(), outputFile, arguments.format)
+
+
+def runServer(parser: ConfigParser, arguments: argparse.Namespace, timings: Dict[str, float]):
+    from .QueryServer import createServer
+
+    startTime = time.perf_counter()
+    server = createServer(parser, arguments.host, arguments.port, arguments.cache_size, arguments.max_batch_size)
+    timings["prepare"] = time.perf_counter() - startTime
+    print("serving on http://{}:{}".format(*server.server_address[:2]), file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def runPack(parser: ConfigParser, arguments: argparse.Namespace, timings: Dict[str, float]):
+    from .MappedDataset import writeMappedDataset
+
+    startTime = time.perf_counter()
+    writeMappedDataset(parser, arguments.output)
+    timings["pack"] = time.perf_counter() - startTime
+
+
+def runValidate(parser: ConfigParser, arguments: argparse.Namespace, timings: Dict[str, float]) -> int:
+    startTime = time.perf_counter()
+    report = parser.validateReferences(arguments.gamecfg)
+    timings["validate"] = time.perf_counter() - startTime
+    print(report.toString())
+    return 0 if report.isValid() else 1
+
+
+def runMemory(parser: ConfigParser, arguments: argparse.Namespace, timings: Dict[str, float]):
+    startTime = time.perf_counter()
+    report = parser.getMemoryReport(arguments.gamecfg, not arguments.skip_objects)
+    timings["measure"] = time.perf_counter() - startTime
+    if arguments.json:
+        print(json.dumps(toJsonable(report), ensure_ascii=False, indent=2))
+    else:
+        print(report.toString())
+
+
+def createArgumentParser() -> argparse.ArgumentParser:
+    argumentParser = argparse.ArgumentParser(prog="al-config", description="Azur Lane configuration file tool")
+    argumentParser.add_argument("path",
+                                help="the parent folder of the sharecfg and gamecfg folders, or an archive of it")
+    argumentParser.add_argument("--timings", action="store_true", help="print the time spent in each phase to stderr")
+    subparsers = argumentParser.add_subparsers(dest="command", required=True)
+
+    dumpParser = subparsers.add_parser("dump", help="dump built objects")
+    dumpParser.add_argument("kind", choices=sorted(dumpKindDict))
+    dumpParser.add_argument("--ids", help='ids or inclusive id ranges, for example "1-100,205", default all ids')
+    dumpParser.add_argument("--jobs", type=int, default=1, help="number of worker processes")
+    dumpParser.add_argument("--chunk-size", type=int, default=64, help="number of ids per worker task")
+    dumpParser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    dumpParser.add_argument("--output", default="-", help='output file, "-" means stdout')
+    dumpParser.set_defaults(function=runDump)
+
+    serveParser = subparsers.add_parser("serve", help="serve json queries over http from one resident parser")
+    serveParser.add_argument("--host", default="127.0.0.1")
+    serveParser.add_argument("--port", type=int, default=8080)
+    serveParser.add_argument("--cache-size", type=int, default=1024, help="maximum number of cached responses")
+    serveParser.add_argument("--max-batch-size", type=int, default=500, help="maximum number of ids of a batch query")
+    serveParser.set_defaults(function=runServer)
+
+    packParser = subparsers.add_parser("pack", help="write the sharecfg tables as one memory-mappable file")
+    packParser.add_argument("output", help="the output file, read it with MappedConfigParser")
+    packParser.set_defaults(function=runPack)
+
+    validateParser = subparsers.add_parser("validate", help="check every cross-table reference, exit code 1 on issues")
+    validateParser.add_argument("--gamecfg", action="store_true", help="also check all gamecfg skill and buff files")
+    validateParser.set_defaults(function=runValidate)
+
+    memoryParser = subparsers.add_parser("memory", help="report the deep memory usage of tables and model objects")
+    memoryParser.add_argument("--gamecfg", action="store_true", help="also load and measure all gamecfg files")
+    memoryParser.add_argument("--skip-objects", action="store_true", help="do not build and measure model objects")
+    memoryParser.add_argument("--json", action="store_true", help="print the report as json")
+    memoryParser.set_defaults(function=runMemory)
+    return argumentParser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the al-config command line tool
+
+    :param argv: list of arguments, None means sys.argv
+    :return: integer, the exit code
+    """
+    arguments = createArgumentParser().parse_args(argv)
+
+    timings: Dict[str, Any] = {}
+    startTime = time.perf_counter()
+    with ConfigParser(arguments.path) as parser:
+        timings["load"] = time.perf_counter() - startTime
+        exitCode = arguments.function(parser, arguments, timings) or 0
+        timings["total"] = time.perf_counter() - startTime
+
+    if arguments.timings:
+        for phase, seconds in timings.items():
+            print("{:<8}{:>10.3f}s".format(phase, seconds), file=sys.stderr)
+    return exitCode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
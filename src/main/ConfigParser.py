@@ -1,4 +1,7 @@
+import os
 import json
+import threading
+from types import MappingProxyType
 from .ResearchStrengthenNode import ResearchStrengthenNode
 from .Ships import Ship, SurfaceShip, Submarine
 from .Utility import *
@@ -6,7 +9,19 @@ from .NationList import getNationList
 from .RefitNode import RefitNode
 from .Bullets import Bullet
 from .Barrages import Barrage
-from typing import Dict, List, Set
+from .Interning import InternPool
+from .ConfigSource import openConfigSource
+from .Projection import ProjectedRecord, resolveProjection
+from typing import Dict, List, Set, Any, Callable, Hashable, Optional, Iterable, Iterator, Union, Mapping, Tuple
+
+# file names of all sharecfg tables a ConfigParser loads
+configNameList = ["ship_data_statistics", "ship_data_template", "attribute_info_by_type", "fleet_tech_ship_template",
+                  "ship_data_group", "ship_data_trans", "transform_data_template", "ship_data_strengthen",
+                  "ship_data_blueprint", "ship_strengthen_blueprint", "barrage_template", "bullet_template",
+                  "weapon_property", "skill_data_template", "aircraft_template"]
+
+# sentinel of getCached, cached values may be None
+cacheMiss = object()
 
 
 class ConfigParser:
@@ -15,37 +30,72 @@ class ConfigParser:
     It has methods to construct easily usable objects using those game files
     """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, internValues: bool = False,
+                 projection: Union[str, Dict[str, Iterable[str]], None] = None, shareSequences: bool = False):
         """
         The constructor of ConfigParser, takes a string and generates a parser object
 
-        :param path: the path to the parent folder of "sharecfg" folder and "gamecfg" folder, must be absolute path
+        :param path: the path to the parent folder of "sharecfg" folder and "gamecfg" folder, must be absolute path.
+                     Files may be gzip, bz2 or xz compressed. path may also be a zip or tar archive of that folder
+                     (read by random access) or a compressed tar archive of it (read in one streaming pass)
+        :param internValues: whether repeated strings and numbers of the tables are shared, see InternPool
+        :param projection: only keep some fields of the records, either a dict whose keys are table names (for example
+                           "ship_data_statistics") and values are the kept fields, or the name of a profile in
+                           Projection.projectionProfileDict. Accessing a dropped field raises ProjectedFieldError
+        :param shareSequences: with internValues, whether repeated lists are also shared as read-only tuples, see
+                               InternPool
         """
 
-        def loadConfig(configName: str) -> Dict:
-            configFile = open(path + "sharecfg/" + configName)
-            config = json.load(configFile)
-            config.pop('all')
-            configFile.close()
-            return config
-
         self.configPath = path
-
-        self.shipStatisticDict = loadConfig("ship_data_statistics")
-        self.shipDataDict = loadConfig("ship_data_template")
-        self.attrDict = loadConfig("attribute_info_by_type")
-        self.fleetTechDict = loadConfig("fleet_tech_ship_template")
-        self.shipGroupDict = loadConfig("ship_data_group")
-        self.shipRefitDict = loadConfig("ship_data_trans")
-        self.refitDataDict = loadConfig("transform_data_template")
-        self.shipStrengthenDict = loadConfig("ship_data_strengthen")
-        self.shipResearchDict = loadConfig("ship_data_blueprint")
-        self.researchStrengthenDict = loadConfig("ship_strengthen_blueprint")
-        self.barrageDataDict = loadConfig("barrage_template")
-        self.bulletDataDict = loadConfig("bullet_template")
-        self.weaponDataDict = loadConfig("weapon_property")
-        self.skillDataDict = loadConfig("skill_data_template")
-        self.aircraftDataDict = loadConfig("aircraft_template")
+        # the keyword arguments this parser was created with, see getConstructorArgs
+        self.parserKwargs = {"internValues": internValues, "projection": projection, "shareSequences": shareSequences}
+        self.configSource = openConfigSource(path)
+        self.internPool = InternPool(shareSequences) if internValues else None
+        self.tableProjections = resolveProjection(projection, configNameList)
+
+        self.shipStatisticDict = self.loadConfig("ship_data_statistics")
+        self.shipDataDict = self.loadConfig("ship_data_template")
+        self.attrDict = self.loadConfig("attribute_info_by_type")
+        self.fleetTechDict = self.loadConfig("fleet_tech_ship_template")
+        self.shipGroupDict = self.loadConfig("ship_data_group")
+        self.shipRefitDict = self.loadConfig("ship_data_trans")
+        self.refitDataDict = self.loadConfig("transform_data_template")
+        self.shipStrengthenDict = self.loadConfig("ship_data_strengthen")
+        self.shipResearchDict = self.loadConfig("ship_data_blueprint")
+        self.researchStrengthenDict = self.loadConfig("ship_strengthen_blueprint")
+        self.barrageDataDict = self.loadConfig("barrage_template")
+        self.bulletDataDict = self.loadConfig("bullet_template")
+        self.weaponDataDict = self.loadConfig("weapon_property")
+        self.skillDataDict = self.loadConfig("skill_data_template")
+        self.aircraftDataDict = self.loadConfig("aircraft_template")
+
+        # the raw table files are not needed anymore, see StreamedArchiveSource
+        self.configSource.releaseTables()
+        # the pool is only needed while loading, the tables keep the canonical values alive
+        self.internReport = self.internPool.getReport() if self.internPool is not None else None
+        self.internPool = None
+
+        # readers only ever see fully built cache values, the lock is taken by builders only
+        self.cache: Dict[Hashable, Any] = {}
+        self.cacheLock = threading.RLock()
+        # objectMemo of the thread building an object graph, see getObject
+        self.threadState = threading.local()
+
+    def getCached(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        """
+        Gets a precomputed object (index, table etc.) of this parser, builds and stores it on the first call
+
+        :param key: hashable, the key of that object
+        :param builder: function that takes no argument and builds that object
+        :return: the cached object
+        """
+        value = self.cache.get(key, cacheMiss)
+        if value is not cacheMiss:
+            return value
+        with self.cacheLock:
+            if key not in self.cache:
+                self.cache[key] = builder()
+            return self.cache[key]
 
     def getShip(self, shipID: int) -> Ship:
         """
@@ -57,9 +107,12 @@ class ConfigParser:
         """
         ID = str(shipID)
         if self.shipStatisticDict[ID]["oxy_max"] == 0:
-            return SurfaceShip(self.shipStatisticDict[ID], self.shipDataDict[ID], self.shipStrengthenDict)
+            return self.getObject(("ship", shipID), lambda: SurfaceShip(
+                self.shipStatisticDict[ID], self.shipDataDict[ID], self.shipStrengthenDict))
         else:
-            return Submarine(self.shipStatisticDict[ID], self.shipDataDict[ID], self.shipStrengthenDict)
+            return self.getObject(("ship", shipID), lambda: Submarine(
+                self.shipStatisticDict[ID], self.shipDataDict[ID], self.shipStrengthenDict,
+                self.getHuntingRangeTable().getGrid(shipID)))
 
     def getMetaShip(self, metaId: int):
         """
@@ -77,6 +130,209 @@ class ConfigParser:
                         refitDict=self.shipRefitDict.get(str(groupId)),
                         researchDict=self.shipResearchDict.get(str(groupId)))
 
+    def close(self):
+        """
+        Closes the dataset source (the archive file of an archive path), tables that are already loaded stay usable but
+        skill and buff files cannot be loaded afterwards. ConfigParser is also a context manager that closes on exit
+        """
+        self.configSource.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def getObject(self, key: Hashable, builder: Callable[[], Any]) -> Any:
+        """
+        Builds a model object. While the current thread is building an object graph (threadState.objectMemo is not
+        None) objects with the same key are built only once and shared
+
+        :param key: hashable, the kind and id of that object
+        :param builder: function that takes no argument and builds that object
+        :return: the model object
+        """
+        objectMemo = getattr(self.threadState, "objectMemo", None)
+        if objectMemo is None:
+            return builder()
+        if key not in objectMemo:
+            objectMemo[key] = builder()
+        return objectMemo[key]
+
+    def getDatasetHash(self) -> str:
+        """
+        Calculates the content hash of the whole dataset (all loaded tables and all gamecfg skill and buff files)
+
+        :return: string, the hex digest
+        """
+
+        def genHash() -> str:
+            hashList = [self.getTableHash(attrName) for attrName in sorted(vars(self)) if attrName.endswith("Dict")]
+            hashList += [getContentHash(self.loadSkill(skillId)) for skillId in self.getGameConfigIdList("skill")]
+            hashList += [getContentHash(self.loadBuff(buffId)) for buffId in self.getGameConfigIdList("buff")]
+            return getContentHash(hashList)
+
+        return self.getCached("datasetHash", genHash)
+
+    def getTableHash(self, attrName: str) -> str:
+        """
+        Calculates the content hash of one loaded table
+
+        :param attrName: string, the attribute holding that table, for example "shipDataDict"
+        :return: string, the hex digest
+        """
+        return getContentHash(dict(getattr(self, attrName)))
+
+    def getConstructorArgs(self) -> Tuple[tuple, Dict[str, Any]]:
+        """
+        Gets the arguments that create an equal parser of the same type, worker processes rebuild the parser from them
+        (see Parallel.mapWithParser)
+
+        :return: tuple of the positional arguments (tuple) and the keyword arguments (dict)
+        """
+        return (self.configPath,), dict(self.parserKwargs)
+
+    def getSourceManifest(self) -> List:
+        """
+        Describes the dataset files and the loading options of this parser without reading any file, equal manifests
+        mean equal datasets as long as files are not rewritten with the same size and modification time
+
+        :return: json-like list, see DirectorySource.getManifest
+        """
+        return [type(self).__name__, self.configSource.getManifest(), self.parserKwargs["internValues"],
+                self.parserKwargs["shareSequences"],
+                {configName: sorted(tableProjection.fieldSet)
+                 for configName, tableProjection in sorted(self.tableProjections.items())}]
+
+    def getGameConfigIdList(self, configType: str) -> List[int]:
+        """
+        Lists the ids of all gamecfg files of a type
+
+        :param configType: string, "skill" or "buff"
+        :return: sorted list of integers, the ids
+        """
+        prefix = configType + "_"
+        return sorted(int(fileName[len(prefix):]) for fileName in self.configSource.listFiles("gamecfg/" + configType)
+                      if fileName.startswith(prefix) and fileName[len(prefix):].isdigit())
+
+    def getObjectGraph(self, cacheDir: Optional[str] = None):
+        """
+        Gets the object graph of all meta ships and root buffs, see ObjectGraph
+
+        :param cacheDir: string or None, if given the graph is loaded from (or saved to) a file in this folder keyed by
+                         the stamps of the dataset files and the code version, see ObjectGraph.loadObjectGraph
+        :return: ObjectGraph object
+        """
+        from .ObjectGraph import buildObjectGraph, loadObjectGraph
+
+        if cacheDir is None:
+            return self.getCached(("objectGraph", None), lambda: buildObjectGraph(self))
+        return self.getCached(("objectGraph", os.path.abspath(cacheDir)), lambda: loadObjectGraph(self, cacheDir))
+
+    def getInternReport(self) -> Optional[Dict[str, int]]:
+        """
+        Gets the report of the interning pass, see InternPool.getReport
+
+        :return: a dict, or None if the tables were loaded without interning
+        """
+        return self.internReport
+
+    def validateReferences(self, includeGameConfig: bool = False):
+        """
+        Checks every cross-table reference of the dataset, see ReferenceValidator.validateReferences
+
+        :param includeGameConfig: whether the effect lists of all gamecfg skill and buff files are checked too
+        :return: ValidationReport object
+        """
+        from .ReferenceValidator import validateReferences
+
+        return validateReferences(self, includeGameConfig)
+
+    def getMemoryReport(self, includeGameConfig: bool = False, includeObjects: bool = True):
+        """
+        Measures the deep memory usage of the loaded tables, the gamecfg files and the model objects, see
+        MemoryProfiler.profileMemory
+
+        :param includeGameConfig: whether every gamecfg skill and buff file is loaded and measured
+        :param includeObjects: whether every MetaShip and RootBuff is built and its objects measured by kind
+        :return: MemoryReport object
+        """
+        from .MemoryProfiler import profileMemory
+
+        return profileMemory(self, includeGameConfig, includeObjects)
+
+    def getReferenceGraph(self):
+        """
+        Gets the graph of references between ships, skills, buffs, weapons, aircraft, bullets and barrages
+
+        :return: ReferenceGraph object
+        """
+        from .ReferenceGraph import ReferenceGraph
+
+        return self.getCached("referenceGraph", lambda: ReferenceGraph(self))
+
+    def getSkillSearchIndex(self):
+        """
+        Gets the full-text index of skill names and descriptions, call its update method after the skill table changes
+
+        :return: SkillSearchIndex object
+        """
+        from .SkillSearchIndex import SkillSearchIndex
+
+        return self.getCached("skillSearchIndex", lambda: SkillSearchIndex(self.skillDataDict))
+
+    def getFeedPlanner(self):
+        """
+        Gets the planner of enhancement feeds with the exp vectors of every ship, see FeedPlanner
+
+        :return: FeedPlanner object
+        """
+        from .FeedPlanner import FeedPlanner
+
+        return self.getCached("feedPlanner", lambda: FeedPlanner(self.shipDataDict, self.shipStrengthenDict))
+
+    def getEquipTypeIndex(self):
+        """
+        Gets the index from equipment types to the equipment slots of every meta ship that accept them
+
+        :return: EquipTypeIndex object
+        """
+        from .EquipTypeIndex import EquipTypeIndex
+
+        return self.getCached("equipTypeIndex", lambda: EquipTypeIndex(self))
+
+    def getFleetTechTable(self):
+        """
+        Gets the precomputed fleet tech table of all meta ships
+
+        :return: FleetTechTable object
+        """
+        from .FleetTech import FleetTechTable
+
+        return self.getCached("fleetTechTable", lambda: FleetTechTable(self.fleetTechDict, self.shipGroupDict))
+
+    def getFleetTechAggregator(self):
+        """
+        Creates an empty fleet tech aggregator of a dock
+
+        :return: FleetTechAggregator object
+        """
+        from .FleetTech import FleetTechAggregator
+
+        return FleetTechAggregator(self.getFleetTechTable())
+
+    def evaluateDock(self, metaIds: List[int], levels: List[int], lbLevels: List[int], affBonuses: List[int],
+                     refitted: List[bool], strengthened: List[bool] = None):
+        """
+        Evaluates the stats, equipment proficiencies and equipment base counts of many dock rows in one call,
+        see DockEvaluator.evaluateDock
+
+        :return: tuple of stat matrix, proficiency matrix and equipment base count matrix
+        """
+        from .DockEvaluator import evaluateDock
+
+        return evaluateDock(self, metaIds, levels, lbLevels, affBonuses, refitted, strengthened)
+
     def getRefitNode(self, refitNodeId: int) -> RefitNode:
         """
         Creates a RefitNode object from its id
@@ -86,7 +342,7 @@ class ConfigParser:
         """
         reversedAttrDict = self.getReversedAttrDict()
         nodeDict = self.refitDataDict[str(refitNodeId)]
-        return RefitNode(nodeDict, reversedAttrDict)
+        return self.getObject(("refitNode", refitNodeId), lambda: RefitNode(nodeDict, reversedAttrDict))
 
     def getResearchStrengthenNode(self, nodeId: int) -> ResearchStrengthenNode:
         """
@@ -97,7 +353,8 @@ class ConfigParser:
         """
         reversedAttrDict = self.getReversedAttrDict()
         effectData = self.researchStrengthenDict[str(nodeId)]
-        return ResearchStrengthenNode(effectData, reversedAttrDict)
+        return self.getObject(("researchStrengthenNode", nodeId),
+                              lambda: ResearchStrengthenNode(effectData, reversedAttrDict))
 
     def getWeapon(self, weaponId: int):
         """
@@ -108,7 +365,7 @@ class ConfigParser:
         """
         from .Weapons import Weapon
 
-        return Weapon(self.weaponDataDict[str(weaponId)], self)
+        return self.getObject(("weapon", weaponId), lambda: Weapon(self.weaponDataDict[str(weaponId)], self))
 
     def getSkill(self, skillId: int, skillLevel: int):
         """
@@ -120,7 +377,7 @@ class ConfigParser:
         """
         from .Triggerable import Skill
 
-        return Skill(self.loadSkill(skillId), skillLevel, self)
+        return self.getObject(("skill", skillId, skillLevel), lambda: Skill(self.loadSkill(skillId), skillLevel, self))
 
     def getBuff(self, buffId: int, buffLevel: int):
         """
@@ -132,7 +389,7 @@ class ConfigParser:
         """
         from .Triggerable import Buff
 
-        return Buff(self.loadBuff(buffId), buffLevel, self)
+        return self.getObject(("buff", buffId, buffLevel), lambda: Buff(self.loadBuff(buffId), buffLevel, self))
 
     def getRootBuff(self, buffId: int):
         """
@@ -146,6 +403,17 @@ class ConfigParser:
 
         return RootBuff(self.loadBuff(buffId), self.skillDataDict[str(buffId)], self)
 
+    def getSkillLevels(self, buffId: int):
+        """
+        Creates a displayed skill at every level in one pass, see SkillLevels
+
+        :param buffId: integer, the id of that buff
+        :return: SkillLevels object
+        """
+        from .SkillLevels import SkillLevels
+
+        return SkillLevels(self, buffId)
+
     def getBarrage(self, barrageId: int) -> Barrage:
         """
         Creates a barrage object from its id
@@ -153,7 +421,7 @@ class ConfigParser:
         :param barrageId: integer, the id of that barrage
         :return: barrage object
         """
-        return Barrage(self.barrageDataDict[str(barrageId)])
+        return self.getObject(("barrage", barrageId), lambda: Barrage(self.barrageDataDict[str(barrageId)]))
 
     def getBullet(self, bulletId: int) -> Bullet:
         """
@@ -162,12 +430,41 @@ class ConfigParser:
         :param bulletId: integer, the id of that bullet
         :return:
         """
-        return Bullet(self.bulletDataDict[str(bulletId)])
+        return self.getObject(("bullet", bulletId), lambda: Bullet(self.bulletDataDict[str(bulletId)]))
+
+    def getAirPowerTable(self):
+        """
+        Gets the hp by level, carried ordnance damage and survivability of every aircraft, see AirPowerTable
+
+        :return: AirPowerTable object
+        """
+        from .AirPower import AirPowerTable
+
+        return self.getCached("airPowerTable", lambda: AirPowerTable(self))
 
     def getAircraft(self, weaponId: int):
         from .Weapons import Aircraft
 
-        return Aircraft(self.aircraftDataDict[str(weaponId)], self)
+        return self.getObject(("aircraft", weaponId), lambda: Aircraft(self.aircraftDataDict[str(weaponId)], self))
+
+    def loadConfig(self, configName: str) -> Dict:
+        """
+        Loads a sharecfg table from serialized game files
+
+        :param configName: string, the file name of that table, for example "ship_data_statistics"
+        :return: dict, keys are record ids (string), values are records
+        """
+        with self.configSource.openFile("sharecfg/" + configName) as configFile:
+            config = json.load(configFile)
+        config.pop('all')
+        tableProjection = self.tableProjections.get(configName)
+        if tableProjection is not None:
+            config = {key: tableProjection.project(record) for key, record in config.items()}
+        if self.internPool is not None:
+            config = self.internPool.internTable(config)
+        if tableProjection is not None:
+            config = {key: ProjectedRecord(record, tableProjection) for key, record in config.items()}
+        return config
 
     def loadSkill(self, skillId: int) -> Dict:
         """
@@ -176,10 +473,8 @@ class ConfigParser:
         :param skillId: integer, the skill id
         :return: dict, the skill data
         """
-        configFile = open(self.configPath + "gamecfg/skill/skill_" + str(skillId))
-        config = json.load(configFile)
-        configFile.close()
-        return config
+        with self.configSource.openFile("gamecfg/skill/skill_" + str(skillId)) as configFile:
+            return json.load(configFile)
 
     def loadBuff(self, buffId: int) -> Dict:
         """
@@ -188,10 +483,8 @@ class ConfigParser:
         :param buffId: integer, the buff id
         :return: dict, the buff data
         """
-        configFile = open(self.configPath + "gamecfg/buff/buff_" + str(buffId))
-        config = json.load(configFile)
-        configFile.close()
-        return config
+        with self.configSource.openFile("gamecfg/buff/buff_" + str(buffId)) as configFile:
+            return json.load(configFile)
 
     def getAttrDict(self) -> Dict[int, str]:
         """
@@ -236,7 +529,7 @@ class ConfigParser:
         :return: list of all collectable ship ids
         """
         result = set()
-        for _, idList in self.getGroupIdToShipId().items():
+        for _, idList in self.getSharedGroupIdToShipId().items():
             for i in idList:
                 result.add(i)
         return result
@@ -247,7 +540,71 @@ class ConfigParser:
 
         :return: set of ship objects
         """
-        return {self.getShip(ID) for ID in self.getShipIdList()}
+        return set(self.iterShips())
+
+    @staticmethod
+    def iterObjects(idIterable: Iterable[int], builder: Callable[[int], Any],
+                    predicate: Optional[Callable[[Any], bool]], chunkSize: Optional[int]) -> Iterator:
+        """
+        Builds objects one at a time from their ids, filters them and optionally groups them into chunks
+
+        :param idIterable: iterable of integers, the ids
+        :param builder: function that takes an id and builds its object
+        :param predicate: function that takes an object and returns True to keep it, or None to keep all objects
+        :param chunkSize: integer or None, if given lists of at most chunkSize objects are yielded instead of objects
+        :return: generator of objects, or of lists of objects
+        """
+        objects = (builder(ID) for ID in idIterable)
+        if predicate is not None:
+            objects = (obj for obj in objects if predicate(obj))
+        return objects if chunkSize is None else chunked(objects, chunkSize)
+
+    def iterShips(self, predicate: Optional[Callable[[Ship], bool]] = None,
+                  chunkSize: Optional[int] = None) -> Iterator:
+        """
+        Lazily creates every unfiltered ship, see getShipIdList. Ships are built on demand and not kept by the parser
+
+        :param predicate: function that takes a Ship object and returns True to keep it, or None to keep all ships
+        :param chunkSize: integer or None, if given lists of at most chunkSize ships are yielded
+        :return: generator of SurfaceShip and Submarine objects, or of lists of them
+        """
+        shipIds = (int(ID) for ID in self.shipDataDict if not isFiltered(int(ID)))
+        return self.iterObjects(shipIds, self.getShip, predicate, chunkSize)
+
+    def iterMetaShips(self, predicate: Optional[Callable[[Any], bool]] = None,
+                      chunkSize: Optional[int] = None) -> Iterator:
+        """
+        Lazily creates every meta ship, see getMetaIdList
+
+        :param predicate: function that takes a MetaShip object and returns True to keep it, or None to keep all
+        :param chunkSize: integer or None, if given lists of at most chunkSize meta ships are yielded
+        :return: generator of MetaShip objects, or of lists of them
+        """
+        return self.iterObjects((int(metaId) for metaId in self.shipGroupDict), self.getMetaShip, predicate, chunkSize)
+
+    def iterWeapons(self, predicate: Optional[Callable[[Any], bool]] = None,
+                    chunkSize: Optional[int] = None) -> Iterator:
+        """
+        Lazily creates every weapon of weapon_property
+
+        :param predicate: function that takes a Weapon object and returns True to keep it, or None to keep all weapons
+        :param chunkSize: integer or None, if given lists of at most chunkSize weapons are yielded
+        :return: generator of Weapon objects, or of lists of them
+        """
+        return self.iterObjects((int(ID) for ID in self.weaponDataDict), self.getWeapon, predicate, chunkSize)
+
+    def iterRootBuffs(self, predicate: Optional[Callable[[Any], bool]] = None,
+                      chunkSize: Optional[int] = None) -> Iterator:
+        """
+        Lazily creates every displayed skill, that is every buff of skill_data_template that has a gamecfg buff file
+
+        :param predicate: function that takes a RootBuff object and returns True to keep it, or None to keep all buffs
+        :param chunkSize: integer or None, if given lists of at most chunkSize buffs are yielded
+        :return: generator of RootBuff objects, or of lists of them
+        """
+        buffIds = set(self.getGameConfigIdList("buff"))
+        return self.iterObjects((int(ID) for ID in self.skillDataDict if int(ID) in buffIds), self.getRootBuff,
+                                predicate, chunkSize)
 
     def getShipIdToName(self) -> Dict[int, str]:
         """
@@ -265,11 +622,32 @@ class ConfigParser:
 
         :return: a dict, keys are ship name (string), values are a list of ship id (int)
         """
-        nameToId = {name: [] for ID, name in self.getShipIdToName().items()}
+        nameToId = {}
         for ID, name in self.getShipIdToName().items():
-            nameToId[name].append(ID)
+            nameToId.setdefault(name, []).append(ID)
         return nameToId
 
+    def getShipNameIndex(self):
+        """
+        Gets the index of ship names for exact, prefix and fuzzy lookups, aliases can be added to it
+
+        :return: ShipNameIndex object
+        """
+        from .ShipNameIndex import ShipNameIndex
+
+        return self.getCached("shipNameIndex", lambda: ShipNameIndex(
+            sorted(self.getShipIdList()), self.shipStatisticDict, self.shipDataDict, self.shipGroupDict))
+
+    def getHuntingRangeTable(self):
+        """
+        Gets the hunting range masks of every submarine for fleet coverage queries, see HuntingRangeTable
+
+        :return: HuntingRangeTable object
+        """
+        from .HuntingRange import HuntingRangeTable
+
+        return self.getCached("huntingRangeTable", lambda: HuntingRangeTable(self.shipStatisticDict))
+
     def getGroupIdList(self) -> Set[int]:
         """
         Generates a set of groupIds of all meta ships
@@ -278,32 +656,53 @@ class ConfigParser:
         """
         return {groupDict["group_type"] for _, groupDict in self.shipGroupDict.items()}
 
+    def getSharedGroupIdToShipId(self) -> Mapping[int, Tuple[int, ...]]:
+        """
+        Gets the map of getGroupIdToShipId that is built once per parser and shared by every caller, without copying
+        it. It is a read-only mapping of tuples
+
+        :return: a read-only mapping, keys are IDs of meta ship, values are sorted tuples of ship ids
+        """
+
+        def genMap() -> Mapping[int, Tuple[int, ...]]:
+            # ship ids are sorted, so the map does not depend on the record order of the table (mapped tables iterate
+            # in key byte order)
+            result = {}
+            for shipId, groupDict in sorted(self.shipDataDict.items(), key=lambda item: int(item[0])):
+                shipId = int(shipId)
+                metaId = groupDict["group_type"]
+                if not isFiltered(shipId):
+                    if metaId not in result:
+                        result[metaId] = []
+                    result[metaId].append(shipId)
+            return MappingProxyType({metaId: tuple(idList) for metaId, idList in result.items()})
+
+        return self.getCached("groupIdToShipId", genMap)
+
     def getGroupIdToShipId(self) -> Dict[int, List[int]]:
         """
         generates a map from meta ship IDs to ships' ID
 
-        :return: a dict, keys are IDs of meta ship, values are list of ship ids corresponding to that meta ship
+        :return: a dict, keys are IDs of meta ship, values are sorted lists of ship ids corresponding to that meta ship
         """
-        result = {}
-        for shipId, groupDict in self.shipDataDict.items():
-            shipId = int(shipId)
-            metaId = groupDict["group_type"]
-            if not isFiltered(shipId):
-                if metaId not in result:
-                    result[metaId] = []
-                result[metaId].append(shipId)
-        return result
+        return {metaId: list(idList) for metaId, idList in self.getSharedGroupIdToShipId().items()}
 
-    def getGroupIdFromMetaId(self, metaId: int) -> Dict[int, int]:
+    def getGroupIdFromMetaId(self, metaId: int) -> int:
         """
         Returns the corresponding groupId of the meta ship with id metaId
 
         :param metaId: integer, metaId of that meta ship
-        :return: groupId, integer
+        :return: groupId, integer, None if there is no such meta ship
         """
-        for _, data in self.shipGroupDict.items():
-            if data["code"] == metaId:
-                return data["group_type"]
+
+        def genMap() -> Dict[int, int]:
+            # the first group of a code wins, like the linear search this map replaces
+            result = {}
+            for _, data in self.shipGroupDict.items():
+                result.setdefault(data["code"], data["group_type"])
+            return result
+
+        return self.getCached("metaIdToGroupId", genMap).get(metaId)
 
     def getMetaIdList(self) -> Set[int]:
         """
@@ -0,0 +1,266 @@
+import io
+import os
+import bz2
+import gzip
+import lzma
+import tarfile
+import zipfile
+import threading
+from typing import Dict, List, BinaryIO, Callable, Tuple
+
+# compressed file extensions and the functions that open them (paths or binary file objects) as streams
+compressionDict: Dict[str, Callable[[str], BinaryIO]] = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+# compressed tar archive extensions, read by StreamedArchiveSource
+streamedArchiveSuffixList = [".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz"]
+
+
+def getDatasetRelativePath(memberName: str) -> str:
+    """
+    Strips the folders above "sharecfg" or "gamecfg" of an archive member name, so "dump/sharecfg/x" becomes
+    "sharecfg/x"
+
+    :param memberName: string, the member name
+    :return: string, the path relative to the dataset root, unchanged if there is no such folder
+    """
+    parts = memberName.replace("\\", "/").split("/")
+    for index, part in enumerate(parts):
+        if part in ["sharecfg", "gamecfg"]:
+            return "/".join(parts[index:])
+    return memberName
+
+
+def getFileStamp(path: str) -> Tuple[int, int]:
+    """
+    Gets the size and the modification time of a file, a cheap stand-in for its content when keying caches
+
+    :param path: string, the file path
+    :return: tuple of integers, (size in bytes, modification time in nanoseconds)
+    """
+    fileStat = os.stat(path)
+    return fileStat.st_size, fileStat.st_mtime_ns
+
+
+class DirectorySource:
+    """
+    DirectorySource reads dataset files from a folder. Every file may also be stored compressed with a ".gz", ".bz2"
+    or ".xz" extension, it is then decompressed while being read.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def openFile(self, relativePath: str) -> BinaryIO:
+        """
+        Opens a dataset file as a binary stream
+
+        :param relativePath: string, the path relative to the dataset root, for example "sharecfg/bullet_template"
+        :return: binary file object
+        """
+        filePath = os.path.join(self.path, relativePath)
+        if os.path.exists(filePath):
+            return open(filePath, "rb")
+        for suffix, opener in compressionDict.items():
+            if os.path.exists(filePath + suffix):
+                return opener(filePath + suffix)
+        raise FileNotFoundError(filePath)
+
+    def listFiles(self, relativeFolder: str) -> List[str]:
+        """
+        Lists the file names in a folder of the dataset, compression extensions are stripped
+
+        :param relativeFolder: string, the folder relative to the dataset root, for example "gamecfg/buff"
+        :return: list of file names
+        """
+        result = set()
+        for fileName in os.listdir(os.path.join(self.path, relativeFolder)):
+            for suffix in compressionDict:
+                if fileName.endswith(suffix):
+                    fileName = fileName[:-len(suffix)]
+                    break
+            result.add(fileName)
+        return sorted(result)
+
+    def getManifest(self) -> List[Tuple[str, int, int]]:
+        """
+        Lists the size and modification time of every dataset file without reading any of them
+
+        :return: sorted list of tuples (path relative to the dataset root, size, modification time in nanoseconds)
+        """
+        result = []
+        for folder in ["sharecfg", "gamecfg"]:
+            for directory, _, fileNameList in os.walk(os.path.join(self.path, folder)):
+                for fileName in fileNameList:
+                    filePath = os.path.join(directory, fileName)
+                    result.append((os.path.relpath(filePath, self.path).replace(os.sep, "/"),)
+                                  + getFileStamp(filePath))
+        return sorted(result)
+
+    def releaseTables(self):
+        """
+        Drops what this source holds in memory for the sharecfg tables, ConfigParser calls it once they are loaded.
+        Tables can still be read afterwards, only slower
+        """
+        # files are read from disk on every call, nothing is held
+        pass
+
+    def close(self):
+        """
+        Releases the files held by this source, it cannot be read afterwards. Sources are also context managers that
+        close on exit
+        """
+        # files are opened per read, there is nothing to release
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+class StreamedArchiveSource:
+    """
+    StreamedArchiveSource reads a compressed tar archive of the whole dataset tree. The archive is decompressed in one
+    streaming pass without temporary files, the decompressed members are kept in memory until the sharecfg tables are
+    loaded, then only the gamecfg members are kept.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files = self.readMembers(lambda name: True)
+        self.fileNames = sorted(self.files)
+
+    def readMembers(self, isWanted: Callable[[str], bool]) -> Dict[str, bytes]:
+        """
+        Decompresses the archive in one streaming pass
+
+        :param isWanted: function that takes a path relative to the dataset root and returns whether it is kept
+        :return: a dict, keys are paths relative to the dataset root, values are the decompressed members
+        """
+        result = {}
+        with tarfile.open(self.path, "r|*") as archive:
+            for member in archive:
+                if member.isfile() and isWanted(getDatasetRelativePath(member.name)):
+                    result[getDatasetRelativePath(member.name)] = archive.extractfile(member).read()
+        return result
+
+    def openFile(self, relativePath: str) -> BinaryIO:
+        if relativePath not in self.files and relativePath in self.fileNames:
+            # a released member, rare enough (writeMappedDataset for example) to stream the archive again for it
+            return io.BytesIO(self.readMembers(lambda name: name == relativePath)[relativePath])
+        if relativePath not in self.files:
+            raise FileNotFoundError("{} in {}".format(relativePath, self.path))
+        return io.BytesIO(self.files[relativePath])
+
+    def listFiles(self, relativeFolder: str) -> List[str]:
+        prefix = relativeFolder.rstrip("/") + "/"
+        return [name[len(prefix):] for name in self.fileNames
+                if name.startswith(prefix) and "/" not in name[len(prefix):]]
+
+    def getManifest(self) -> List[Tuple[str, int, int]]:
+        return [(os.path.basename(self.path),) + getFileStamp(self.path)]
+
+    def releaseTables(self):
+        self.files = {name: data for name, data in self.files.items() if name.startswith("gamecfg/")}
+
+    def close(self):
+        self.files = {}
+        self.fileNames = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+class ArchiveSource:
+    """
+    ArchiveSource reads a zip or uncompressed tar archive of the whole dataset tree by random access. The member index
+    (name to offset) is built once when the archive is opened, then every file is read without scanning the archive.
+    Members may be compressed like the files of DirectorySource.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.zipFile = None
+        self.tarIndex: Dict[str, tuple] = {}
+        self.zipIndex: Dict[str, zipfile.ZipInfo] = {}
+        if zipfile.is_zipfile(path):
+            self.zipFile = zipfile.ZipFile(path)
+            self.zipIndex = {getDatasetRelativePath(info.filename): info for info in self.zipFile.infolist()
+                             if not info.is_dir()}
+        else:
+            with tarfile.open(path, "r:") as archive:
+                self.tarIndex = {getDatasetRelativePath(member.name): (member.offset_data, member.size)
+                                 for member in archive.getmembers() if member.isfile()}
+            self.tarFile = open(path, "rb")
+            self.tarLock = threading.Lock()
+
+    def readTarMember(self, offset: int, size: int) -> bytes:
+        if hasattr(os, "pread"):
+            return os.pread(self.tarFile.fileno(), size, offset)
+        with self.tarLock:
+            self.tarFile.seek(offset)
+            return self.tarFile.read(size)
+
+    def openMember(self, name: str) -> BinaryIO:
+        if self.zipFile is not None:
+            return self.zipFile.open(self.zipIndex[name])
+        return io.BytesIO(self.readTarMember(*self.tarIndex[name]))
+
+    def openFile(self, relativePath: str) -> BinaryIO:
+        index = self.zipIndex if self.zipFile is not None else self.tarIndex
+        if relativePath in index:
+            return self.openMember(relativePath)
+        for suffix, opener in compressionDict.items():
+            if relativePath + suffix in index:
+                return opener(self.openMember(relativePath + suffix))
+        raise FileNotFoundError("{} in {}".format(relativePath, self.path))
+
+    def listFiles(self, relativeFolder: str) -> List[str]:
+        prefix = relativeFolder.rstrip("/") + "/"
+        result = set()
+        for name in (self.zipIndex if self.zipFile is not None else self.tarIndex):
+            if name.startswith(prefix) and "/" not in name[len(prefix):]:
+                fileName = name[len(prefix):]
+                for suffix in compressionDict:
+                    if fileName.endswith(suffix):
+                        fileName = fileName[:-len(suffix)]
+                        break
+                result.add(fileName)
+        return sorted(result)
+
+    def getManifest(self) -> List[Tuple[str, int, int]]:
+        return [(os.path.basename(self.path),) + getFileStamp(self.path)]
+
+    def releaseTables(self):
+        # members are read from the archive on every call, nothing is held
+        pass
+
+    def close(self):
+        if self.zipFile is not None:
+            self.zipFile.close()
+        else:
+            self.tarFile.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+
+def openConfigSource(path: str):
+    """
+    Creates the source of a dataset path
+
+    :param path: string, a dataset folder, a zip or tar archive of it, or a compressed tar archive of it
+    :return: DirectorySource, ArchiveSource or StreamedArchiveSource object
+    """
+    if os.path.isfile(path):
+        if any(path.endswith(suffix) for suffix in streamedArchiveSuffixList):
+            return StreamedArchiveSource(path)
+        return ArchiveSource(path)
+    return DirectorySource(path)
@@ -0,0 +1,64 @@
+import threading
+from typing import Tuple
+from .ConfigParser import ConfigParser
+
+
+class DatasetHandle:
+    """
+    DatasetHandle publishes the current dataset to concurrent readers. A snapshot is a (version, ConfigParser) tuple
+    that is replaced by a single reference assignment, so readers never lock. A reader should take one snapshot per
+    request and use it until the request ends, then the request sees one consistent dataset even if it is replaced
+    in the meantime. Parsers must not be modified after they are published.
+    """
+
+    def __init__(self, parser: ConfigParser):
+        """
+        Constructor of DatasetHandle class
+
+        :param parser: the ConfigParser of the first snapshot
+        """
+        self.snapshot: Tuple[int, ConfigParser] = (0, parser)
+        self.swapLock = threading.Lock()
+
+    def getSnapshot(self) -> Tuple[int, ConfigParser]:
+        """
+        Gets the current snapshot
+
+        :return: tuple of the version (integer) and the ConfigParser
+        """
+        return self.snapshot
+
+    def getParser(self) -> ConfigParser:
+        """
+        Gets the ConfigParser of the current snapshot
+
+        :return: ConfigParser object
+        """
+        return self.snapshot[1]
+
+    def swap(self, parser: ConfigParser, closeOld: bool = False) -> ConfigParser:
+        """
+        Publishes a new fully loaded parser, requests that already took a snapshot keep using the old one
+
+        :param parser: the new ConfigParser
+        :param closeOld: whether the replaced parser is closed (see ConfigParser.close) right away. Only do that when no
+                         request still uses its snapshot, otherwise close the returned parser once they are done
+        :return: the replaced ConfigParser
+        """
+        with self.swapLock:
+            version, oldParser = self.snapshot
+            self.snapshot = (version + 1, parser)
+        if closeOld and oldParser is not parser:
+            oldParser.close()
+        return oldParser
+
+    def reload(self, path: str, closeOld: bool = False, **kwargs) -> ConfigParser:
+        """
+        Loads a dataset outside of any lock and publishes it, see swap
+
+        :param path: string, the dataset path, see ConfigParser
+        :param closeOld: whether the replaced parser is closed right away, see swap
+        :param kwargs: extra keyword arguments of ConfigParser
+        :return: the replaced ConfigParser
+        """
+        return self.swap(ConfigParser(path, **kwargs), closeOld)
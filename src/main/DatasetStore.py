@@ -0,0 +1,79 @@
+from typing import Dict, Any, Tuple
+from .ConfigParser import ConfigParser
+from .Utility import getContentHash
+
+
+class DatasetStore:
+    """
+    DatasetStore loads several datasets (for example CN, EN and JP) side by side and stores every identical record
+    only once, keyed by its content hash. Each dataset is read through a ConfigParser view over the shared records,
+    so shared records must be treated as read only.
+    """
+
+    def __init__(self, pathDict: Dict[str, str]):
+        """
+        Constructor of DatasetStore class
+
+        :param pathDict: a dict, keys are dataset names (for example "EN"), values are dataset paths, see ConfigParser
+        """
+        self.records: Dict[str, Any] = {}
+        self.referenceCount = 0
+        self.views: Dict[str, DatasetView] = {}
+        for name, path in pathDict.items():
+            self.addDataset(name, path)
+
+    def addDataset(self, name: str, path: str) -> ConfigParser:
+        """
+        Loads a dataset into this store
+
+        :param name: string, the name of that dataset
+        :param path: string, the path of that dataset, see ConfigParser
+        :return: the ConfigParser view of that dataset
+        """
+        self.views[name] = DatasetView(path, self)
+        return self.views[name]
+
+    def share(self, record: Any) -> Any:
+        """
+        Returns the stored record that equals record, stores record first if there is none
+
+        :param record: json-like data
+        :return: the shared instance
+        """
+        self.referenceCount += 1
+        return self.records.setdefault(getContentHash(record), record)
+
+    def getParser(self, name: str) -> ConfigParser:
+        """
+        Gets the ConfigParser view of a dataset
+
+        :param name: string, the name of that dataset
+        :return: ConfigParser object
+        """
+        return self.views[name]
+
+    def getRecordCount(self) -> Tuple[int, int]:
+        """
+        Gets how many records are referenced by all datasets and how many of them are actually stored
+
+        :return: tuple of integers, (referenced records, stored records)
+        """
+        return self.referenceCount, len(self.records)
+
+
+class DatasetView(ConfigParser):
+    """
+    DatasetView is a ConfigParser whose sharecfg records are shared with the other datasets of a DatasetStore
+    """
+
+    def __init__(self, path: str, store: DatasetStore):
+        self.store = store
+        super(DatasetView, self).__init__(path)
+
+    def getConstructorArgs(self) -> Tuple[tuple, Dict[str, Any]]:
+        raise ValueError("a DatasetView shares its records with its DatasetStore and cannot be rebuilt elsewhere, "
+                         "use a ConfigParser of the same path instead")
+
+    def loadConfig(self, configName: str) -> Dict:
+        config = super(DatasetView, self).loadConfig(configName)
+        return {key: self.store.share(record) for key, record in config.items()}
@@ -0,0 +1,108 @@
+import math
+from typing import List, Tuple, Optional, Sequence
+from .MetaShips import MetaShip
+
+# the (lbLevel, isRefitted) states a ship in a dock can be in
+shipStates = ((0, False), (1, False), (2, False), (3, False), (3, True))
+
+
+class MetaShipStatTable:
+    """
+    MetaShipStatTable stores everything MetaShip.getStat, getEquipProficiency and getEquipBaseCount need for every
+    limit break and retrofit state of a meta ship, so a dock row can be evaluated without touching the MetaShip
+    """
+
+    def __init__(self, metaShip: MetaShip):
+        """
+        Constructor of MetaShipStatTable class
+
+        :param metaShip: the MetaShip object this table is built from
+        """
+        self.id = metaShip.id
+
+        # (lbLevel, isRefitted, strengthenBonus) -> list of 12 tuples
+        # (attr, attrGrowth, attrGrowthExtra, strengthenStat, researchStat, refitStat)
+        self.statRows = {}
+        for lbLevel, isRefitted in shipStates:
+            if metaShip.hasRefit and isRefitted and metaShip.changeShipUponRefit:
+                ship = metaShip.refitShip
+            else:
+                ship = metaShip.ships[lbLevel]
+            for strengthenBonus in [False, True]:
+                row = []
+                for statId in range(1, 13):
+                    index = statId - 1
+                    refitStat = sum(map(lambda x: x[0].getStatBonusSum(statId), metaShip.refitNodeListWithCoord)) \
+                        if isRefitted else 0
+                    researchStat = metaShip.researchBonusTable.getStatBonus(
+                        statId, metaShip.getDevLevel(None, strengthenBonus)) if metaShip.isResearchShip else 0
+                    row.append((ship.attrs[index], ship.attrsGrowth[index], ship.attrsGrowthExtra[index],
+                                ship.strengthenValue.get(statId, 0) if strengthenBonus else 0, researchStat,
+                                refitStat))
+                self.statRows[(lbLevel, isRefitted, strengthenBonus)] = row
+
+        # (lbLevel, isRefitted) -> tuple of values of each slot
+        self.proficiencyRows = {state: tuple(metaShip.getEquipProficiency(equipSlot, *state)
+                                             for equipSlot in range(1, 5)) for state in shipStates}
+        self.equipBaseRows = {state: tuple(metaShip.getEquipBaseCount(equipSlot, *state)
+                                           for equipSlot in range(1, 4)) for state in shipStates}
+
+
+def evaluateDock(parser, metaIds: Sequence[int], levels: Sequence[int], lbLevels: Sequence[int],
+                 affBonuses: Sequence[int], refitted: Sequence[bool], strengthened: Optional[Sequence[bool]] = None) \
+        -> Tuple[List[List[int]], List[List[float]], List[List[int]]]:
+    """
+    Evaluates a whole dock in one call. Each index of the input sequences is a row, the results are identical to
+    calling MetaShip.getStat, getEquipProficiency and getEquipBaseCount on every row
+
+    :param parser: the ConfigParser that holds the game data
+    :param metaIds: sequence of integers, the meta id of each row
+    :param levels: sequence of integers, range from 1 to 120, the level of each row
+    :param lbLevels: sequence of integers, range from 0 to 3, the limit break level of each row
+    :param affBonuses: sequence of integers, range from 0 to 12, the affinity stat bonus of each row
+    :param refitted: sequence of booleans, whether each row is refitted
+    :param strengthened: sequence of booleans or None, whether each row is fully strengthened, None means no row is
+    :return: tuple of three matrices, stats (12 columns), equipment proficiencies (4 columns) and equipment base
+             counts (3 columns), one row per input row
+    """
+    rowCount = len(metaIds)
+    if strengthened is None:
+        strengthened = [False] * rowCount
+    if any(len(column) != rowCount for column in [levels, lbLevels, affBonuses, refitted, strengthened]):
+        raise ValueError("all columns should have the same length ({})".format(rowCount))
+
+    def getTable(metaId: int) -> MetaShipStatTable:
+        return parser.getCached(("metaShipStatTable", metaId), lambda: MetaShipStatTable(parser.getMetaShip(metaId)))
+
+    statMatrix = []
+    proficiencyMatrix = []
+    equipBaseMatrix = []
+    for rowIndex, (metaId, level, lbLevel, affBonus, isRefitted, strengthenBonus) in enumerate(
+            zip(metaIds, levels, lbLevels, affBonuses, refitted, strengthened)):
+        if level < 1 or level > 120:
+            raise ValueError("row {}: level ({}) out of bound".format(rowIndex, level))
+        elif lbLevel < 0 or lbLevel > 3:
+            raise ValueError("row {}: lbLevel ({}) out of bound".format(rowIndex, lbLevel))
+        elif affBonus < 0 or affBonus > 12:
+            raise ValueError("row {}: affBonus ({}) out of bound".format(rowIndex, affBonus))
+        elif lbLevel != 3 and isRefitted:
+            raise ValueError("row {}: Cannot modernize without fully limit break the ship".format(rowIndex))
+
+        table = getTable(metaId)
+        state = (lbLevel, bool(isRefitted))
+        affRatio = 1 + affBonus / 100
+        if level <= 100:
+            statMatrix.append([
+                math.floor((attr + (level - 1) * growth / 1000 + strengthenStat + researchStat) * affRatio + refitStat)
+                for attr, growth, _, strengthenStat, researchStat, refitStat in
+                table.statRows[state + (bool(strengthenBonus),)]])
+        else:
+            statMatrix.append([
+                math.floor((attr + (level - 1) * growth / 1000 + (level - 100) * growthExtra / 1000 + strengthenStat
+                            + researchStat) * affRatio + refitStat)
+                for attr, growth, growthExtra, strengthenStat, researchStat, refitStat in
+                table.statRows[state + (bool(strengthenBonus),)]])
+        # the tables are cached in the parser, every row gets its own list
+        proficiencyMatrix.append(list(table.proficiencyRows[state]))
+        equipBaseMatrix.append(list(table.equipBaseRows[state]))
+    return statMatrix, proficiencyMatrix, equipBaseMatrix
@@ -0,0 +1,130 @@
+from typing import Dict, List, Tuple, Set, Optional, Iterable
+from .ConfigParser import ConfigParser
+
+# (metaId, equipSlot, lbLevel, isRefitted), equipSlot ranges from 1 to 5 like MetaShip.getEquipType
+EquipSlotEntry = Tuple[int, int, int, bool]
+
+
+def iterBitIndexes(bitset: int) -> Iterable[int]:
+    """
+    Iterates the positions of the set bits of an integer, lowest first
+
+    :param bitset: non negative integer
+    :return: generator of integers
+    """
+    while bitset:
+        lowestBit = bitset & -bitset
+        yield lowestBit.bit_length() - 1
+        bitset ^= lowestBit
+
+
+class EquipTypeIndex:
+    """
+    EquipTypeIndex maps equipment types to the equipment slots that accept them. Every (meta ship, slot, limit break
+    level, refitted) combination is an entry with a bit position, each equipment type, slot, limit break level, refit
+    state and meta ship has a bitset of its entries, so roster wide questions are answered with integer & and |.
+    Refitted entries only exist at limit break level 3 for ships that have a retrofit. Meta ships that fail to build are
+    listed in failedMetaIds and have no entry.
+    """
+
+    def __init__(self, parser: ConfigParser):
+        """
+        Constructor of EquipTypeIndex class
+
+        :param parser: the ConfigParser
+        """
+        self.entryList: List[EquipSlotEntry] = []
+        self.entryTypeList: List[Tuple[int, ...]] = []
+        self.typeBitsets: Dict[int, int] = {}
+        self.slotBitsets: Dict[int, int] = {}
+        self.lbLevelBitsets: Dict[int, int] = {}
+        self.refitBitsets: Dict[bool, int] = {False: 0, True: 0}
+        self.metaBitsets: Dict[int, int] = {}
+        self.failedMetaIds: List[int] = []
+        for metaId in sorted(parser.getMetaIdList()):
+            # every slot is resolved before the first entry is added, so a failing meta ship leaves no entry behind
+            try:
+                metaShip = parser.getMetaShip(metaId)
+                stateList = [(lbLevel, False) for lbLevel in range(0, 4) if lbLevel in metaShip.ships]
+                if metaShip.hasRefit and 3 in metaShip.ships:
+                    stateList.append((3, True))
+                slotList = [((metaId, equipSlot, lbLevel, isRefitted),
+                             metaShip.getEquipType(equipSlot, lbLevel, isRefitted))
+                            for lbLevel, isRefitted in stateList for equipSlot in range(1, 6)]
+            except (KeyError, ValueError, IndexError, AttributeError):
+                self.failedMetaIds.append(metaId)
+                continue
+            for entry, equipTypeList in slotList:
+                self.addEntry(entry, equipTypeList)
+
+    def addEntry(self, entry: EquipSlotEntry, equipTypeList: List[int]):
+        """
+        Adds an entry at the next bit position and sets that bit in the bitsets of its equipment types, slot, limit
+        break level, refit state and meta ship
+
+        :param entry: tuple (metaId, equipSlot, lbLevel, isRefitted)
+        :param equipTypeList: list of integers, the equipment types accepted by that slot
+        """
+        bit = 1 << len(self.entryList)
+        self.entryList.append(entry)
+        self.entryTypeList.append(tuple(equipTypeList))
+        metaId, equipSlot, lbLevel, isRefitted = entry
+        for equipType in equipTypeList:
+            self.typeBitsets[equipType] = self.typeBitsets.get(equipType, 0) | bit
+        self.slotBitsets[equipSlot] = self.slotBitsets.get(equipSlot, 0) | bit
+        self.lbLevelBitsets[lbLevel] = self.lbLevelBitsets.get(lbLevel, 0) | bit
+        self.refitBitsets[isRefitted] |= bit
+        self.metaBitsets[metaId] = self.metaBitsets.get(metaId, 0) | bit
+
+    def query(self, equipType: Optional[int] = None, equipSlot: Optional[int] = None, lbLevel: Optional[int] = None,
+              isRefitted: Optional[bool] = None, metaId: Optional[int] = None) -> int:
+        """
+        Finds the entries that match every given condition
+
+        :param equipType: integer or None, the entry's slot must accept this equipment type
+        :param equipSlot: integer or None, range from 1 to 5
+        :param lbLevel: integer or None, range from 0 to 3
+        :param isRefitted: boolean or None
+        :param metaId: integer or None, the id of the meta ship
+        :return: integer, the bitset of matching entries, see getEntries
+        """
+        result = (1 << len(self.entryList)) - 1
+        for value, bitsets in [(equipType, self.typeBitsets), (equipSlot, self.slotBitsets),
+                               (lbLevel, self.lbLevelBitsets), (isRefitted, self.refitBitsets),
+                               (metaId, self.metaBitsets)]:
+            if value is not None:
+                result &= bitsets.get(value, 0)
+        return result
+
+    def getEntries(self, bitset: int) -> List[EquipSlotEntry]:
+        """
+        Lists the entries of a bitset
+
+        :param bitset: integer, a bitset returned by query or combined from them
+        :return: list of (metaId, equipSlot, lbLevel, isRefitted) tuples
+        """
+        return [self.entryList[index] for index in iterBitIndexes(bitset)]
+
+    def getMetaIds(self, bitset: int) -> Set[int]:
+        """
+        Gets the meta ships that have at least one entry in a bitset
+
+        :param bitset: integer, a bitset returned by query or combined from them
+        :return: set of meta ship ids
+        """
+        return {self.entryList[index][0] for index in iterBitIndexes(bitset)}
+
+    def getEquipTypes(self, metaId: int, equipSlot: int, lbLevel: int, isRefitted: bool) -> List[int]:
+        """
+        Gets the equipment types accepted by an entry, the same as MetaShip.getEquipType
+
+        :param metaId: integer, the id of the meta ship
+        :param equipSlot: integer, range from 1 to 5
+        :param lbLevel: integer, range from 0 to 3
+        :param isRefitted: boolean
+        :return: list of integers, the equipment types
+        """
+        bitset = self.query(equipSlot=equipSlot, lbLevel=lbLevel, isRefitted=isRefitted, metaId=metaId)
+        if not bitset:
+            raise KeyError((metaId, equipSlot, lbLevel, isRefitted))
+        return list(self.entryTypeList[bitset.bit_length() - 1])
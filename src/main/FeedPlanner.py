@@ -0,0 +1,102 @@
+from typing import Dict, List, Tuple, Optional, Iterable
+
+# the stats raised by enhancement: firepower, torpedo, aviation and reload, see Ship.strengthenExpNeeded
+feedStatIdList = [2, 3, 5, 6]
+
+
+class FeedPlan:
+    """
+    FeedPlan is the result of FeedPlanner.plan: the fodder ships to feed and the exp left to reach max enhancement
+    """
+
+    def __init__(self, dockIndexList: List[int], shipIdList: List[int], remainingExp: Dict[int, int],
+                 surplusExp: Dict[int, int]):
+        self.dockIndexList = dockIndexList  # positions of the chosen ships in the dock
+        self.shipIdList = shipIdList
+        self.remainingExp = remainingExp  # statId -> exp still needed, all 0 if the plan is complete
+        self.surplusExp = surplusExp  # statId -> exp fed beyond what is needed
+
+    def isComplete(self) -> bool:
+        return not any(self.remainingExp.values())
+
+
+class FeedPlanner:
+    """
+    FeedPlanner precomputes the enhancement exp vectors (attr_exp and level_exp of ship_data_strengthen) of every ship
+    and finds small sets of fodder ships that max the enhancement of a target ship. Minimum set cover is NP-hard, so
+    plan uses a greedy cover over the distinct exp vectors of the dock followed by a pass that drops redundant ships.
+    """
+
+    def __init__(self, shipDataDict: Dict[str, Dict], shipStrengthenDict: Dict[str, Dict],
+                 statIdList: Optional[List[int]] = None):
+        """
+        Constructor of FeedPlanner class
+
+        :param shipDataDict: the ship_data_template table
+        :param shipStrengthenDict: the ship_data_strengthen table
+        :param statIdList: list of stat ids (2 to 6) to plan for, None means feedStatIdList
+        """
+        self.statIdList = feedStatIdList if statIdList is None else statIdList
+        if any(statId < 2 or statId > 6 for statId in self.statIdList):
+            raise ValueError("statIdList ({}) out of bound".format(self.statIdList))
+        self.expProvidedDict: Dict[int, Tuple[int, ...]] = {}
+        self.expNeededDict: Dict[int, Tuple[int, ...]] = {}
+        for shipId, dataDict in shipDataDict.items():
+            strengthenDict = shipStrengthenDict.get(str(dataDict["strengthen_id"]))
+            if strengthenDict is None:
+                continue
+            self.expProvidedDict[int(shipId)] = tuple(strengthenDict["attr_exp"][statId - 2]
+                                                      for statId in self.statIdList)
+            self.expNeededDict[int(shipId)] = tuple(strengthenDict["level_exp"][statId - 2]
+                                                    for statId in self.statIdList)
+
+    def plan(self, targetId: int, dockShipIdList: Iterable[int],
+             currentExp: Optional[Dict[int, int]] = None) -> FeedPlan:
+        """
+        Chooses fodder ships from a dock to max the enhancement of a target ship
+
+        :param targetId: integer, the ship id of the target
+        :param dockShipIdList: ship ids of the fodder candidates, a ship id appears once per copy in the dock
+        :param currentExp: dict or None, keys are stat ids, values are the exp the target already has
+        :return: FeedPlan object
+        """
+        currentExp = currentExp or {}
+        demand = [max(needed - currentExp.get(statId, 0), 0)
+                  for statId, needed in zip(self.statIdList, self.expNeededDict[targetId])]
+
+        # copies of ships with the same exp vector are interchangeable, so the greedy search runs over distinct vectors
+        vectorDict: Dict[Tuple[int, ...], List[int]] = {}
+        dockShipIdList = list(dockShipIdList)
+        for dockIndex, shipId in enumerate(dockShipIdList):
+            vector = self.expProvidedDict[shipId]
+            if any(vector):
+                vectorDict.setdefault(vector, []).append(dockIndex)
+        for indexList in vectorDict.values():
+            indexList.reverse()  # copies are taken from the end, so the earliest dock positions are chosen first
+
+        remaining = list(demand)
+        chosenList: List[Tuple[Tuple[int, ...], int]] = []
+        while any(remaining) and vectorDict:
+            bestVector = max(vectorDict, key=lambda v: (
+                sum(min(need, exp) for need, exp in zip(remaining, v)),
+                -sum(max(exp - need, 0) for need, exp in zip(remaining, v)),
+                -vectorDict[v][-1]))
+            if sum(min(need, exp) for need, exp in zip(remaining, bestVector)) == 0:
+                break
+            chosenList.append((bestVector, vectorDict[bestVector].pop()))
+            if not vectorDict[bestVector]:
+                del vectorDict[bestVector]
+            remaining = [max(need - exp, 0) for need, exp in zip(remaining, bestVector)]
+
+        # drop ships whose exp is covered by the rest, the ones chosen last contribute least and are tried first
+        total = [sum(vector[index] for vector, _ in chosenList) for index in range(0, len(demand))]
+        for chosen in reversed(list(chosenList)):
+            vector = chosen[0]
+            if all(total[index] - vector[index] >= min(demand[index], total[index]) for index in range(0, len(demand))):
+                chosenList.remove(chosen)
+                total = [total[index] - vector[index] for index in range(0, len(demand))]
+
+        dockIndexList = sorted(dockIndex for _, dockIndex in chosenList)
+        return FeedPlan(dockIndexList, [dockShipIdList[dockIndex] for dockIndex in dockIndexList],
+                        {statId: max(need - fed, 0) for statId, need, fed in zip(self.statIdList, demand, total)},
+                        {statId: max(fed - need, 0) for statId, need, fed in zip(self.statIdList, demand, total)})
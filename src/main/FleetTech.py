@@ -0,0 +1,191 @@
+from typing import Dict, List, Tuple, Iterable, Optional
+
+# events of a meta ship that grant fleet tech, in the order of getFleetTechPoint stages
+fleetTechEvents = ("get", "upgrade", "level")
+
+
+class FleetTechTable:
+    """
+    FleetTechTable stores the fleet tech points and stat bonuses of every meta ship, built once from
+    fleet_tech_ship_template. Bonuses are stored as sparse vectors that map (hull type, stat id) to value.
+    """
+
+    def __init__(self, fleetTechDict: Dict[str, Dict], shipGroupDict: Dict[str, Dict]):
+        """
+        Constructor of FleetTechTable class
+
+        :param fleetTechDict: the fleet_tech_ship_template table, keys are group ids
+        :param shipGroupDict: the ship_data_group table, keys are meta ids
+        """
+        self.eventTable: Dict[int, Dict[str, Tuple[int, Dict[Tuple[int, int], int]]]] = {}
+        for metaId, groupDict in shipGroupDict.items():
+            techDict = fleetTechDict.get(str(groupDict["group_type"]))
+            if techDict is None:
+                continue
+
+            def genStatVector(prefix: str) -> Dict[Tuple[int, int], int]:
+                hullTypeList = techDict.get("add_{}_shiptype".format(prefix)) or [groupDict["type"]]
+                return {(hullType, techDict["add_{}_attr".format(prefix)]): techDict["add_{}_value".format(prefix)]
+                        for hullType in hullTypeList}
+
+            self.eventTable[int(metaId)] = {"get": (techDict["pt_get"], genStatVector("get")),
+                                            "upgrade": (techDict["pt_upgrage"], {}),
+                                            "level": (techDict["pt_level"], genStatVector("level"))}
+
+    def hasFleetTech(self, metaId: int) -> bool:
+        """
+        Checks whether a meta ship grants fleet tech
+
+        :param metaId: integer, the meta id
+        :return: boolean
+        """
+        return metaId in self.eventTable
+
+    def getEvent(self, metaId: int, event: str) -> Tuple[int, Dict[Tuple[int, int], int]]:
+        """
+        Gets the tech points and stat vector granted by an event of a meta ship
+
+        :param metaId: integer, the meta id
+        :param event: string, one of "get", "upgrade" and "level"
+        :return: tuple of tech points and stat vector, (0, {}) if the ship has no fleet tech
+        """
+        if event not in fleetTechEvents:
+            raise ValueError("unknown fleet tech event ({})".format(event))
+        return self.eventTable.get(metaId, {}).get(event, (0, {}))
+
+
+class FleetTechAggregator:
+    """
+    FleetTechAggregator keeps the account-wide fleet tech totals of a dock. Totals are updated incrementally by adding
+    and subtracting the precomputed vectors of FleetTechTable, the dock is never rescanned.
+    """
+
+    def __init__(self, table: FleetTechTable):
+        self.table = table
+        self.shipEvents: Dict[int, Tuple[bool, bool, bool]] = {}
+        self.techPoint = 0
+        self.statBonus: Dict[Tuple[int, int], int] = {}
+
+    def applyEvents(self, metaId: int, events: Tuple[bool, bool, bool], sign: int):
+        """
+        Adds (sign 1) or subtracts (sign -1) the vectors of some events of a meta ship to the totals
+
+        :param metaId: integer, the meta id
+        :param events: tuple of booleans, whether each event in fleetTechEvents is applied
+        :param sign: integer, 1 or -1
+        """
+        for event, applied in zip(fleetTechEvents, events):
+            if applied:
+                point, statVector = self.table.getEvent(metaId, event)
+                self.techPoint += sign * point
+                for key, value in statVector.items():
+                    self.statBonus[key] = self.statBonus.get(key, 0) + sign * value
+
+    def setShip(self, metaId: int, limitBroken: bool, maxLevel: bool):
+        """
+        Sets the state of a meta ship in the dock and updates the totals by the difference only
+
+        :param metaId: integer, the meta id
+        :param limitBroken: boolean, whether the ship is fully limit broken
+        :param maxLevel: boolean, whether the ship reached max level
+        """
+        oldEvents = self.shipEvents.get(metaId, (False, False, False))
+        newEvents = (True, limitBroken, maxLevel)
+        self.applyEvents(metaId, tuple(new and not old for old, new in zip(oldEvents, newEvents)), 1)
+        self.applyEvents(metaId, tuple(old and not new for old, new in zip(oldEvents, newEvents)), -1)
+        self.shipEvents[metaId] = newEvents
+
+    def addShip(self, metaId: int, limitBroken: bool = False, maxLevel: bool = False):
+        """
+        Adds a meta ship to the dock, adding an owned ship again keeps its reached stages
+
+        :param metaId: integer, the meta id
+        :param limitBroken: boolean, whether the ship is fully limit broken
+        :param maxLevel: boolean, whether the ship reached max level
+        """
+        oldEvents = self.shipEvents.get(metaId, (False, False, False))
+        self.setShip(metaId, limitBroken or oldEvents[1], maxLevel or oldEvents[2])
+
+    def addShips(self, dock: Iterable[Tuple[int, bool, bool]]):
+        """
+        Adds many meta ships to the dock
+
+        :param dock: iterable of tuples (metaId, limitBroken, maxLevel)
+        """
+        for metaId, limitBroken, maxLevel in dock:
+            self.addShip(metaId, limitBroken, maxLevel)
+
+    def limitBreakShip(self, metaId: int):
+        """
+        Marks an owned meta ship as fully limit broken
+
+        :param metaId: integer, the meta id
+        """
+        self.setShip(metaId, True, self.getShipState(metaId)[2])
+
+    def levelShip(self, metaId: int):
+        """
+        Marks an owned meta ship as max level
+
+        :param metaId: integer, the meta id
+        """
+        self.setShip(metaId, self.getShipState(metaId)[1], True)
+
+    def removeShip(self, metaId: int):
+        """
+        Removes a meta ship from the dock
+
+        :param metaId: integer, the meta id
+        """
+        self.applyEvents(metaId, self.getShipState(metaId), -1)
+        del self.shipEvents[metaId]
+
+    def getShipState(self, metaId: int) -> Tuple[bool, bool, bool]:
+        """
+        Gets the reached stages of an owned meta ship
+
+        :param metaId: integer, the meta id
+        :return: tuple of booleans (acquired, limitBroken, maxLevel)
+        """
+        if metaId not in self.shipEvents:
+            raise KeyError("MetaShip ({}) is not in the dock".format(metaId))
+        return self.shipEvents[metaId]
+
+    def getTechPoint(self) -> int:
+        """
+        Gets the total fleet tech points of the dock
+
+        :return: integer, the tech points
+        """
+        return self.techPoint
+
+    def getStatBonus(self, hullType: int, statId: int) -> int:
+        """
+        Gets the total fleet stat bonus of a certain stat applied to a certain hull type
+
+        :param hullType: integer, the hull type
+        :param statId: integer, the stat id
+        :return: integer, the bonus value
+        """
+        return self.statBonus.get((hullType, statId), 0)
+
+    def getStatBonusDict(self, hullType: Optional[int] = None) -> Dict[int, Dict[int, int]]:
+        """
+        Gets all nonzero fleet stat bonuses grouped by hull type
+
+        :param hullType: integer or None, only returns this hull type if given
+        :return: a dict, keys are hull types, values are dicts from stat id to bonus value
+        """
+        result = {}
+        for (bonusHullType, statId), value in sorted(self.statBonus.items()):
+            if value != 0 and (hullType is None or hullType == bonusHullType):
+                result.setdefault(bonusHullType, {})[statId] = value
+        return result
+
+    def getMetaIdList(self) -> List[int]:
+        """
+        Gets the meta ids of all ships in the dock
+
+        :return: list of integers
+        """
+        return list(self.shipEvents)
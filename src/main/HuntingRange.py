@@ -0,0 +1,192 @@
+from typing import Dict, List, Tuple, Optional, Iterable
+
+# hunting ranges are 7 x 7 grids around the submarine, raw coordinates go from 4 to 10 and the submarine is at (7, 7)
+gridSize = 7
+coordOffset = 4
+centreBit = 1 << (3 * gridSize + 3)
+
+
+def getCellBit(x: int, y: int) -> int:
+    """
+    Gets the bit of a cell in a hunting range mask
+
+    :param x: integer, raw x coordinate of hunting_range, 4 to 10
+    :param y: integer, raw y coordinate of hunting_range, 4 to 10
+    :return: integer with only the bit of that cell set
+    """
+    return 1 << ((x - coordOffset) * gridSize + y - coordOffset)
+
+
+def getArea(mask: int) -> int:
+    """
+    Counts the cells of a hunting range mask
+
+    :param mask: integer, a hunting range mask
+    :return: integer, the number of cells
+    """
+    return bin(mask).count("1")
+
+
+def getMaskCells(mask: int) -> List[Tuple[int, int]]:
+    """
+    Lists the cells of a hunting range mask
+
+    :param mask: integer, a hunting range mask
+    :return: list of (x, y) raw coordinates, sorted
+    """
+    return [(index // gridSize + coordOffset, index % gridSize + coordOffset) for index in range(0, gridSize ** 2)
+            if mask >> index & 1]
+
+
+class HuntingRangeGrid:
+    """
+    HuntingRangeGrid stores the hunting range of a submarine as one 49 bit mask per hunting level: levelMasks[i] has the
+    cells listed at hunting level i + 1 in hunting_range and reachMasks[i] has every cell reachable at hunting level
+    i + 1. The submarine's own cell is never part of a mask.
+    """
+
+    def __init__(self, huntingRange: List[List[List[int]]], huntingRangeLevel: int):
+        """
+        Constructor of HuntingRangeGrid class
+
+        :param huntingRange: the hunting_range field of ship_data_statistics, a list of coordinate lists per level
+        :param huntingRangeLevel: integer, the huntingrange_level field of ship_data_statistics
+        """
+        self.huntingRangeLevel = huntingRangeLevel
+        self.levelMasks = []
+        for coordList in huntingRange:
+            mask = 0
+            for coord in coordList:
+                mask |= getCellBit(coord[0], coord[1])
+            self.levelMasks.append(mask & ~centreBit)
+        self.reachMasks = []
+        reachMask = 0
+        for mask in self.levelMasks:
+            reachMask |= mask
+            self.reachMasks.append(reachMask)
+        self.levelGrid: Optional[Tuple[Tuple[str, ...], ...]] = None  # rendered once by getLevelGrid
+
+    def getMaxLevel(self) -> int:
+        return len(self.levelMasks)
+
+    def getMask(self, huntingLevel: Optional[int] = None) -> int:
+        """
+        Gets the cells reachable at a hunting level
+
+        :param huntingLevel: integer or None, the hunting level, None means the ship's own hunting range level
+        :return: integer, the hunting range mask
+        """
+        if huntingLevel is None:
+            huntingLevel = self.huntingRangeLevel
+        if huntingLevel < 1 or not self.reachMasks:
+            return 0
+        return self.reachMasks[min(huntingLevel, len(self.reachMasks)) - 1]
+
+    def getArea(self, huntingLevel: Optional[int] = None) -> int:
+        """
+        Counts the cells reachable at a hunting level
+
+        :param huntingLevel: integer or None, the hunting level, None means the ship's own hunting range level
+        :return: integer, the number of cells
+        """
+        return getArea(self.getMask(huntingLevel))
+
+    def getLevelGrid(self) -> List[List[str]]:
+        """
+        Generates the hunting range in the form of Submarine.getHuntingRange. The grid is rendered on the first call and
+        kept, grids of a parser are shared per ship through its HuntingRangeTable, so later calls only copy the rows
+
+        :return: list of list of string, l[x-4][y-4] is the hunting level needed to reach this coordinate,
+                 " " means this coordinate is not in range and "x" is the submarine
+        """
+        if self.levelGrid is None:
+            levelList = [[" " for i in range(0, gridSize)] for j in range(0, gridSize)]
+            for level, mask in enumerate(self.levelMasks, 1):
+                for x, y in getMaskCells(mask):
+                    levelList[x - coordOffset][y - coordOffset] = str(level)
+            levelList[3][3] = "x"
+            self.levelGrid = tuple(tuple(row) for row in levelList)
+        # callers get their own lists, the kept grid is never modified
+        return [list(row) for row in self.levelGrid]
+
+
+class HuntingRangeTable:
+    """
+    HuntingRangeTable holds the HuntingRangeGrid of every submarine of ship_data_statistics and answers fleet coverage
+    queries from their masks.
+    """
+
+    def __init__(self, shipStatisticDict: Dict[str, Dict]):
+        """
+        Constructor of HuntingRangeTable class
+
+        :param shipStatisticDict: the ship_data_statistics table
+        """
+        self.gridDict: Dict[int, HuntingRangeGrid] = {
+            int(ID): HuntingRangeGrid(statDict["hunting_range"], statDict["huntingrange_level"])
+            for ID, statDict in shipStatisticDict.items() if statDict["oxy_max"] != 0}
+
+    def getGrid(self, shipId: int) -> HuntingRangeGrid:
+        return self.gridDict[shipId]
+
+    def getMaskList(self, shipIdList: Iterable[int], huntingLevel: Optional[int] = None) -> List[int]:
+        return [self.gridDict[shipId].getMask(huntingLevel) for shipId in shipIdList]
+
+    def getUnion(self, shipIdList: Iterable[int], huntingLevel: Optional[int] = None) -> int:
+        """
+        Gets the cells reachable by at least one submarine of a fleet
+
+        :param shipIdList: ids of the submarines
+        :param huntingLevel: integer or None, the hunting level of every submarine, None means their own levels
+        :return: integer, the hunting range mask
+        """
+        result = 0
+        for mask in self.getMaskList(shipIdList, huntingLevel):
+            result |= mask
+        return result
+
+    def getIntersection(self, shipIdList: Iterable[int], huntingLevel: Optional[int] = None) -> int:
+        """
+        Gets the cells reachable by every submarine of a fleet
+
+        :param shipIdList: ids of the submarines
+        :param huntingLevel: integer or None, the hunting level of every submarine, None means their own levels
+        :return: integer, the hunting range mask, 0 for an empty fleet
+        """
+        maskList = self.getMaskList(shipIdList, huntingLevel)
+        if not maskList:
+            return 0
+        result = maskList[0]
+        for mask in maskList[1:]:
+            result &= mask
+        return result
+
+    def getCoverageCounts(self, shipIdList: Iterable[int], huntingLevel: Optional[int] = None) -> List[List[int]]:
+        """
+        Counts how many submarines of a fleet reach each cell
+
+        :param shipIdList: ids of the submarines
+        :param huntingLevel: integer or None, the hunting level of every submarine, None means their own levels
+        :return: list of list of integers, l[x-4][y-4] is the number of submarines reaching that coordinate
+        """
+        counts = [[0 for i in range(0, gridSize)] for j in range(0, gridSize)]
+        for mask in self.getMaskList(shipIdList, huntingLevel):
+            for x, y in getMaskCells(mask):
+                counts[x - coordOffset][y - coordOffset] += 1
+        return counts
+
+    def rankByArea(self, shipIdList: Optional[Iterable[int]] = None) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Ranks submarines by the number of cells they reach at every hunting level
+
+        :param shipIdList: ids of the submarines to rank, None means every submarine
+        :return: a dict, keys are hunting levels from 1 to the highest level of any submarine, values are lists of
+                 (shipId, area) sorted by area descending then ship id
+        """
+        shipIdList = sorted(self.gridDict) if shipIdList is None else list(shipIdList)
+        maxLevel = max((self.gridDict[shipId].getMaxLevel() for shipId in shipIdList), default=0)
+        areaDict = {shipId: [getArea(self.gridDict[shipId].getMask(level)) for level in range(1, maxLevel + 1)]
+                    for shipId in shipIdList}
+        return {level: sorted(((shipId, areaList[level - 1]) for shipId, areaList in areaDict.items()),
+                              key=lambda pair: (-pair[1], pair[0]))
+                for level in range(1, maxLevel + 1)}
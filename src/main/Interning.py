@@ -0,0 +1,79 @@
+import sys
+from typing import Dict, Any, Tuple
+from .Utility import getDeepSize
+
+
+class InternPool:
+    """
+    InternPool canonicalises repeated values of decoded tables. Strings and numbers are always shared. Records (dicts)
+    stay separate mutable objects, only their keys and values are canonicalised. Lists are kept as separate lists by
+    default, so interned tables can be used exactly like tables loaded without interning. With shareSequences, lists
+    whose elements are not records are replaced by canonical tuples shared by every record that repeats them (for
+    example equipment type lists, damage_type and hunting_range coordinates), such tables must be read only.
+    """
+
+    def __init__(self, shareSequences: bool = False):
+        """
+        Constructor of InternPool class
+
+        :param shareSequences: whether repeated lists are replaced by shared tuples
+        """
+        self.shareSequences = shareSequences
+        self.values: Dict[Tuple, Any] = {}
+        self.hitCount = 0
+        self.savedBytes = 0
+
+    def intern(self, value: Any) -> Any:
+        """
+        Gets the canonical instance of a json-like value
+
+        :param value: json-like data
+        :return: the canonical instance of a string, number or (with shareSequences) list of those, a new list or dict
+                 of canonical elements otherwise
+        """
+        if isinstance(value, dict):
+            return {self.intern(key): self.intern(item) for key, item in value.items()}
+        elif isinstance(value, list):
+            itemList = [self.intern(item) for item in value]
+            if not self.shareSequences or any(isinstance(item, (dict, list)) for item in itemList):
+                return itemList
+            canonical = tuple(itemList)
+            # the elements are canonical already, so their ids tell equal sequences apart exactly (1, 1.0 and True
+            # compare equal but are not the same value)
+            key = (tuple,) + tuple(id(item) for item in itemList)
+        elif isinstance(value, str):
+            canonical = sys.intern(value)
+            key = (str, canonical)
+        elif value is None:
+            return None
+        else:
+            canonical = value
+            key = (type(value), value)
+
+        if key in self.values:
+            self.hitCount += 1
+            return self.values[key]
+        self.values[key] = canonical
+        return canonical
+
+    def internTable(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Canonicalises all records of a table and counts the memory saved, that is the deep size of the table loaded
+        without interning minus the deep size of the interned table, both measured on their own
+
+        :param config: dict, a decoded table
+        :return: dict, the table with canonical values
+        """
+        sizeBefore = getDeepSize(config)
+        result = {self.intern(key): self.intern(record) for key, record in config.items()}
+        self.savedBytes += sizeBefore - getDeepSize(result)
+        return result
+
+    def getReport(self) -> Dict[str, int]:
+        """
+        Reports the effect of this pool
+
+        :return: a dict, "savedBytes" is the memory saved, "hitCount" is how many values were replaced by an existing
+                 instance and "valueCount" is the number of canonical values
+        """
+        return {"savedBytes": self.savedBytes, "hitCount": self.hitCount, "valueCount": len(self.values)}
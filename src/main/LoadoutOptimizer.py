@@ -0,0 +1,175 @@
+from typing import Dict, List, Tuple, Optional, Iterable, NamedTuple
+from .ConfigParser import ConfigParser
+from .Parallel import mapWithParser
+
+# the equipment slots with base counts, see MetaShip.getEquipBaseCount
+weaponSlotList = [1, 2, 3]
+
+
+class WeaponEvaluation(NamedTuple):
+    weaponId: int
+    damageSum: float  # Weapon.getDamageSumByArmorType
+    modifierStat: int  # statId of MetaShip.getStat
+    modifierStatRatio: float
+
+
+class LoadoutSettings(NamedTuple):
+    armorType: int  # 0 for light, 1 for medium and 2 for heavy, see Bullet.getArmorModifier
+    level: int = 120
+    lbLevel: int = 3
+    affBonus: int = 0
+    isRefitted: bool = True  # ignored for ships without retrofit and below limit break level 3
+    strengthenBonus: bool = True
+
+
+def pruneDominated(evaluationList: List[WeaponEvaluation]) -> List[WeaponEvaluation]:
+    """
+    Removes the weapons that can never be the best in a slot: a weapon is dominated when another weapon with the same
+    modifier stat has at least its damage and modifier stat ratio. Of identical weapons only the lowest id is kept
+
+    :param evaluationList: list of WeaponEvaluation
+    :return: list of WeaponEvaluation, sorted by damage descending then weapon id
+    """
+    result = []
+    bestRatioDict: Dict[int, float] = {}  # modifier stat -> highest ratio among kept weapons
+    for evaluation in sorted(evaluationList, key=lambda e: (-e.damageSum, -e.modifierStatRatio, e.weaponId)):
+        # every kept weapon has at least this damage, so only a higher ratio keeps this one
+        if evaluation.modifierStatRatio > bestRatioDict.get(evaluation.modifierStat, -1):
+            bestRatioDict[evaluation.modifierStat] = evaluation.modifierStatRatio
+            result.append(evaluation)
+    return result
+
+
+class LoadoutOptimizer:
+    """
+    LoadoutOptimizer finds the weapon with the highest damage in every weapon slot of a meta ship against one armor
+    type. The score of a weapon in a slot is
+    damageSum * proficiency * baseCount * (1 + ship's modifier stat * modifierStatRatio / 100).
+    The game config tables loaded by ConfigParser do not say which weapons are equipments of which type, so the
+    candidate weapons of every equipment type are given by the caller. Weapon evaluations and pruned candidate lists
+    are cached in the parser and shared by every ship.
+    """
+
+    def __init__(self, parser: ConfigParser, candidateDict: Dict[int, List[int]], settings: LoadoutSettings):
+        """
+        Constructor of LoadoutOptimizer class
+
+        :param parser: the ConfigParser
+        :param candidateDict: dict, keys are equipment types, values are lists of weapon ids of that type
+        :param settings: LoadoutSettings, the armor type and the state of the ships
+        """
+        if settings.armorType < 0 or settings.armorType > 2:
+            raise ValueError("armorType ({}) out of bound".format(settings.armorType))
+        self.parser = parser
+        self.candidateDict = candidateDict
+        self.settings = settings
+        self.evaluationCache: Dict[Tuple[int, int], WeaponEvaluation] = parser.getCached(
+            "loadoutWeaponEvaluations", dict)
+        self.candidateCache: Dict[Tuple[int, ...], List[WeaponEvaluation]] = {}
+
+    def evaluateWeapon(self, weaponId: int) -> WeaponEvaluation:
+        """
+        Evaluates a weapon against the armor type, the result is cached
+
+        :param weaponId: integer, the id of that weapon
+        :return: WeaponEvaluation
+        """
+        key = (weaponId, self.settings.armorType)
+        if key not in self.evaluationCache:
+            weapon = self.parser.getWeapon(weaponId)
+            self.evaluationCache[key] = WeaponEvaluation(
+                weaponId, weapon.getDamageSumByArmorType(self.settings.armorType), weapon.getModifierStat(),
+                weapon.getModifierStatRatio())
+        return self.evaluationCache[key]
+
+    def getCandidates(self, equipTypeList: Iterable[int]) -> List[WeaponEvaluation]:
+        """
+        Gets the weapons of the given equipment types that are not dominated, the result is cached
+
+        :param equipTypeList: the equipment types allowed in a slot
+        :return: list of WeaponEvaluation
+        """
+        key = tuple(sorted(set(equipTypeList)))
+        if key not in self.candidateCache:
+            weaponIdSet = {weaponId for equipType in key for weaponId in self.candidateDict.get(equipType, [])}
+            self.candidateCache[key] = pruneDominated([self.evaluateWeapon(weaponId) for weaponId in weaponIdSet])
+        return self.candidateCache[key]
+
+    def optimizeShip(self, metaShip) -> Dict[int, Optional[Tuple[int, float]]]:
+        """
+        Finds the best weapon of every weapon slot of a meta ship
+
+        :param metaShip: MetaShip object
+        :return: a dict, keys are slot numbers (1 to 3), values are (weaponId, score) or None if no candidate weapon
+                 fits that slot
+        """
+        settings = self.settings
+        # retrofit only applies at limit break level 3, see MetaShip.getEquipType
+        isRefitted = settings.isRefitted and metaShip.hasRefit and settings.lbLevel == 3
+        statCache: Dict[int, int] = {}
+        result = {}
+        for equipSlot in weaponSlotList:
+            factor = metaShip.getEquipProficiency(equipSlot, settings.lbLevel, isRefitted) * \
+                metaShip.getEquipBaseCount(equipSlot, settings.lbLevel, isRefitted)
+            best = None
+            for evaluation in self.getCandidates(metaShip.getEquipType(equipSlot, settings.lbLevel, isRefitted)):
+                if evaluation.modifierStat not in statCache:
+                    statCache[evaluation.modifierStat] = metaShip.getStat(
+                        evaluation.modifierStat, settings.level, settings.lbLevel, settings.affBonus, isRefitted,
+                        settings.strengthenBonus)
+                score = evaluation.damageSum * factor * \
+                    (1 + statCache[evaluation.modifierStat] * evaluation.modifierStatRatio / 100)
+                if best is None or score > best[1]:
+                    best = (evaluation.weaponId, score)
+            result[equipSlot] = best
+        return result
+
+
+def optimizeShipTask(parser: ConfigParser, sharedData: Tuple[Dict[int, List[int]], LoadoutSettings], metaId: int) \
+        -> Tuple[int, Optional[Dict[int, Optional[Tuple[int, float]]]], Optional[str]]:
+    """
+    Task function of optimizeRoster, runs in worker processes
+
+    :param parser: the ConfigParser of this process
+    :param sharedData: tuple of (candidateDict, settings), sent once per worker
+    :param metaId: integer, the id of the meta ship
+    :return: tuple of metaId, the result of LoadoutOptimizer.optimizeShip and the error message, the result is None
+             if the ship failed and the error message is None otherwise
+    """
+    candidateDict, settings = sharedData
+    optimizer = getattr(parser.threadState, "loadoutOptimizer", None)
+    # sharedData is the same object for every task of a worker, so the optimizer and its caches are reused
+    if optimizer is None or optimizer.candidateDict is not candidateDict or optimizer.settings is not settings:
+        optimizer = LoadoutOptimizer(parser, candidateDict, settings)
+        parser.threadState.loadoutOptimizer = optimizer
+    try:
+        return metaId, optimizer.optimizeShip(parser.getMetaShip(metaId)), None
+    except (KeyError, ValueError, IndexError) as error:
+        return metaId, None, "{}: {}".format(type(error).__name__, error)
+
+
+def optimizeRoster(parser: ConfigParser, candidateDict: Dict[int, List[int]], settings: LoadoutSettings,
+                   metaIdList: Optional[Iterable[int]] = None, jobs: int = 1,
+                   errorDict: Optional[Dict[int, str]] = None) -> Dict[int, Dict[int, Optional[Tuple[int, float]]]]:
+    """
+    Builds the best in slot table of many meta ships, in a process pool if jobs is larger than 1
+
+    :param parser: the ConfigParser
+    :param candidateDict: dict, keys are equipment types, values are lists of weapon ids of that type
+    :param settings: LoadoutSettings, the armor type and the state of the ships
+    :param metaIdList: ids of the meta ships, None means every meta ship
+    :param jobs: integer, the number of worker processes, see Parallel.mapWithParser
+    :param errorDict: dict or None, filled with the error messages of ships that failed, keys are meta ids
+    :return: a dict, keys are meta ids, values are the results of LoadoutOptimizer.optimizeShip. Ships that failed
+             are left out, see errorDict
+    """
+    if metaIdList is None:
+        metaIdList = sorted(parser.getMetaIdList())
+    result = {}
+    for metaId, shipResult, error in mapWithParser(parser, optimizeShipTask, metaIdList, jobs,
+                                                   sharedData=(candidateDict, settings)):
+        if error is None:
+            result[metaId] = shipResult
+        elif errorDict is not None:
+            errorDict[metaId] = error
+    return result
@@ -0,0 +1,228 @@
+import io
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, Iterator, Any, Tuple, List, Optional, Iterable, Union
+from .ConfigParser import ConfigParser, configNameList
+from .ConfigSource import getFileStamp
+from .Utility import getContentHash
+
+# file layout: magic, header length (u64), json header, then for every table its index entries followed by the keys
+# and the json encoded records the entries point to. Offsets are absolute, entries are sorted by key bytes.
+magic = b"ALMAP001"
+headerLengthStruct = struct.Struct("<Q")
+indexEntryStruct = struct.Struct("<QIQI")  # key offset, key length, record offset, record length
+
+
+def writeMappedDataset(parser: ConfigParser, outputPath: str):
+    """
+    Writes the sharecfg tables of a dataset into one read-only file that MappedDataset can memory-map
+
+    :param parser: the ConfigParser of that dataset
+    :param outputPath: string, the path of the output file
+    """
+    # table name -> (record count, index entries relative to the data blob, data blob)
+    tableBlobDict: Dict[str, Tuple[int, List[Tuple[int, int, int, int]], bytes]] = {}
+    # table name -> content hash, stored so MappedConfigParser.getDatasetHash does not have to decode every record
+    hashDict: Dict[str, str] = {}
+    for configName in configNameList:
+        config = parser.loadConfig(configName)
+        keyList = sorted(key.encode("utf-8") for key in config)
+        dataBuffer = io.BytesIO()
+        entryList = []
+        for key in keyList:
+            record = json.dumps(config[key.decode("utf-8")], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            entryList.append((dataBuffer.tell(), len(key), dataBuffer.tell() + len(key), len(record)))
+            dataBuffer.write(key)
+            dataBuffer.write(record)
+        tableBlobDict[configName] = (len(keyList), entryList, dataBuffer.getvalue())
+        hashDict[configName] = getContentHash(dict(config))
+
+    # the header holds the absolute offsets of each table, so its length has to be known before they are computed
+    def genHeader(offsetDict: Dict[str, int]) -> bytes:
+        return json.dumps({"tables": {configName: {"indexOffset": offsetDict.get(configName, 0), "count": count,
+                                                   "contentHash": hashDict[configName]}
+                                      for configName, (count, _, _) in tableBlobDict.items()}}).encode("utf-8")
+
+    offsetDict = {configName: 2 ** 63 - 1 for configName in tableBlobDict}
+    headerLength = len(genHeader(offsetDict))
+    offset = len(magic) + headerLengthStruct.size + headerLength
+    for configName, (count, _, data) in tableBlobDict.items():
+        offsetDict[configName] = offset
+        offset += count * indexEntryStruct.size + len(data)
+    header = genHeader(offsetDict).ljust(headerLength)
+
+    with open(outputPath, "wb") as outputFile:
+        outputFile.write(magic)
+        outputFile.write(headerLengthStruct.pack(len(header)))
+        outputFile.write(header)
+        for configName, (count, entryList, data) in tableBlobDict.items():
+            dataOffset = offsetDict[configName] + count * indexEntryStruct.size
+            for keyOffset, keyLength, recordOffset, recordLength in entryList:
+                outputFile.write(indexEntryStruct.pack(dataOffset + keyOffset, keyLength,
+                                                       dataOffset + recordOffset, recordLength))
+            outputFile.write(data)
+
+
+class MappedTable(Mapping):
+    """
+    MappedTable is a read-only dict-like view of one table of a MappedDataset. Records are decoded from the mapped
+    buffer only when accessed, so the raw data stays in pages shared by every process that maps the same file.
+    """
+
+    def __init__(self, buffer: mmap.mmap, configName: str, indexOffset: int, count: int, cacheSize: int,
+                 contentHash: Optional[str] = None):
+        """
+        Constructor of MappedTable class
+
+        :param buffer: the mapped file
+        :param configName: string, the table name
+        :param indexOffset: integer, the offset of the first index entry
+        :param count: integer, the number of records
+        :param cacheSize: integer, the number of decoded records kept per table, 0 means always decode
+        :param contentHash: string or None, the content hash of the table recorded by writeMappedDataset
+        """
+        self.buffer = buffer
+        self.configName = configName
+        self.indexOffset = indexOffset
+        self.count = count
+        self.contentHash = contentHash
+        self.getRecord = lru_cache(maxsize=cacheSize)(self.decodeRecord) if cacheSize > 0 else self.decodeRecord
+
+    def getEntry(self, position: int) -> Tuple[int, int, int, int]:
+        offset = self.indexOffset + position * indexEntryStruct.size
+        return indexEntryStruct.unpack(self.buffer[offset:offset + indexEntryStruct.size])
+
+    def getKeyBytes(self, position: int) -> bytes:
+        keyOffset, keyLength, _, _ = self.getEntry(position)
+        return self.buffer[keyOffset:keyOffset + keyLength]
+
+    def findPosition(self, key: str) -> int:
+        """
+        Binary searches the index for a key
+
+        :param key: string, the record id
+        :return: integer, the position of the entry, -1 if there is none
+        """
+        keyBytes = key.encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.getKeyBytes(middle) < keyBytes:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self.getKeyBytes(low) == keyBytes:
+            return low
+        return -1
+
+    def decodeRecord(self, key: str) -> Any:
+        position = self.findPosition(key)
+        if position < 0:
+            raise KeyError(key)
+        _, _, recordOffset, recordLength = self.getEntry(position)
+        return json.loads(self.buffer[recordOffset:recordOffset + recordLength].decode("utf-8"))
+
+    def __getitem__(self, key: str) -> Any:
+        if not isinstance(key, str):
+            raise KeyError(key)
+        return self.getRecord(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return isinstance(key, str) and self.findPosition(key) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(0, self.count):
+            yield self.getKeyBytes(position).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self.count
+
+
+class MappedDataset:
+    """
+    MappedDataset memory-maps a file written by writeMappedDataset and exposes its tables as MappedTable objects
+    """
+
+    def __init__(self, mappedPath: str, cacheSize: int = 256):
+        """
+        Constructor of MappedDataset class
+
+        :param mappedPath: string, the path of the mapped file
+        :param cacheSize: integer, the number of decoded records kept per table, see MappedTable
+        """
+        with open(mappedPath, "rb") as mappedFile:
+            self.buffer = mmap.mmap(mappedFile.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.buffer[:len(magic)] != magic:
+            raise ValueError("{} is not a mapped dataset file".format(mappedPath))
+        headerLength, = headerLengthStruct.unpack(self.buffer[len(magic):len(magic) + headerLengthStruct.size])
+        headerOffset = len(magic) + headerLengthStruct.size
+        header = json.loads(self.buffer[headerOffset:headerOffset + headerLength].decode("utf-8"))
+        self.tables = {configName: MappedTable(self.buffer, configName, tableHeader["indexOffset"],
+                                               tableHeader["count"], cacheSize, tableHeader.get("contentHash"))
+                       for configName, tableHeader in header["tables"].items()}
+
+    def getTable(self, configName: str) -> MappedTable:
+        """
+        Gets a table of this dataset
+
+        :param configName: string, the table name, for example "ship_data_statistics"
+        :return: MappedTable object
+        """
+        return self.tables[configName]
+
+    def close(self):
+        self.buffer.close()
+
+
+class MappedConfigParser(ConfigParser):
+    """
+    MappedConfigParser is a ConfigParser that reads its sharecfg tables through a MappedDataset. Create it before
+    forking workers (or in every worker, the mapped pages are shared either way). gamecfg files are still read from
+    path.
+    """
+
+    def __init__(self, path: str, mappedPath: str, cacheSize: int = 256, internValues: bool = False,
+                 projection: Union[str, Dict[str, Iterable[str]], None] = None, shareSequences: bool = False):
+        """
+        Constructor of MappedConfigParser class
+
+        :param path: string, the dataset path, see ConfigParser
+        :param mappedPath: string, the path of the file written by writeMappedDataset
+        :param cacheSize: integer, the number of decoded records kept per table, see MappedTable
+        :param internValues: not supported, records are decoded from the mapped file on access, so their values
+                             cannot be interned
+        :param projection: not supported, mapped records are decoded as they were written by writeMappedDataset
+        :param shareSequences: not supported, see internValues
+        """
+        if internValues or shareSequences:
+            raise ValueError("MappedConfigParser does not intern values, records are decoded on access")
+        if projection is not None:
+            raise ValueError("MappedConfigParser does not project records, they are decoded as written")
+        self.mappedPath = mappedPath
+        self.cacheSize = cacheSize
+        self.mappedDataset = MappedDataset(mappedPath, cacheSize)
+        super(MappedConfigParser, self).__init__(path)
+
+    def loadConfig(self, configName: str) -> MappedTable:
+        return self.mappedDataset.getTable(configName)
+
+    def getConstructorArgs(self) -> Tuple[tuple, Dict[str, Any]]:
+        return (self.configPath, self.mappedPath), {"cacheSize": self.cacheSize}
+
+    def getSourceManifest(self) -> List:
+        return super(MappedConfigParser, self).getSourceManifest() + [getFileStamp(self.mappedPath)]
+
+    def close(self):
+        super(MappedConfigParser, self).close()
+        self.mappedDataset.close()
+
+    def getTableHash(self, attrName: str) -> str:
+        # mapped tables carry the hash computed when the file was written, decoding every record through the record
+        # cache just to hash it again would defeat the mapping. Files written without it fall back to decoding
+        table = getattr(self, attrName)
+        if isinstance(table, MappedTable) and table.contentHash is not None:
+            return table.contentHash
+        return super(MappedConfigParser, self).getTableHash(attrName)
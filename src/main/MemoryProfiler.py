@@ -0,0 +1,134 @@
+import sys
+from typing import Dict, List, Set, Iterable, Any
+from .ConfigParser import ConfigParser
+from .Utility import getDeepSize
+
+# model objects are the instances of classes defined in this package
+modelPackage = __name__.rpartition(".")[0]
+
+
+class MemoryEntry:
+    """
+    MemoryEntry is one row of a MemoryReport: the number of items of a table, file set or object kind and their size
+    """
+
+    def __init__(self, name: str, count: int, size: int):
+        self.name = name
+        self.count = count
+        self.size = size
+
+    def getAverage(self) -> float:
+        return self.size / self.count if self.count else 0
+
+
+class MemoryReport:
+    """
+    MemoryReport holds the deep memory usage of the sharecfg tables, the gamecfg file sets and the model objects of a
+    dataset. Every object is counted once: data shared by several tables (for example interned strings) counts toward
+    the first table that references it in attribute name order, so the table sizes add up to tableTotal. Gamecfg files
+    and model objects only count memory that is not already part of the tables.
+    """
+
+    def __init__(self):
+        self.tableEntries: List[MemoryEntry] = []
+        self.tableTotal = 0
+        self.gameConfigEntries: List[MemoryEntry] = []
+        self.objectEntries: List[MemoryEntry] = []
+
+    def toString(self) -> str:
+        lines = []
+        for title, entryList in [("sharecfg tables", self.tableEntries), ("gamecfg files", self.gameConfigEntries),
+                                 ("model objects", self.objectEntries)]:
+            if not entryList:
+                continue
+            lines.append("{:<32}{:>10}{:>14}{:>12}".format(title, "count", "bytes", "average"))
+            for entry in sorted(entryList, key=lambda e: -e.size):
+                lines.append("  {:<30}{:>10}{:>14}{:>12.1f}".format(entry.name, entry.count, entry.size,
+                                                                    entry.getAverage()))
+            lines.append("  {:<30}{:>10}{:>14}".format("total", sum(entry.count for entry in entryList),
+                                                       self.tableTotal if entryList is self.tableEntries
+                                                       else sum(entry.size for entry in entryList)))
+        return "\n".join(lines)
+
+
+def isModelObject(obj: Any) -> bool:
+    return hasattr(obj, "__dict__") and type(obj).__module__.startswith(modelPackage + ".")
+
+
+def measureObjectKinds(rootList: Iterable[Any], seen: Set[int]) -> Dict[str, MemoryEntry]:
+    """
+    Measures every model object reachable from rootList. The size of an object is its own size plus the containers and
+    values it references, up to other model objects which are counted as objects of their own kind
+
+    :param rootList: iterable of model objects
+    :param seen: set of ids of objects that are already counted, it is updated in place
+    :return: a dict, keys are class names, values are MemoryEntry objects
+    """
+    entryDict: Dict[str, MemoryEntry] = {}
+    objectStack = list(rootList)
+    while objectStack:
+        obj = objectStack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        stack = [vars(obj)]
+        while stack:
+            item = stack.pop()
+            if id(item) in seen:
+                continue
+            if isModelObject(item):
+                objectStack.append(item)
+                continue
+            seen.add(id(item))
+            size += sys.getsizeof(item)
+            if isinstance(item, dict):
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple, set, frozenset)):
+                stack.extend(item)
+            elif hasattr(item, "__dict__"):
+                stack.append(vars(item))
+        kind = type(obj).__name__
+        if kind not in entryDict:
+            entryDict[kind] = MemoryEntry(kind, 0, 0)
+        entryDict[kind].count += 1
+        entryDict[kind].size += size
+    return entryDict
+
+
+def profileMemory(parser: ConfigParser, includeGameConfig: bool = False, includeObjects: bool = True) -> MemoryReport:
+    """
+    Measures the memory usage of a dataset
+
+    :param parser: the ConfigParser of that dataset
+    :param includeGameConfig: whether every gamecfg skill and buff file is loaded and measured
+    :param includeObjects: whether every MetaShip and RootBuff is built (see ObjectGraph) and its objects measured
+    :return: MemoryReport object
+    """
+    report = MemoryReport()
+    # the parser itself is never measured through the objects that reference it
+    seen = {id(parser)}
+    for attrName in sorted(vars(parser)):
+        if attrName.endswith("Dict"):
+            table = getattr(parser, attrName)
+            report.tableEntries.append(MemoryEntry(attrName, len(table), getDeepSize(table, seen)))
+    report.tableTotal = sum(entry.size for entry in report.tableEntries)
+
+    # seen holds ids, so every measured object has to stay alive until the report is done, otherwise a freed file's
+    # id can be reused by the next one and that one would be skipped
+    measuredList = []
+    if includeGameConfig:
+        for configType, loader in [("skill", parser.loadSkill), ("buff", parser.loadBuff)]:
+            configList = [loader(configId) for configId in parser.getGameConfigIdList(configType)]
+            measuredList.append(configList)
+            size = sum(getDeepSize(config, seen) for config in configList)
+            report.gameConfigEntries.append(MemoryEntry(configType, len(configList), size))
+
+    if includeObjects:
+        from .ObjectGraph import buildObjectGraph
+
+        graph = buildObjectGraph(parser)
+        entryDict = measureObjectKinds(list(graph.metaShips.values()) + list(graph.rootBuffs.values()), seen)
+        report.objectEntries = sorted(entryDict.values(), key=lambda entry: entry.name)
+    return report
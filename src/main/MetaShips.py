@@ -2,6 +2,7 @@ import math
 from typing import Dict, Union, List, Tuple, Optional
 from .ConfigParser import ConfigParser
 from .RefitNode import RefitNode
+from .ResearchBonusTable import ResearchBonusTable
 
 
 class MetaShip:
@@ -45,7 +46,7 @@ class MetaShip:
         self.refitShip = None
         self.changeShipUponRefit = None
         self.changeHullTypeUponRefit = None
-        for shipId in parser.getGroupIdToShipId()[self.groupId]:
+        for shipId in parser.getSharedGroupIdToShipId()[self.groupId]:
             if str(self.groupId) in str(shipId):
                 suffix = int(str(shipId)[-1])
                 self.ships[suffix - 1] = parser.getShip(shipId)
@@ -87,6 +88,7 @@ class MetaShip:
             fateSimIdList = researchDict["fate_strengthen"]
             self.researchNodeList = [parser.getResearchStrengthenNode(nodeId) for nodeId in researchEffectIdList]
             self.fateSimNodeList = [parser.getResearchStrengthenNode(nodeId) for nodeId in fateSimIdList]
+            self.researchBonusTable = ResearchBonusTable(self.researchNodeList, self.fateSimNodeList)
 
     def getLocalizedName(self) -> str:
         """
@@ -97,7 +99,7 @@ class MetaShip:
         return self.ships[0].name
 
     def getStat(self, statId: int, level: int, lbLevel: int, affBonus: int,
-                refitBonus: bool, strengthenBonus: bool) -> int:
+                refitBonus: bool, strengthenBonus: bool, devLevel: Optional[int] = None, fateSimStage: int = 0) -> int:
         """
         Calculates a stat of this meta ship at certain level, limit break level, affinity, retrofit stat and
         strengthen state.
@@ -108,8 +110,37 @@ class MetaShip:
         :param affBonus: integer, range from 0 to 12, the affinity stat bonus of the ship (affBonus%)
         :param refitBonus: boolean, is the ship refitted
         :param strengthenBonus: boolean, is the ship fully strengthened. false means not counting strengthen bonus
+        :param devLevel: integer or None, the dev level of a research ship, None means max dev level if
+                         strengthenBonus else 0. Ignored for non-research ships
+        :param fateSimStage: integer, the fate simulation stage of a research ship. Ignored for non-research ships
         :return:
         """
+        baseStat, refitStat = self.getBaseAndRefitStat(statId, level, lbLevel, affBonus, refitBonus, strengthenBonus)
+        researchStrengthenStat = self.researchBonusTable.getStatBonus(
+            statId, self.getDevLevel(devLevel, strengthenBonus), fateSimStage) if self.isResearchShip else 0
+        return math.floor((baseStat + researchStrengthenStat) * (1 + affBonus / 100) + refitStat)
+
+    def getResearchStatList(self, statId: int, level: int, lbLevel: int, affBonus: int,
+                            refitBonus: bool, strengthenBonus: bool) -> List[int]:
+        """
+        Calculates a stat of this research ship across all dev levels, see getStat for the parameters
+
+        :return: list of integers, the i-th element is the stat at dev level i
+        """
+        if not self.isResearchShip:
+            raise ValueError("MetaShip ({}) is not a research ship".format(self.id))
+
+        baseStat, refitStat = self.getBaseAndRefitStat(statId, level, lbLevel, affBonus, refitBonus, strengthenBonus)
+        return [math.floor((baseStat + researchStrengthenStat) * (1 + affBonus / 100) + refitStat)
+                for researchStrengthenStat in self.researchBonusTable.getStatBonusList(statId)]
+
+    def getBaseAndRefitStat(self, statId: int, level: int, lbLevel: int, affBonus: int,
+                            refitBonus: bool, strengthenBonus: bool) -> Tuple[float, float]:
+        """
+        Validates the parameters of getStat and calculates the base stat and the retrofit stat bonus
+
+        :return: tuple of base stat and retrofit stat bonus
+        """
         if statId < 1 or statId > 12:
             raise ValueError("statId ({}) out of bound".format(statId))
         elif level < 1 or level > 120:
@@ -126,17 +157,31 @@ class MetaShip:
 
             refitStat = sum(map(lambda x: x[0].getStatBonusSum(statId), self.refitNodeListWithCoord)) if refitBonus \
                 else 0
-            researchStrengthenStat = sum([researchNode.getStatBonus(statId) for researchNode in self.researchNodeList])\
-                if (self.isResearchShip and strengthenBonus) else 0
-            return math.floor((baseStat + researchStrengthenStat) * (1 + affBonus / 100) + refitStat)
+            return baseStat, refitStat
+
+    def getDevLevel(self, devLevel: Optional[int], fullyStrengthened: bool) -> int:
+        """
+        Resolves the dev level of this research ship, None means max dev level if fullyStrengthened else 0
+
+        :param devLevel: integer or None, the dev level
+        :param fullyStrengthened: boolean, whether the ship is fully strengthened
+        :return: integer, the dev level
+        """
+        if devLevel is not None:
+            return devLevel
+        return self.researchBonusTable.maxDevLevel if fullyStrengthened else 0
 
-    def getEquipProficiency(self, equipSlot: int, lbLevel: int, refitBonus: bool) -> float:
+    def getEquipProficiency(self, equipSlot: int, lbLevel: int, refitBonus: bool, devLevel: Optional[int] = None,
+                            fateSimStage: int = 0) -> float:
         """
         Calculates the equipment proficiency of a certain slot
 
         :param equipSlot: integer, range from 1 to 4 the equipment slot, 4 means the fixed weapon on all torpedo ships
         :param lbLevel: integer, range from 0 to 3, the limit break level
         :param refitBonus: boolean, whether count all refit proficiency bonus
+        :param devLevel: integer or None, the dev level of a research ship, None means max dev level if lbLevel is 3
+                         else 0. Ignored for non-research ships
+        :param fateSimStage: integer, the fate simulation stage of a research ship. Ignored for non-research ships
         :return: float, the proficiency
         """
         if equipSlot < 1 or equipSlot > 4:
@@ -153,11 +198,32 @@ class MetaShip:
 
         refitProf = sum([nodeWithCoord[0].getStatBonusSum("equipment_proficiency_{}".format(equipSlot))
                          for nodeWithCoord in self.refitNodeListWithCoord]) if refitBonus else 0
-        researchProf = sum([researchNode.getEquipProficiencyBonus(equipSlot) for researchNode in self.researchNodeList]) \
-            if (self.isResearchShip and lbLevel == 3) else 0
+        researchProf = self.researchBonusTable.getEquipProficiencyBonus(
+            equipSlot, self.getDevLevel(devLevel, lbLevel == 3), fateSimStage) if self.isResearchShip else 0
 
         return round(refitProf + baseProf + researchProf, 3)
 
+    def getEquipPreload(self, equipSlot: int, lbLevel: int, devLevel: Optional[int] = None,
+                        fateSimStage: int = 0) -> int:
+        """
+        Gets the preload count of a certain equipment slot
+
+        :param equipSlot: integer, range from 1 to 3, the slot number
+        :param lbLevel: integer, range from 0 to 3, the limit break level
+        :param devLevel: integer or None, the dev level of a research ship, None means max dev level if lbLevel is 3
+                         else 0. Ignored for non-research ships
+        :param fateSimStage: integer, the fate simulation stage of a research ship. Ignored for non-research ships
+        :return: integer, the preload count
+        """
+        if equipSlot < 1 or equipSlot > 3:
+            raise ValueError("equipSlot ({}) out of bound".format(equipSlot))
+        elif lbLevel < 0 or lbLevel > 3:
+            raise ValueError("lbLevel ({}) out of bound".format(lbLevel))
+
+        researchPreload = self.researchBonusTable.getPreloadBonus(
+            equipSlot, self.getDevLevel(devLevel, lbLevel == 3), fateSimStage) if self.isResearchShip else 0
+        return self.ships[lbLevel].getEquipPreload(equipSlot) + researchPreload
+
     def getEquipBaseCount(self, equipSlot: int, lbLevel: int, isRefitted: bool) -> int:
         """
         Gets the base count of a certain equipment slot
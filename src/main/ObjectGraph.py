@@ -0,0 +1,130 @@
+import os
+import json
+import pickle
+import hashlib
+from functools import lru_cache
+from typing import Dict, List
+from .ConfigParser import ConfigParser
+
+
+class ObjectGraph:
+    """
+    ObjectGraph holds fully built MetaShip and RootBuff objects of a dataset. Objects with the same id (ships, weapons,
+    bullets, buffs etc.) are shared across the graph, so it can be pickled and reloaded with shared references intact.
+    """
+
+    def __init__(self, datasetHash: str):
+        self.datasetHash = datasetHash
+        self.cacheKey = None  # set by loadObjectGraph before the graph is saved
+        self.metaShips: Dict[int, object] = {}
+        self.rootBuffs: Dict[int, object] = {}
+        self.failedMetaIds: List[int] = []
+        self.failedBuffIds: List[int] = []
+
+    def getMetaShip(self, metaId: int):
+        """
+        Gets a built MetaShip object
+
+        :param metaId: integer, the meta id
+        :return: MetaShip object
+        """
+        return self.metaShips[metaId]
+
+    def getRootBuff(self, buffId: int):
+        """
+        Gets a built RootBuff object
+
+        :param buffId: integer, the buff id
+        :return: RootBuff object
+        """
+        return self.rootBuffs[buffId]
+
+
+def buildObjectGraph(parser: ConfigParser) -> ObjectGraph:
+    """
+    Builds every MetaShip and every RootBuff of a dataset, objects that fail to build are recorded and skipped
+
+    :param parser: the ConfigParser of that dataset
+    :return: ObjectGraph object
+    """
+    graph = ObjectGraph(parser.getDatasetHash())
+    parser.threadState.objectMemo = {}
+    try:
+        for metaId in sorted(parser.getMetaIdList()):
+            try:
+                graph.metaShips[metaId] = parser.getMetaShip(metaId)
+            except (KeyError, ValueError, IndexError):
+                graph.failedMetaIds.append(metaId)
+        buffIdSet = set(parser.getGameConfigIdList("buff"))
+        for buffId in sorted(int(buffId) for buffId in parser.skillDataDict):
+            if buffId not in buffIdSet:
+                continue
+            try:
+                graph.rootBuffs[buffId] = parser.getRootBuff(buffId)
+            except (KeyError, ValueError, IndexError, FileNotFoundError):
+                graph.failedBuffIds.append(buffId)
+    finally:
+        parser.threadState.objectMemo = None
+    return graph
+
+
+@lru_cache(maxsize=None)
+def getCodeHash() -> str:
+    """
+    Calculates the hash of the names, sizes and modification times of the source files of this package, once per
+    process. Pickled graphs store the attributes of the model classes, so a graph pickled by a different version of the
+    code must not be loaded
+
+    :return: string, the hex digest
+    """
+    packageDir = os.path.dirname(os.path.abspath(__file__))
+    codeHash = hashlib.sha1()
+    for fileName in sorted(os.listdir(packageDir)):
+        if fileName.endswith(".py"):
+            fileStat = os.stat(os.path.join(packageDir, fileName))
+            codeHash.update("{}\0{}\0{}\0".format(fileName, fileStat.st_size, fileStat.st_mtime_ns).encode("utf-8"))
+    return codeHash.hexdigest()
+
+
+def getGraphCacheKey(parser: ConfigParser) -> str:
+    """
+    Calculates the key of the cached object graph of a dataset from the stamps of its files (see
+    ConfigParser.getSourceManifest) and the code version. No table or gamecfg file is read or hashed, so checking the
+    cache costs a few stat calls. Parsers whose tables are modified after loading must not use the cache
+
+    :param parser: the ConfigParser of that dataset
+    :return: string, the hex digest
+    """
+    return hashlib.sha1(json.dumps([parser.getSourceManifest(), getCodeHash()]).encode("utf-8")).hexdigest()
+
+
+def loadObjectGraph(parser: ConfigParser, cacheDir: str) -> ObjectGraph:
+    """
+    Loads the object graph of a dataset from cacheDir, builds and saves it first if there is no cached graph of the
+    same files and code version, see getGraphCacheKey. A cached graph that cannot be unpickled is rebuilt
+
+    :param parser: the ConfigParser of that dataset
+    :param cacheDir: string, the folder of cached graphs
+    :return: ObjectGraph object
+    """
+    cacheKey = getGraphCacheKey(parser)
+    cachePath = os.path.join(cacheDir, "objectGraph_{}.pickle".format(cacheKey))
+    if os.path.exists(cachePath):
+        try:
+            with open(cachePath, "rb") as cacheFile:
+                graph = pickle.load(cacheFile)
+            if isinstance(graph, ObjectGraph) and getattr(graph, "cacheKey", None) == cacheKey:
+                return graph
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError, ValueError, IndexError,
+                KeyError):
+            pass
+
+    graph = buildObjectGraph(parser)
+    graph.cacheKey = cacheKey
+    os.makedirs(cacheDir, exist_ok=True)
+    # written to a temporary file first so other workers never read a half written graph
+    temporaryPath = "{}.{}.tmp".format(cachePath, os.getpid())
+    with open(temporaryPath, "wb") as cacheFile:
+        pickle.dump(graph, cacheFile, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporaryPath, cachePath)
+    return graph
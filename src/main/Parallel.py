@@ -0,0 +1,78 @@
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, Any, Dict, Optional, Type
+from .ConfigParser import ConfigParser
+
+# the parser and the shared data of a worker process, set once by initWorkerParser
+workerParser: Optional[ConfigParser] = None
+workerSharedData: Any = None
+
+
+def initWorkerParser(parserType: Type[ConfigParser], parserArgs: tuple, parserKwargs: Dict[str, Any],
+                     sharedData: Any = None):
+    """
+    Initializer of worker processes, loads the dataset once per worker
+
+    :param parserType: the class of the parser, ConfigParser or a subclass
+    :param parserArgs: tuple, the positional arguments of its constructor, see ConfigParser.getConstructorArgs
+    :param parserKwargs: dict, the keyword arguments of its constructor
+    :param sharedData: the sharedData of mapWithParser, unpickled once per worker
+    """
+    global workerParser, workerSharedData
+    workerParser = parserType(*parserArgs, **parserKwargs)
+    workerSharedData = sharedData
+
+
+def callWithWorkerParser(function: Callable[..., Any], task: Any, hasSharedData: bool = False) -> Any:
+    """
+    Calls function with the parser of this worker process
+
+    :param function: a module level function that takes a parser and a task
+    :param task: the task
+    :param hasSharedData: whether function also takes the shared data of this worker, see mapWithParser
+    :return: the result of function
+    """
+    if hasSharedData:
+        return function(workerParser, workerSharedData, task)
+    return function(workerParser, task)
+
+
+def mapWithParser(parser: ConfigParser, function: Callable[..., Any], taskList: Iterable[Any],
+                  jobs: int = 1, parserKwargs: Optional[Dict[str, Any]] = None, sharedData: Any = None) \
+        -> Iterator[Any]:
+    """
+    Applies function to every task, in a process pool if jobs is larger than 1. Results are yielded in task order as
+    soon as they are ready, tasks are taken from taskList lazily and at most jobs * 2 of them are in flight
+
+    :param parser: the ConfigParser used when jobs is 1, otherwise every worker creates a parser of the same type with
+                   the same arguments (see ConfigParser.getConstructorArgs). Parsers that cannot be rebuilt raise
+                   ValueError
+    :param function: a module level function that takes a parser and a task, it must be picklable
+    :param taskList: iterable of picklable tasks
+    :param jobs: integer, the number of worker processes
+    :param parserKwargs: dict or None, keyword arguments of the workers' parsers that replace those of parser
+    :param sharedData: picklable data needed by every task (for example large lookup tables), sent once per worker
+                       instead of with every task. If it is not None function takes a parser, sharedData and a task
+    :return: iterator of results
+    """
+    hasSharedData = sharedData is not None
+    if jobs <= 1:
+        for task in taskList:
+            yield function(parser, sharedData, task) if hasSharedData else function(parser, task)
+        return
+
+    parserArgs, workerParserKwargs = parser.getConstructorArgs()
+    workerParserKwargs.update(parserKwargs or {})
+    taskIterator = iter(taskList)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initWorkerParser,
+                             initargs=(type(parser), parserArgs, workerParserKwargs, sharedData)) as executor:
+        # at most jobs * 2 tasks are submitted and not yet consumed, so finished results waiting to be yielded and
+        # pending tasks stay bounded however long taskList is
+        futureQueue = deque(executor.submit(callWithWorkerParser, function, task, hasSharedData)
+                            for task in islice(taskIterator, jobs * 2))
+        while futureQueue:
+            result = futureQueue.popleft().result()
+            for task in islice(taskIterator, 1):
+                futureQueue.append(executor.submit(callWithWorkerParser, function, task, hasSharedData))
+            yield result
@@ -0,0 +1,108 @@
+from typing import Dict, Iterable, Union, FrozenSet
+
+# the fields of ship_data_statistics and ship_data_template read by Ship, SurfaceShip and Submarine objects
+shipStatisticFieldList = ["id", "name", "english_name", "attrs", "attrs_growth", "attrs_growth_extra", "type", "rarity",
+                          "star", "equipment_proficiency", "depth_charge_list", "default_equip_list", "preload_count",
+                          "fix_equip_list", "base_list", "oxy_max", "oxy_cost", "oxy_recovery", "ammo",
+                          "attack_duration", "huntingrange_level", "hunting_range"]
+shipDataFieldList = ["id", "equip_1", "equip_2", "equip_3", "equip_4", "equip_5", "buff_list_display",
+                     "strengthen_id", "group_type"]
+
+# named projections, keys are profile names, values map table names to the fields that are kept
+projectionProfileDict: Dict[str, Dict[str, Iterable[str]]] = {
+    # base stats and growth of ships, enough for stat tables but not for building Ship objects
+    "stats": {
+        "ship_data_statistics": ["id", "name", "english_name", "attrs", "attrs_growth", "attrs_growth_extra", "type",
+                                 "rarity"],
+    },
+    # everything ConfigParser.getShip reads
+    "ships": {
+        "ship_data_statistics": shipStatisticFieldList,
+        "ship_data_template": shipDataFieldList,
+    },
+}
+
+
+class ProjectedFieldError(KeyError):
+    """
+    ProjectedFieldError is raised when a record is asked for a field that was dropped by the projection of its table
+    """
+
+    def __init__(self, configName: str, field: str):
+        super(ProjectedFieldError, self).__init__(field)
+        self.configName = configName
+        self.field = field
+
+    def __str__(self) -> str:
+        return "field {!r} of {} was not loaded, add it to the projection of that table".format(self.field,
+                                                                                               self.configName)
+
+
+class TableProjection:
+    """
+    TableProjection is the set of fields kept from the records of one table
+    """
+
+    def __init__(self, configName: str, fields: Iterable[str]):
+        self.configName = configName
+        self.fieldSet: FrozenSet[str] = frozenset(fields)
+
+    def project(self, record: Dict) -> Dict:
+        return {field: value for field, value in record.items() if field in self.fieldSet}
+
+
+class ProjectedRecord(dict):
+    """
+    ProjectedRecord is a record loaded with a TableProjection. It behaves like a dict, except that looking up a field
+    outside the projection ([], get or in) raises ProjectedFieldError instead of reporting a missing field
+    """
+
+    __slots__ = ("projection",)
+
+    def __init__(self, record: Dict, projection: TableProjection):
+        super(ProjectedRecord, self).__init__(record)
+        self.projection = projection
+
+    def checkField(self, field):
+        if field not in self.projection.fieldSet:
+            raise ProjectedFieldError(self.projection.configName, field)
+
+    def __getitem__(self, field):
+        self.checkField(field)
+        return super(ProjectedRecord, self).__getitem__(field)
+
+    def get(self, field, default=None):
+        self.checkField(field)
+        return super(ProjectedRecord, self).get(field, default)
+
+    def __contains__(self, field) -> bool:
+        self.checkField(field)
+        return super(ProjectedRecord, self).__contains__(field)
+
+    def __reduce__(self):
+        return ProjectedRecord, (dict(self), self.projection)
+
+
+def resolveProjection(projection: Union[str, Dict[str, Iterable[str]], None],
+                      configNames: Iterable[str]) -> Dict[str, TableProjection]:
+    """
+    Resolves the projection argument of ConfigParser
+
+    :param projection: None (no projection), the name of a profile in projectionProfileDict, or a dict whose keys are
+                       table names and values are the fields kept from that table
+    :param configNames: the names of the tables that can be projected
+    :return: a dict, keys are table names, values are TableProjection objects. Tables that are not in it are not
+             projected
+    """
+    if projection is None:
+        return {}
+    if isinstance(projection, str):
+        if projection not in projectionProfileDict:
+            raise ValueError("unknown projection profile ({}), expected one of {}".format(
+                projection, sorted(projectionProfileDict)))
+        projection = projectionProfileDict[projection]
+    configNameSet = set(configNames)
+    for configName in projection:
+        if configName not in configNameSet:
+            raise ValueError("cannot project unknown table ({})".format(configName))
+    return {configName: TableProjection(configName, fields) for configName, fields in projection.items()}
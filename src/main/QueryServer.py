@@ -0,0 +1,199 @@
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple, Callable, Any
+from urllib.parse import urlsplit, parse_qs, urlencode
+from .ConfigParser import ConfigParser
+from .DatasetHandle import DatasetHandle
+from .Serialization import toJsonable
+from .Utility import parseIdRange
+
+
+class QueryService:
+    """
+    QueryService answers json queries against the resident ConfigParser of a DatasetHandle. Responses are cached in
+    process and tagged with ETags derived from the dataset hash, so a swapped dataset never serves stale responses.
+    """
+
+    def __init__(self, handle: DatasetHandle, cacheSize: int = 1024, maxBatchSize: int = 500):
+        """
+        Constructor of QueryService class
+
+        :param handle: the DatasetHandle whose current parser is queried
+        :param cacheSize: integer, the maximum number of cached responses
+        :param maxBatchSize: integer, the maximum number of ids of a batch query
+        """
+        self.handle = handle
+        self.maxBatchSize = maxBatchSize
+        # the dataset hash is computed before the first request arrives
+        handle.getParser().getDatasetHash()
+        self.cacheSize = cacheSize
+        self.cache: OrderedDict = OrderedDict()
+        self.cacheLock = threading.Lock()
+
+        # (pattern, function that takes the parser, the matched id and the query dict), ids of batch routes come from
+        # the "ids" parameter
+        self.routeList: List[Tuple[re.Pattern, Callable[[ConfigParser, int, Dict[str, List[str]]], Any]]] = [
+            (re.compile(r"/ship/(\d+)"), lambda parser, shipId, query: toJsonable(parser.getShip(shipId))),
+            (re.compile(r"/metaship/(\d+)/stats"), self.getMetaShipStats),
+            (re.compile(r"/weapon/(\d+)"), lambda parser, weaponId, query: toJsonable(parser.getWeapon(weaponId))),
+            (re.compile(r"/skill/(\d+)"), lambda parser, buffId, query: toJsonable(parser.getRootBuff(buffId))),
+        ]
+        self.batchRouteDict: Dict[str, str] = {"/ships": "/ship/{}", "/metaships/stats": "/metaship/{}/stats",
+                                               "/weapons": "/weapon/{}", "/skills": "/skill/{}"}
+
+    @staticmethod
+    def getMetaShipStats(parser: ConfigParser, metaId: int, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        def getParam(name: str, default: int) -> int:
+            return int(query.get(name, [default])[0])
+
+        level, lbLevel, affBonus = getParam("level", 120), getParam("lb", 3), getParam("aff", 0)
+        refitBonus, strengthenBonus = getParam("refit", 0) == 1, getParam("strengthen", 1) == 1
+        metaShip = parser.getMetaShip(metaId)
+        attrDict = parser.getAttrDict()
+        return {"id": metaId, "level": level, "lb": lbLevel, "aff": affBonus, "refit": refitBonus,
+                "strengthen": strengthenBonus,
+                "stats": {attrDict[statId]: metaShip.getStat(statId, level, lbLevel, affBonus, refitBonus,
+                                                             strengthenBonus) for statId in range(1, 13)}}
+
+    def query(self, parser: ConfigParser, path: str, query: Dict[str, List[str]]) -> Tuple[int, Any]:
+        """
+        Answers a single object query without caching. Missing objects are answered with 404, invalid parameters with
+        400 and objects that fail to build with 500
+
+        :param parser: the ConfigParser of the snapshot taken for this request
+        :param path: string, the request path, for example "/ship/101011"
+        :param query: dict, the parsed query string
+        :return: tuple of http status and json-like body
+        """
+        for pattern, function in self.routeList:
+            match = pattern.fullmatch(path)
+            if match:
+                try:
+                    return 200, function(parser, int(match.group(1)), query)
+                except (KeyError, FileNotFoundError):
+                    return 404, {"error": "{} not found".format(path)}
+                except ValueError as error:
+                    return 400, {"error": str(error)}
+                except Exception as error:
+                    # any other build error is a broken record, the client still gets a status and a json body
+                    return 500, {"error": "{}: {}".format(type(error).__name__, error)}
+        return 404, {"error": "unknown route {}".format(path)}
+
+    @staticmethod
+    def getCacheKey(parser: ConfigParser, path: str, query: Dict[str, List[str]]) -> str:
+        # keyed by the dataset hash too, so responses of a replaced dataset are never served. Parameters are sorted so
+        # equal queries share one key
+        return parser.getDatasetHash() + path + "?" + urlencode(sorted(
+            (name, value) for name, valueList in query.items() for value in valueList))
+
+    @staticmethod
+    def encodeResponse(status: int, body: Any, cacheKey: str) -> Tuple[int, bytes, str]:
+        eTag = '"{}"'.format(hashlib.sha1(cacheKey.encode("utf-8")).hexdigest())
+        return status, json.dumps(body, ensure_ascii=False).encode("utf-8"), eTag
+
+    def getObjectResponse(self, parser: ConfigParser, path: str, query: Dict[str, List[str]]) -> Tuple[int, bytes, str]:
+        """
+        Answers a single object query, using the response cache
+
+        :param parser: the ConfigParser of the snapshot taken for this request
+        :param path: string, the request path, for example "/ship/101011"
+        :param query: dict, the parsed query string
+        :return: tuple of http status, encoded json body and ETag
+        """
+        cacheKey = self.getCacheKey(parser, path, query)
+        with self.cacheLock:
+            if cacheKey in self.cache:
+                self.cache.move_to_end(cacheKey)
+                return self.cache[cacheKey]
+
+        response = self.encodeResponse(*self.query(parser, path, query), cacheKey)
+        if response[0] == 200:
+            with self.cacheLock:
+                self.cache[cacheKey] = response
+                if len(self.cache) > self.cacheSize:
+                    self.cache.popitem(last=False)
+        return response
+
+    def getBatchResponse(self, parser: ConfigParser, path: str, query: Dict[str, List[str]]) -> Tuple[int, bytes, str]:
+        """
+        Answers a batch query, every id is answered by getObjectResponse so batches share the cached responses of
+        single object queries
+
+        :param parser: the ConfigParser of the snapshot taken for this request
+        :param path: string, a batch route, for example "/ships"
+        :param query: dict, the parsed query string, "ids" is required
+        :return: tuple of http status, encoded json body (an object keyed by id) and ETag
+        """
+        cacheKey = self.getCacheKey(parser, path, query)
+        if "ids" not in query:
+            return self.encodeResponse(400, {"error": "missing ids"}, cacheKey)
+        try:
+            idList = parseIdRange(query["ids"][0], self.maxBatchSize)
+        except ValueError as error:
+            return self.encodeResponse(400, {"error": "invalid ids: {}".format(error)}, cacheKey)
+
+        objectQuery = {name: valueList for name, valueList in query.items() if name != "ids"}
+        # the bodies are already encoded, so the batch body is joined from them instead of decoding and encoding again
+        partList = [json.dumps(str(objectId)).encode("utf-8") + b": " + self.getObjectResponse(
+            parser, self.batchRouteDict[path].format(objectId), objectQuery)[1] for objectId in idList]
+        eTag = '"{}"'.format(hashlib.sha1(cacheKey.encode("utf-8")).hexdigest())
+        return 200, b"{" + b", ".join(partList) + b"}", eTag
+
+    def getResponse(self, url: str) -> Tuple[int, bytes, str]:
+        """
+        Answers a request url, single object responses are cached
+
+        :param url: string, the request url (path and query string)
+        :return: tuple of http status, encoded json body and ETag
+        """
+        parser = self.handle.getParser()
+        splitUrl = urlsplit(url)
+        path, query = splitUrl.path.rstrip("/"), parse_qs(splitUrl.query)
+        if path in self.batchRouteDict:
+            return self.getBatchResponse(parser, path, query)
+        return self.getObjectResponse(parser, path, query)
+
+
+class QueryRequestHandler(BaseHTTPRequestHandler):
+    """
+    Http handler that forwards GET requests to the QueryService of its server
+    """
+
+    def do_GET(self):
+        status, body, eTag = self.server.service.getResponse(self.path)
+        if status == 200 and self.headers.get("If-None-Match") == eTag:
+            self.send_response(304)
+            self.send_header("ETag", eTag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", eTag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args):
+        pass
+
+
+def createServer(parser: ConfigParser, host: str = "127.0.0.1", port: int = 8080,
+                 cacheSize: int = 1024, maxBatchSize: int = 500) -> ThreadingHTTPServer:
+    """
+    Creates a local http query server over a preloaded parser, call serve_forever on it to start serving. The dataset
+    can be replaced while serving by calling server.service.handle.swap
+
+    :param parser: the ConfigParser to serve
+    :param host: string, the address to bind, local only by default
+    :param port: integer, the port to bind
+    :param cacheSize: integer, the maximum number of cached responses
+    :param maxBatchSize: integer, the maximum number of ids of a batch query
+    :return: ThreadingHTTPServer object
+    """
+    server = ThreadingHTTPServer((host, port), QueryRequestHandler)
+    server.service = QueryService(DatasetHandle(parser), cacheSize, maxBatchSize)
+    return server
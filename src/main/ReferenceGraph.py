@@ -0,0 +1,138 @@
+from typing import Dict, Set, Tuple, List, Optional
+from .ConfigParser import ConfigParser
+from .Triggerable import getEffectReferences
+
+# a node is (kind, id), kinds are "ship", "buff", "skill" (gamecfg files, displayed skills are buffs), "weapon",
+# "bullet", "aircraft" and "barrage"
+Node = Tuple[str, int]
+
+
+def getSpawnType(weaponDataDict: Dict[str, Dict], weaponData: Dict) -> Optional[str]:
+    """
+    Gets the spawn_bound of a weapon record, inherited through its base weapons like Weapon does
+
+    :param weaponDataDict: the weapon_property table
+    :param weaponData: dict, the record of that weapon
+    :return: string, or None if neither the weapon nor its bases have one
+    """
+    visitedIdSet = set()
+    while weaponData is not None and not weaponData.get("spawn_bound") and "base" in weaponData:
+        if weaponData["base"] in visitedIdSet:
+            return None
+        visitedIdSet.add(weaponData["base"])
+        weaponData = weaponDataDict.get(str(weaponData["base"]))
+    return weaponData.get("spawn_bound") if weaponData is not None else None
+
+
+class ReferenceGraph:
+    """
+    ReferenceGraph records which game object references which, built in one scan of the raw tables and gamecfg files
+    without constructing model objects. It answers forward ("what does X use") and reverse ("what uses X") queries,
+    optionally transitively.
+    """
+
+    def __init__(self, parser: ConfigParser):
+        """
+        Constructor of ReferenceGraph class
+
+        :param parser: the ConfigParser of the dataset
+        """
+        self.forward: Dict[Node, Set[Node]] = {}
+        self.reverse: Dict[Node, Set[Node]] = {}
+
+        for shipId, dataDict in parser.shipDataDict.items():
+            for buffId in dataDict["buff_list_display"]:
+                self.addEdge(("ship", int(shipId)), ("buff", buffId))
+
+        for configType, loader in [("buff", parser.loadBuff), ("skill", parser.loadSkill)]:
+            for configId in parser.getGameConfigIdList(configType):
+                for kind, referencedId in getEffectReferences(loader(configId)):
+                    self.addEdge((configType, configId), (kind, referencedId))
+
+        for weaponId, weaponData in parser.weaponDataDict.items():
+            node = ("weapon", int(weaponId))
+            if "base" in weaponData:
+                self.addEdge(node, ("weapon", weaponData["base"]))
+            for barrageId in weaponData.get("barrage_ID", []):
+                self.addEdge(node, ("barrage", barrageId))
+            # bullets are branched the same way as in Weapon, bullets a weapon inherits are reached through its base
+            bulletIdList = weaponData.get("bullet_ID", [])
+            spawnType = getSpawnType(parser.weaponDataDict, weaponData)
+            if spawnType in ["cannon", "antiaircraft", "torpedo"]:
+                for bulletId in bulletIdList:
+                    self.addEdge(node, ("bullet", bulletId))
+            elif spawnType == "plane":
+                if all(str(bulletId) in parser.aircraftDataDict for bulletId in bulletIdList):
+                    for bulletId in bulletIdList:
+                        self.addEdge(node, ("aircraft", bulletId))
+                elif weaponId in parser.aircraftDataDict:
+                    # plane weapons whose bullets are not all aircraft launch the aircraft of their own id
+                    self.addEdge(node, ("aircraft", int(weaponId)))
+
+        for aircraftId, aircraftData in parser.aircraftDataDict.items():
+            node = ("aircraft", int(aircraftId))
+            if "base" in aircraftData:
+                self.addEdge(node, ("aircraft", aircraftData["base"]))
+            for weaponId in aircraftData.get("weapon_ID", []):
+                self.addEdge(node, ("weapon", weaponId))
+
+    def addEdge(self, source: Node, target: Node):
+        """
+        Records that source references target
+
+        :param source: tuple (kind, id)
+        :param target: tuple (kind, id)
+        """
+        self.forward.setdefault(source, set()).add(target)
+        self.reverse.setdefault(target, set()).add(source)
+
+    @staticmethod
+    def traverse(edges: Dict[Node, Set[Node]], node: Node, transitive: bool, kind: Optional[str]) -> List[Node]:
+        """
+        Gets the neighbours of a node, or every node reachable from it if transitive
+
+        :param edges: the forward or reverse edges
+        :param node: tuple (kind, id), the start node
+        :param transitive: boolean, whether reachable nodes are included
+        :param kind: string or None, only returns nodes of this kind if given
+        :return: sorted list of nodes
+        """
+        if transitive:
+            visited = set()
+            stack = [node]
+            while stack:
+                for neighbour in edges.get(stack.pop(), []):
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        stack.append(neighbour)
+            visited.discard(node)
+        else:
+            visited = edges.get(node, set())
+        return sorted(neighbour for neighbour in visited if kind is None or neighbour[0] == kind)
+
+    def getReferences(self, kind: str, objectId: int, transitive: bool = False,
+                      targetKind: Optional[str] = None) -> List[Node]:
+        """
+        Gets the objects an object references, for example the weapons of an aircraft
+
+        :param kind: string, the kind of that object
+        :param objectId: integer, the id of that object
+        :param transitive: boolean, whether indirect references are included
+        :param targetKind: string or None, only returns objects of this kind if given
+        :return: sorted list of tuples (kind, id)
+        """
+        return self.traverse(self.forward, (kind, objectId), transitive, targetKind)
+
+    def getReferrers(self, kind: str, objectId: int, transitive: bool = False,
+                     sourceKind: Optional[str] = None) -> List[Node]:
+        """
+        Gets the objects that reference an object, for example getReferrers("weapon", 1, True, "ship") gets the ships
+        whose skills fire weapon 1
+
+        :param kind: string, the kind of that object
+        :param objectId: integer, the id of that object
+        :param transitive: boolean, whether indirect referrers are included
+        :param sourceKind: string or None, only returns objects of this kind if given
+        :return: sorted list of tuples (kind, id)
+        """
+        return self.traverse(self.reverse, (kind, objectId), transitive, sourceKind)
@@ -0,0 +1,154 @@
+from typing import Dict, List, Set, Iterable, Any
+from .ConfigParser import ConfigParser
+from .Triggerable import getEffectReferences
+
+
+class ReferenceIssue:
+    """
+    ReferenceIssue describes one reference to a record or file that does not exist
+    """
+
+    def __init__(self, sourceTable: str, sourceId: Any, field: str, targetTable: str, targetId: Any):
+        self.sourceTable = sourceTable
+        self.sourceId = sourceId
+        self.field = field
+        self.targetTable = targetTable
+        self.targetId = targetId
+
+    def toString(self) -> str:
+        return "{}[{}].{} -> {}[{}] does not exist".format(self.sourceTable, self.sourceId, self.field,
+                                                          self.targetTable, self.targetId)
+
+
+class ValidationReport:
+    """
+    ValidationReport collects the issues found by validateReferences
+    """
+
+    def __init__(self):
+        self.issues: List[ReferenceIssue] = []
+        self.checkedCount = 0
+
+    def check(self, referenceIterable: Iterable[Any], idSet: Set[str], sourceTable: str, sourceId: Any, field: str,
+              targetTable: str):
+        """
+        Checks references against the id set of the target table and records the missing ones
+
+        :param referenceIterable: iterable of referenced ids
+        :param idSet: set of strings, the existing ids of the target table
+        :param sourceTable: string, the table holding the references
+        :param sourceId: the id of the record holding the references
+        :param field: string, the field holding the references
+        :param targetTable: string, the referenced table
+        """
+        for targetId in referenceIterable:
+            self.checkedCount += 1
+            if str(targetId) not in idSet:
+                self.issues.append(ReferenceIssue(sourceTable, sourceId, field, targetTable, targetId))
+
+    def isValid(self) -> bool:
+        """
+        Checks whether no issue was found
+
+        :return: boolean
+        """
+        return len(self.issues) == 0
+
+    def getIssueCounts(self) -> Dict[str, int]:
+        """
+        Counts the issues of every "sourceTable.field -> targetTable" reference kind
+
+        :return: a dict, keys are reference kinds, values are issue counts
+        """
+        result = {}
+        for issue in self.issues:
+            kind = "{}.{} -> {}".format(issue.sourceTable, issue.field, issue.targetTable)
+            result[kind] = result.get(kind, 0) + 1
+        return result
+
+    def toString(self) -> str:
+        return "\n".join(["{} references checked, {} issues".format(self.checkedCount, len(self.issues))]
+                         + [issue.toString() for issue in self.issues])
+
+
+def validateReferences(parser: ConfigParser, includeGameConfig: bool = False) -> ValidationReport:
+    """
+    Checks every cross-table reference of a dataset in one linear sweep over prebuilt id sets, no model object is
+    constructed
+
+    :param parser: the ConfigParser of that dataset
+    :param includeGameConfig: whether the effect lists of every gamecfg skill and buff file are checked too, this
+                              reads all of those files
+    :return: ValidationReport object
+    """
+    report = ValidationReport()
+
+    def asList(value: Any) -> List:
+        if value is None:
+            return []
+        return list(value) if isinstance(value, (list, tuple)) else [value]
+
+    statisticIdSet = set(parser.shipStatisticDict)
+    strengthenIdSet = set(parser.shipStrengthenDict)
+    groupIdSet = {str(groupDict["group_type"]) for groupDict in parser.shipGroupDict.values()}
+    skillDataIdSet = set(parser.skillDataDict)
+    refitNodeIdSet = set(parser.refitDataDict)
+    researchNodeIdSet = set(parser.researchStrengthenDict)
+    weaponIdSet = set(parser.weaponDataDict)
+    barrageIdSet = set(parser.barrageDataDict)
+    aircraftIdSet = set(parser.aircraftDataDict)
+    projectileIdSet = set(parser.bulletDataDict) | aircraftIdSet
+    attrNameSet = {attrDict["name"] for attrDict in parser.attrDict.values()}
+    buffFileIdSet = {str(buffId) for buffId in parser.getGameConfigIdList("buff")}
+    skillFileIdSet = {str(skillId) for skillId in parser.getGameConfigIdList("skill")}
+
+    for shipId, dataDict in parser.shipDataDict.items():
+        report.check([shipId], statisticIdSet, "ship_data_template", shipId, "id", "ship_data_statistics")
+        report.check([dataDict["strengthen_id"]], strengthenIdSet, "ship_data_template", shipId, "strengthen_id",
+                     "ship_data_strengthen")
+        report.check([dataDict["group_type"]], groupIdSet, "ship_data_template", shipId, "group_type",
+                     "ship_data_group")
+        report.check(dataDict["buff_list_display"], skillDataIdSet, "ship_data_template", shipId, "buff_list_display",
+                     "skill_data_template")
+
+    for groupId in parser.fleetTechDict:
+        report.check([groupId], groupIdSet, "fleet_tech_ship_template", groupId, "id", "ship_data_group")
+    for groupId, refitDict in parser.shipRefitDict.items():
+        report.check([groupId], groupIdSet, "ship_data_trans", groupId, "id", "ship_data_group")
+        report.check([nodeData[1] for colData in refitDict["transform_list"] for nodeData in colData], refitNodeIdSet,
+                     "ship_data_trans", groupId, "transform_list", "transform_data_template")
+    for groupId, researchDict in parser.shipResearchDict.items():
+        for field in ["strengthen_effect", "fate_strengthen"]:
+            report.check(researchDict[field], researchNodeIdSet, "ship_data_blueprint", groupId, field,
+                         "ship_strengthen_blueprint")
+    for nodeId, effectData in parser.researchStrengthenDict.items():
+        report.check([attrBonus[0] for attrBonus in effectData["effect_attr"]], attrNameSet,
+                     "ship_strengthen_blueprint", nodeId, "effect_attr", "attribute_info_by_type")
+
+    for weaponId, weaponData in parser.weaponDataDict.items():
+        report.check(asList(weaponData.get("base")), weaponIdSet, "weapon_property", weaponId, "base",
+                     "weapon_property")
+        report.check(asList(weaponData.get("barrage_ID")), barrageIdSet, "weapon_property", weaponId, "barrage_ID",
+                     "barrage_template")
+        report.check(asList(weaponData.get("bullet_ID")), projectileIdSet, "weapon_property", weaponId, "bullet_ID",
+                     "bullet_template/aircraft_template")
+    for aircraftId, aircraftData in parser.aircraftDataDict.items():
+        report.check(asList(aircraftData.get("base")), aircraftIdSet, "aircraft_template", aircraftId, "base",
+                     "aircraft_template")
+        report.check(asList(aircraftData.get("weapon_ID")), weaponIdSet, "aircraft_template", aircraftId, "weapon_ID",
+                     "weapon_property")
+
+    for skillId in parser.skillDataDict:
+        report.check([skillId], buffFileIdSet, "skill_data_template", skillId, "id", "gamecfg/buff")
+
+    if includeGameConfig:
+        kindIdSetDict = {"buff": (buffFileIdSet, "gamecfg/buff"), "skill": (skillFileIdSet, "gamecfg/skill"),
+                         "weapon": (weaponIdSet, "weapon_property")}
+        for configType, idSet, loader in [("buff", buffFileIdSet, parser.loadBuff),
+                                          ("skill", skillFileIdSet, parser.loadSkill)]:
+            for configId in sorted(idSet, key=int):
+                for kind, referencedId in getEffectReferences(loader(int(configId))):
+                    targetIdSet, targetTable = kindIdSetDict[kind]
+                    report.check([referencedId], targetIdSet, "gamecfg/" + configType, configId, "effect_list",
+                                 targetTable)
+    return report
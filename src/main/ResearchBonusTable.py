@@ -0,0 +1,103 @@
+from typing import List, Callable
+from .ResearchStrengthenNode import ResearchStrengthenNode
+
+
+class ResearchBonusTable:
+    """
+    ResearchBonusTable stores the cumulative bonuses of a research ship's strengthen nodes. Every row is indexed by
+    dev level (or fate simulation stage) so a bonus at any point of a research line is a single lookup.
+    """
+
+    def __init__(self, researchNodeList: List[ResearchStrengthenNode], fateSimNodeList: List[ResearchStrengthenNode]):
+        """
+        Constructor of ResearchBonusTable class
+
+        :param researchNodeList: list of ResearchStrengthenNode, the dev level nodes of the research ship
+        :param fateSimNodeList: list of ResearchStrengthenNode, the fate simulation nodes in unlocking order
+        """
+        self.maxDevLevel = max([node.devLevel for node in researchNodeList], default=0)
+        self.maxFateSimStage = len(fateSimNodeList)
+
+        def genTable(width: int, getBonus: Callable[[ResearchStrengthenNode, int], float]):
+            # nodes unlocked at the same dev level are summed into the same row
+            deltaRows = [[0] * width for _ in range(0, self.maxDevLevel + 1)]
+            for node in researchNodeList:
+                for index in range(0, width):
+                    deltaRows[node.devLevel][index] += getBonus(node, index + 1)
+            devRows = [deltaRows[0]]
+            for deltaRow in deltaRows[1:]:
+                devRows.append([x + y for x, y in zip(devRows[-1], deltaRow)])
+            fateRows = [devRows[-1]]
+            for node in fateSimNodeList:
+                fateRows.append([x + getBonus(node, index + 1) for x, index in zip(fateRows[-1], range(0, width))])
+            return devRows, fateRows
+
+        self.statTable, self.fateSimStatTable = genTable(12, ResearchStrengthenNode.getStatBonus)
+        self.proficiencyTable, self.fateSimProficiencyTable = \
+            genTable(4, ResearchStrengthenNode.getEquipProficiencyBonus)
+        self.preloadTable, self.fateSimPreloadTable = genTable(3, ResearchStrengthenNode.getPreloadBonus)
+
+    def getRow(self, devTable: List[List[float]], fateSimTable: List[List[float]], devLevel: int,
+               fateSimStage: int) -> List[float]:
+        """
+        Picks the row of a certain dev level or fate simulation stage
+
+        :param devTable: the table indexed by dev level
+        :param fateSimTable: the table indexed by fate simulation stage
+        :param devLevel: integer, range from 0 to maxDevLevel, the dev level
+        :param fateSimStage: integer, range from 0 to maxFateSimStage, 0 means no fate simulation stage unlocked
+        :return: list of bonus values, the row
+        """
+        if devLevel < 0 or devLevel > self.maxDevLevel:
+            raise ValueError("devLevel ({}) out of bound".format(devLevel))
+        elif fateSimStage < 0 or fateSimStage > self.maxFateSimStage:
+            raise ValueError("fateSimStage ({}) out of bound".format(fateSimStage))
+        elif fateSimStage != 0 and devLevel != self.maxDevLevel:
+            raise ValueError("Cannot unlock fate simulation without reaching max dev level")
+
+        if fateSimStage != 0:
+            return fateSimTable[fateSimStage]
+        else:
+            return devTable[devLevel]
+
+    def getStatBonus(self, statId: int, devLevel: int, fateSimStage: int = 0) -> int:
+        """
+        Gets the cumulative bonus of a certain stat
+
+        :param statId: integer, range from 1 to 12, the stat id
+        :param devLevel: integer, range from 0 to maxDevLevel, the dev level
+        :param fateSimStage: integer, range from 0 to maxFateSimStage, the fate simulation stage
+        :return: integer, the bonus value
+        """
+        return self.getRow(self.statTable, self.fateSimStatTable, devLevel, fateSimStage)[statId - 1]
+
+    def getEquipProficiencyBonus(self, equipSlot: int, devLevel: int, fateSimStage: int = 0) -> float:
+        """
+        Gets the cumulative equipment proficiency bonus of a certain slot
+
+        :param equipSlot: integer, range from 1 to 4, the equipment slot
+        :param devLevel: integer, range from 0 to maxDevLevel, the dev level
+        :param fateSimStage: integer, range from 0 to maxFateSimStage, the fate simulation stage
+        :return: float, the bonus value
+        """
+        return self.getRow(self.proficiencyTable, self.fateSimProficiencyTable, devLevel, fateSimStage)[equipSlot - 1]
+
+    def getPreloadBonus(self, equipSlot: int, devLevel: int, fateSimStage: int = 0) -> int:
+        """
+        Gets the cumulative equipment preload bonus of a certain slot
+
+        :param equipSlot: integer, range from 1 to 3, the equipment slot
+        :param devLevel: integer, range from 0 to maxDevLevel, the dev level
+        :param fateSimStage: integer, range from 0 to maxFateSimStage, the fate simulation stage
+        :return: integer, the bonus value
+        """
+        return self.getRow(self.preloadTable, self.fateSimPreloadTable, devLevel, fateSimStage)[equipSlot - 1]
+
+    def getStatBonusList(self, statId: int) -> List[int]:
+        """
+        Gets the cumulative bonus of a certain stat across all dev levels
+
+        :param statId: integer, range from 1 to 12, the stat id
+        :return: list of integers, the i-th element is the bonus at dev level i
+        """
+        return [row[statId - 1] for row in self.statTable]
@@ -29,3 +29,9 @@ class ResearchStrengthenNode:
             return 0
         else:
             return self.proficiencyBonus[1] if self.proficiencyBonus[0] == slotId else 0
+
+    def getPreloadBonus(self, slotId: int) -> int:
+        if len(self.preloadList) == 0:
+            return 0
+        else:
+            return self.preloadList[1] if self.preloadList[0] == slotId else 0
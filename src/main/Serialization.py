@@ -0,0 +1,23 @@
+from typing import Any
+
+
+def toJsonable(obj: Any) -> Any:
+    """
+    Converts a model object (Ship, MetaShip, Weapon, RootBuff etc.) to json-like data. Attributes are converted
+    recursively, dict keys become strings and sets become sorted lists
+
+    :param obj: any object
+    :return: json-like data
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    elif isinstance(obj, dict):
+        return {str(key): toJsonable(value) for key, value in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [toJsonable(value) for value in obj]
+    elif isinstance(obj, (set, frozenset)):
+        return sorted(toJsonable(value) for value in obj)
+    elif hasattr(obj, "__dict__"):
+        return {key: toJsonable(value) for key, value in vars(obj).items()}
+    else:
+        return str(obj)
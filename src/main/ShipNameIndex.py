@@ -0,0 +1,223 @@
+import re
+from bisect import insort
+from typing import Dict, List, Set, Tuple, Optional
+from .Utility import isKagaBB
+
+# the number of best completions stored in every trie node, complete answers larger limits by walking the subtree
+trieTopSize = 32
+
+
+def normalizeName(name: str) -> str:
+    """
+    Normalizes a ship name for lookups: lower case and single spaces
+
+    :param name: string, the name
+    :return: string, the normalized name
+    """
+    return " ".join(name.lower().split())
+
+
+def getNGrams(text: str, n: int = 3) -> Set[str]:
+    padded = " " + text + " "
+    return {padded[index:index + n] for index in range(0, len(padded) - n + 1)}
+
+
+def getEditDistance(first: str, second: str, maxDistance: int) -> int:
+    """
+    Calculates the Levenshtein distance of two strings, stops early once it exceeds maxDistance
+
+    :param first: string
+    :param second: string
+    :param maxDistance: integer, the largest distance of interest
+    :return: integer, the distance, maxDistance + 1 if it is larger than maxDistance
+    """
+    if abs(len(first) - len(second)) > maxDistance:
+        return maxDistance + 1
+    previousRow = list(range(0, len(second) + 1))
+    for row, firstChar in enumerate(first, 1):
+        currentRow = [row]
+        for column, secondChar in enumerate(second, 1):
+            currentRow.append(min(previousRow[column] + 1, currentRow[column - 1] + 1,
+                                  previousRow[column - 1] + (firstChar != secondChar)))
+        if min(currentRow) > maxDistance:
+            return maxDistance + 1
+        previousRow = currentRow
+    return previousRow[-1]
+
+
+class TrieNode:
+    """
+    TrieNode is a node of the prefix trie of ShipNameIndex
+    """
+
+    __slots__ = ("children", "keySet", "topKeys")
+
+    def __init__(self):
+        self.children: Dict[str, "TrieNode"] = {}
+        self.keySet: Set[str] = set()  # names whose word ends at this node
+        # the trieTopSize shortest names in this subtree as (length, name), sorted
+        self.topKeys: List[Tuple[int, str]] = []
+
+    def addTopKey(self, key: str):
+        entry = (len(key), key)
+        if entry in self.topKeys or (len(self.topKeys) >= trieTopSize and entry > self.topKeys[-1]):
+            return
+        insort(self.topKeys, entry)
+        del self.topKeys[trieTopSize:]
+
+
+class ShipNameIndex:
+    """
+    ShipNameIndex maps ship names to meta ids and ship ids. It is built once from ship_data_statistics and
+    ship_data_group and answers exact, prefix (trie) and typo tolerant (trigram candidates ranked by edit distance)
+    queries on composed names, localized names, prefixed and unprefixed english names and aliases.
+    """
+
+    def __init__(self, shipIdList: List[int], shipStatisticDict: Dict[str, Dict], shipDataDict: Dict[str, Dict],
+                 shipGroupDict: Dict[str, Dict]):
+        """
+        Constructor of ShipNameIndex class
+
+        :param shipIdList: list of integers, the collectable ship ids
+        :param shipStatisticDict: the ship_data_statistics table
+        :param shipDataDict: the ship_data_template table
+        :param shipGroupDict: the ship_data_group table
+        """
+        groupIdToMetaId = {groupDict["group_type"]: groupDict["code"] for groupDict in shipGroupDict.values()}
+        self.displayNames: Dict[str, str] = {}  # normalized name -> name as written in game data
+        self.nameToShipIds: Dict[str, Set[int]] = {}
+        self.nameToMetaIds: Dict[str, Set[int]] = {}
+        self.trie = TrieNode()
+        self.nGramIndex: Dict[str, Set[str]] = {}
+
+        for shipId in sorted(shipIdList):
+            statDict = shipStatisticDict[str(shipId)]
+            metaId = groupIdToMetaId.get(shipDataDict[str(shipId)]["group_type"])
+            kagaBB = " BB" if isKagaBB(shipId) else ""
+            englishName = statDict["english_name"]
+            nameList = [statDict["name"] + kagaBB + " (" + englishName + ")", statDict["name"] + kagaBB,
+                        englishName + kagaBB]
+            # prefixed english names such as "USS Cassin" can also be found without the prefix
+            englishWords = englishName.split()
+            if len(englishWords) > 1 and re.fullmatch(r"[A-Z]{2,5}", englishWords[0]):
+                nameList.append(" ".join(englishWords[1:]) + kagaBB)
+            for name in nameList:
+                self.addName(name, metaId, [shipId])
+
+    def addName(self, name: str, metaId: Optional[int], shipIdList: List[int]):
+        """
+        Adds a name of some ships to the index
+
+        :param name: string, the name
+        :param metaId: integer or None, the meta id of those ships
+        :param shipIdList: list of integers, the ship ids
+        """
+        key = normalizeName(name)
+        if not key:
+            return
+        if key not in self.displayNames:
+            self.displayNames[key] = name
+            self.nameToShipIds[key] = set()
+            self.nameToMetaIds[key] = set()
+            # every word start is a trie entry so "cass" finds "uss cassin"
+            for start in [0] + [match.end() for match in re.finditer(r"[\s(]+", key)]:
+                node = self.trie
+                node.addTopKey(key)
+                for char in key[start:]:
+                    node = node.children.setdefault(char, TrieNode())
+                    node.addTopKey(key)
+                node.keySet.add(key)
+            for nGram in getNGrams(key):
+                self.nGramIndex.setdefault(nGram, set()).add(key)
+        self.nameToShipIds[key].update(shipIdList)
+        if metaId is not None:
+            self.nameToMetaIds[key].add(metaId)
+
+    def addAlias(self, alias: str, name: str):
+        """
+        Adds a nickname that resolves to the same ships as an indexed name
+
+        :param alias: string, the nickname, for example "Bel"
+        :param name: string, an indexed name, for example "Belfast"
+        """
+        key = normalizeName(name)
+        metaIdList = sorted(self.nameToMetaIds[key])
+        for metaId in metaIdList or [None]:
+            self.addName(alias, metaId, sorted(self.nameToShipIds[key]))
+
+    def lookup(self, name: str) -> Tuple[List[int], List[int]]:
+        """
+        Looks up a name exactly (case and spacing insensitive)
+
+        :param name: string, the name
+        :return: tuple of sorted meta ids and sorted ship ids, both empty if the name is unknown
+        """
+        key = normalizeName(name)
+        return sorted(self.nameToMetaIds.get(key, [])), sorted(self.nameToShipIds.get(key, []))
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Gets names that have a word starting with prefix, shorter names first. Up to trieTopSize names are read from
+        the precomputed list of the prefix node, only larger limits walk its subtree
+
+        :param prefix: string, the typed prefix
+        :param limit: integer, the maximum number of names
+        :return: list of names
+        """
+        node = self.trie
+        for char in normalizeName(prefix):
+            if char not in node.children:
+                return []
+            node = node.children[char]
+        if limit <= trieTopSize:
+            return [self.displayNames[key] for _, key in node.topKeys[:limit]]
+        keySet = set()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            keySet.update(node.keySet)
+            stack.extend(node.children.values())
+        return [self.displayNames[key] for key in sorted(keySet, key=lambda x: (len(x), x))[:limit]]
+
+    def fuzzySearch(self, query: str, limit: int = 10, maxDistance: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Gets names close to query, candidates sharing the most trigrams are ranked by edit distance
+
+        :param query: string, the possibly misspelled name
+        :param limit: integer, the maximum number of names
+        :param maxDistance: integer or None, the largest accepted edit distance, None means 1 for short queries and 2
+                            otherwise
+        :return: list of tuples (name, edit distance), closest first
+        """
+        key = normalizeName(query)
+        if maxDistance is None:
+            maxDistance = 1 if len(key) <= 5 else 2
+        candidateCounts: Dict[str, int] = {}
+        for nGram in getNGrams(key):
+            for candidate in self.nGramIndex.get(nGram, []):
+                candidateCounts[candidate] = candidateCounts.get(candidate, 0) + 1
+        candidateList = sorted(candidateCounts, key=lambda x: -candidateCounts[x])[:max(limit * 10, 50)]
+
+        result = []
+        for candidate in candidateList:
+            distance = getEditDistance(key, candidate, maxDistance)
+            if distance <= maxDistance:
+                result.append((candidate, distance))
+        result.sort(key=lambda x: (x[1], len(x[0]), x[0]))
+        return [(self.displayNames[candidate], distance) for candidate, distance in result[:limit]]
+
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Gets names for autocompletion: the exact match, then prefix matches, then fuzzy matches
+
+        :param query: string, the query
+        :param limit: integer, the maximum number of names
+        :return: list of names, use lookup to resolve them to ids
+        """
+        result = []
+        if normalizeName(query) in self.displayNames:
+            result.append(self.displayNames[normalizeName(query)])
+        for name in self.complete(query, limit) + [name for name, _ in self.fuzzySearch(query, limit)]:
+            if name not in result:
+                result.append(name)
+        return result[:limit]
@@ -1,5 +1,6 @@
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 from .Utility import isKagaBB
+from .HuntingRange import HuntingRangeGrid
 
 
 class Ship:
@@ -140,6 +141,15 @@ class Ship:
         """
         return self.equipBaseList[equipSlot - 1]
 
+    def getEquipPreload(self, equipSlot: int) -> int:
+        """
+        get the equipment preload count of a certain slot
+
+        :param equipSlot: the specific slot, integer, range from 1 - 3, 1 is the first weapon
+        :return: the preload count, integer
+        """
+        return self.equipPreloadList[equipSlot - 1]
+
     def getSkillList(self) -> List[int]:
         """
         get the skill list of this ship
@@ -182,7 +192,8 @@ class SurfaceShip(Ship):
 
 
 class Submarine(Ship):
-    def __init__(self, statDict: dict, dataDict: dict, shipStrengthenDict: dict):
+    def __init__(self, statDict: dict, dataDict: dict, shipStrengthenDict: dict,
+                 huntingRangeGrid: Optional[HuntingRangeGrid] = None):
         super(Submarine, self).__init__(statDict, dataDict, shipStrengthenDict)
         self.isSubmarine = True
         self.isSurfaceShip = False
@@ -193,6 +204,9 @@ class Submarine(Ship):
         self.surfaceDuration = statDict["attack_duration"]
         self.huntingRangeLevel = statDict["huntingrange_level"]
         self.huntingRange = statDict["hunting_range"]
+        if huntingRangeGrid is None:
+            huntingRangeGrid = HuntingRangeGrid(self.huntingRange, self.huntingRangeLevel)
+        self.huntingRangeGrid = huntingRangeGrid
 
     def getOxygen(self) -> int:
         """
@@ -226,14 +240,7 @@ class Submarine(Ship):
                  " " means this coordinate is not in range, the values are stored in string for easier wikicode
                  generation
         """
-        withIndex = zip(self.huntingRange, range(1, 10))
-        levelList = [[" " for i in range(0, 7)] for j in range(0, 7)]
-        for subLevel in withIndex:
-            huntingRange, level = subLevel
-            for coord in huntingRange:
-                levelList[coord[0] - 4][coord[1] - 4] = str(level)
-        levelList[3][3] = "x"
-        return levelList
+        return self.huntingRangeGrid.getLevelGrid()
 
     def getHuntingRangeLevel(self) -> int:
         """
@@ -242,3 +249,11 @@ class Submarine(Ship):
         :return: hunting range level, integer
         """
         return self.huntingRangeLevel
+
+    def getHuntingRangeGrid(self) -> HuntingRangeGrid:
+        """
+        get the hunting range of this ship as bitmasks per hunting level, see HuntingRangeGrid
+
+        :return: HuntingRangeGrid object
+        """
+        return self.huntingRangeGrid
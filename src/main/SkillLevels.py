@@ -0,0 +1,130 @@
+from typing import Dict, List, Tuple, Hashable, Any
+from .ConfigParser import ConfigParser
+from .Triggerable import RootBuff, Skill, Buff, effectReferenceDict, substituteDescription
+from .Weapons import Weapon
+
+
+class LevelSharingParser:
+    """
+    LevelSharingParser stands in for a ConfigParser while the skill trees of all levels are built. Every gamecfg file
+    and weapon is loaded once, and a Buff or Skill is built once for all levels whose subtree uses the same effect
+    lists. Shared nodes keep the level they were first built at.
+    """
+
+    def __init__(self, parser: ConfigParser):
+        self.parser = parser
+        self.configMemo: Dict[Tuple[str, int], Dict] = {}
+        self.signatureMemo: Dict[Tuple[str, int, int], Hashable] = {}
+        self.nodeMemo: Dict[Hashable, Any] = {}
+        self.weaponMemo: Dict[int, Weapon] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.parser, name)
+
+    def loadBuff(self, buffId: int) -> Dict:
+        if ("buff", buffId) not in self.configMemo:
+            self.configMemo[("buff", buffId)] = self.parser.loadBuff(buffId)
+        return self.configMemo[("buff", buffId)]
+
+    def loadSkill(self, skillId: int) -> Dict:
+        if ("skill", skillId) not in self.configMemo:
+            self.configMemo[("skill", skillId)] = self.parser.loadSkill(skillId)
+        return self.configMemo[("skill", skillId)]
+
+    def getSignature(self, kind: str, configId: int, level: int) -> Hashable:
+        """
+        Describes which effect lists the subtree of a node uses at a level, equal signatures mean equal subtrees
+
+        :param kind: string, "buff" or "skill"
+        :param configId: integer, the id of that node
+        :param level: integer, the level
+        :return: hashable signature
+        """
+        key = (kind, configId, level)
+        if key not in self.signatureMemo:
+            data = self.loadBuff(configId) if kind == "buff" else self.loadSkill(configId)
+            if str(level) in data and "effect_list" in data[str(level)]:
+                effectListKey = level
+                effectList = data[str(level)]["effect_list"]
+            else:
+                effectListKey = None
+                effectList = data["effect_list"]
+            childSignatureList = []
+            for effect in effectList:
+                if effect["type"] not in effectReferenceDict:
+                    continue
+                argName, childKind = effectReferenceDict[effect["type"]]
+                if childKind == "weapon":
+                    continue
+                argValue = effect["arg_list"][argName]
+                for childId in (argValue if isinstance(argValue, list) else [argValue]):
+                    childSignatureList.append(self.getSignature(childKind, childId, level))
+            self.signatureMemo[key] = (kind, configId, effectListKey, tuple(childSignatureList))
+        return self.signatureMemo[key]
+
+    def getBuff(self, buffId: int, buffLevel: int) -> Buff:
+        signature = self.getSignature("buff", buffId, buffLevel)
+        if signature not in self.nodeMemo:
+            self.nodeMemo[signature] = Buff(self.loadBuff(buffId), buffLevel, self)
+        return self.nodeMemo[signature]
+
+    def getSkill(self, skillId: int, skillLevel: int) -> Skill:
+        signature = self.getSignature("skill", skillId, skillLevel)
+        if signature not in self.nodeMemo:
+            self.nodeMemo[signature] = Skill(self.loadSkill(skillId), skillLevel, self)
+        return self.nodeMemo[signature]
+
+    def getWeapon(self, weaponId: int) -> Weapon:
+        if weaponId not in self.weaponMemo:
+            self.weaponMemo[weaponId] = self.parser.getWeapon(weaponId)
+        return self.weaponMemo[weaponId]
+
+
+class SkillLevels:
+    """
+    SkillLevels holds a displayed skill at every level, built in one pass: files, weapons and subtrees that do not
+    change between levels are shared. Every level is a RootBuff view with its fully substituted description.
+    """
+
+    def __init__(self, parser: ConfigParser, buffId: int):
+        """
+        Constructor of SkillLevels class
+
+        :param parser: the ConfigParser of the dataset
+        :param buffId: integer, the id of the displayed skill
+        """
+        sharingParser = LevelSharingParser(parser)
+        skillData = parser.skillDataDict[str(buffId)]
+        self.id = buffId
+        self.maxLevel = skillData["max_level"]
+        self.rootBuffs = {level: RootBuff(sharingParser.loadBuff(buffId), skillData, sharingParser, level)
+                          for level in range(1, self.maxLevel + 1)}
+        self.summaryDescription = substituteDescription(skillData["desc"], skillData["desc_add"], self.maxLevel)
+        self.nodeCount = len(sharingParser.nodeMemo)
+
+    def getLevel(self, level: int) -> RootBuff:
+        """
+        Gets the view of a level
+
+        :param level: integer, range from 1 to maxLevel
+        :return: RootBuff object
+        """
+        if level < 1 or level > self.maxLevel:
+            raise ValueError("level ({}) out of bound".format(level))
+        return self.rootBuffs[level]
+
+    def getDescriptionList(self) -> List[str]:
+        """
+        Gets the substituted description of every level
+
+        :return: list of strings, the i-th element is the description at level i + 1
+        """
+        return [self.rootBuffs[level].getDescription() for level in range(1, self.maxLevel + 1)]
+
+    def getWeaponListByLevel(self) -> List[List[Weapon]]:
+        """
+        Gets the weapons of every level
+
+        :return: list of lists of weapons, the i-th element is the weapon list at level i + 1
+        """
+        return [self.rootBuffs[level].getWeaponList() for level in range(1, self.maxLevel + 1)]
@@ -0,0 +1,154 @@
+import re
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple, Any
+from .Utility import removeHtmlTag, getContentHash
+
+# weight of a token occurrence in each field of skill_data_template
+fieldWeightDict = {"name": 3, "desc": 1, "desc_get": 1, "desc_add": 1}
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits a skill text into lower case tokens, html tags and description placeholders ($1, $2 ...) are removed
+
+    :param text: string, the text
+    :return: list of tokens
+    """
+    return re.findall(r"\w+", re.sub(r"\$\d+", " ", removeHtmlTag(text)).lower())
+
+
+def genSkillTokenScores(skillData: Dict[str, Any]) -> Dict[str, int]:
+    """
+    Calculates the weighted token counts of a skill
+
+    :param skillData: dict, the record of that skill in skill_data_template
+    :return: a dict, keys are tokens, values are scores
+    """
+    tokenScores = {}
+
+    def addText(text: str, weight: int):
+        for token in tokenize(text):
+            tokenScores[token] = tokenScores.get(token, 0) + weight
+
+    for fieldName, weight in fieldWeightDict.items():
+        value = skillData.get(fieldName)
+        if isinstance(value, str):
+            addText(value, weight)
+        elif value is not None:
+            # desc_add is a list (per placeholder) of lists (per level) of parameter lists
+            for paramList in value:
+                for levelParam in paramList:
+                    for param in levelParam:
+                        addText(str(param), weight)
+    return tokenScores
+
+
+class SkillSearchIndex:
+    """
+    SkillSearchIndex is an inverted index over the texts of skill_data_template (name, desc, desc_get and desc_add). It
+    supports token and prefix queries and can be updated incrementally when the data changes.
+    """
+
+    def __init__(self, skillDataDict: Dict[str, Dict[str, Any]]):
+        """
+        Constructor of SkillSearchIndex class
+
+        :param skillDataDict: the skill_data_template table
+        """
+        self.postings: Dict[str, Dict[int, int]] = {}  # token -> {skill id: score}
+        self.sortedTokens: List[str] = []
+        self.skillTokenScores: Dict[int, Dict[str, int]] = {}
+        self.skillHashes: Dict[int, str] = {}
+        self.update(skillDataDict)
+
+    def addSkill(self, skillId: int, tokenScores: Dict[str, int]):
+        """
+        Adds the tokens of a skill to the postings
+
+        :param skillId: integer, the skill id
+        :param tokenScores: dict, the weighted token counts of that skill
+        """
+        self.skillTokenScores[skillId] = tokenScores
+        for token, score in tokenScores.items():
+            if token not in self.postings:
+                self.postings[token] = {}
+                insort(self.sortedTokens, token)
+            self.postings[token][skillId] = score
+
+    def removeSkill(self, skillId: int):
+        """
+        Removes a skill from the postings, tokens that no skill has anymore are dropped
+
+        :param skillId: integer, the skill id
+        """
+        for token in self.skillTokenScores.pop(skillId):
+            del self.postings[token][skillId]
+            if len(self.postings[token]) == 0:
+                del self.postings[token]
+                del self.sortedTokens[bisect_left(self.sortedTokens, token)]
+        del self.skillHashes[skillId]
+
+    def update(self, skillDataDict: Dict[str, Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Brings the index up to date with a skill table, only added, changed and removed skills are reindexed
+
+        :param skillDataDict: the skill_data_template table
+        :return: tuple of integers, (reindexed skills, removed skills)
+        """
+        reindexedCount = 0
+        skillIdSet = set()
+        for skillId, skillData in skillDataDict.items():
+            skillId = int(skillId)
+            skillIdSet.add(skillId)
+            contentHash = getContentHash(skillData)
+            if self.skillHashes.get(skillId) == contentHash:
+                continue
+            if skillId in self.skillHashes:
+                self.removeSkill(skillId)
+            self.addSkill(skillId, genSkillTokenScores(skillData))
+            self.skillHashes[skillId] = contentHash
+            reindexedCount += 1
+
+        removedIdList = [skillId for skillId in self.skillHashes if skillId not in skillIdSet]
+        for skillId in removedIdList:
+            self.removeSkill(skillId)
+        return reindexedCount, len(removedIdList)
+
+    def getTokensWithPrefix(self, prefix: str) -> List[str]:
+        """
+        Gets all indexed tokens that start with prefix
+
+        :param prefix: string, lower case
+        :return: list of tokens
+        """
+        result = []
+        for position in range(bisect_left(self.sortedTokens, prefix), len(self.sortedTokens)):
+            if not self.sortedTokens[position].startswith(prefix):
+                break
+            result.append(self.sortedTokens[position])
+        return result
+
+    def search(self, query: str, prefix: bool = True, limit: int = 0) -> List[Tuple[int, int]]:
+        """
+        Searches skills by text. Skills matching more query tokens rank first, then skills with higher scores
+
+        :param query: string, the query text, for example "torpedo reload"
+        :param prefix: boolean, whether query tokens also match indexed tokens they are a prefix of
+        :param limit: integer, the maximum number of results, 0 means no limit
+        :return: list of tuples (skill id, score), best match first
+        """
+        matchCounts: Dict[int, int] = {}
+        scores: Dict[int, int] = {}
+        for queryToken in set(tokenize(query)):
+            tokenList = self.getTokensWithPrefix(queryToken) if prefix else \
+                ([queryToken] if queryToken in self.postings else [])
+            matchedIdSet = set()
+            for token in tokenList:
+                for skillId, score in self.postings[token].items():
+                    scores[skillId] = scores.get(skillId, 0) + score
+                    matchedIdSet.add(skillId)
+            for skillId in matchedIdSet:
+                matchCounts[skillId] = matchCounts.get(skillId, 0) + 1
+
+        result = sorted(scores.items(), key=lambda x: (-matchCounts[x[0]], -x[1], x[0]))
+        return result[:limit] if limit > 0 else result
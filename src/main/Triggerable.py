@@ -4,6 +4,59 @@ from re import sub
 from .ConfigParser import ConfigParser
 from .Weapons import Weapon
 
+# maps the effect types that reference other game objects to (argument name, referenced kind), the argument is either
+# an id or a list of ids. Kinds are "buff" and "skill" (gamecfg files) and "weapon" (weapon_property)
+effectReferenceDict = {
+    "BattleSkillAddBuff": ("buff_id", "buff"),
+    "BattleSkillFire": ("weapon_id", "weapon"),
+    "BattleBuffAddBuff": ("buff_id", "buff"),
+    "BattleBuffCastSkill": ("skill_id", "skill"),
+    "BattleBuffCastSkillRandom": ("skill_id_list", "skill"),
+}
+
+
+def getEffectReferences(data: Dict) -> List[Tuple[str, int]]:
+    """
+    Gets every object referenced by the effect lists of a skill or buff config, at every level
+
+    :param data: dict, the gamecfg skill or buff config
+    :return: list of tuples (referenced kind, referenced id) without duplicates, see effectReferenceDict
+    """
+    effectListList = [data.get("effect_list", [])] + [levelData["effect_list"] for key, levelData in data.items()
+                                                      if key.isdigit() and isinstance(levelData, dict)
+                                                      and "effect_list" in levelData]
+    result = []
+    for effectList in effectListList:
+        for effect in effectList:
+            if effect.get("type") not in effectReferenceDict:
+                continue
+            argName, kind = effectReferenceDict[effect["type"]]
+            argValue = effect.get("arg_list", {}).get(argName)
+            for referencedId in (argValue if isinstance(argValue, list) else [argValue]):
+                if referencedId is not None and (kind, referencedId) not in result:
+                    result.append((kind, referencedId))
+    return result
+
+
+def substituteDescription(desc: str, descAdd: List, maxLevel: int, level: Optional[int] = None) -> str:
+    """
+    Substitutes the parameters ($1, $2 ...) of a skill description
+
+    :param desc: string, the description with placeholders
+    :param descAdd: list, the desc_add field, parameters of every placeholder at every level
+    :param maxLevel: integer, the max level of that skill
+    :param level: integer or None, the skill level, None means "min (max)" values
+    :return: string, the substituted description
+    """
+    withIndex = zip(descAdd, range(1, 10))
+    for paramList, index in withIndex:
+        if level is None:
+            value = "{} ({})".format(paramList[0][0], paramList[maxLevel - 1][0])
+        else:
+            value = "{}".format(paramList[level - 1][0])
+        desc = sub(r"\${}".format(index), value, desc)
+    return desc
+
 
 class Triggerable:
     """
@@ -138,19 +191,22 @@ class RootBuff(Buff):
     RootBuffs are the root nodes of skill trees. They represents the visible skills in-game.
     """
 
-    def __init__(self, buffData: Dict, skillData: Dict, parser: ConfigParser):
+    def __init__(self, buffData: Dict, skillData: Dict, parser: ConfigParser, level: Optional[int] = None):
+        """
+        Constructor of RootBuff class
+
+        :param buffData: dict, the gamecfg buff config
+        :param skillData: dict, the record of this skill in skill_data_template
+        :param parser: the parser that calls this constructor
+        :param level: integer or None, the skill level. None means max level with a "min (max)" description
+        """
         self.maxLevel = skillData["max_level"]
-        super(RootBuff, self).__init__(buffData, self.maxLevel, parser)
-        desc = skillData["desc"]
+        super(RootBuff, self).__init__(buffData, self.maxLevel if level is None else level, parser)
         self.descriptionUponUnlocking = skillData["desc_get"]
-        descAdd = skillData["desc_add"]
-        withIndex = zip(descAdd, range(1, 10))
-        for paramList, index in withIndex:
-            desc = sub(r"\${}".format(index), "{} ({})".format(paramList[0][0], paramList[self.maxLevel - 1][0]), desc)
         self.name = skillData["name"]
         self.id = skillData["id"]
         self.type = skillData["type"]
-        self.description = desc
+        self.description = substituteDescription(skillData["desc"], skillData["desc_add"], self.maxLevel, level)
 
     def getType(self) -> int:
         """
@@ -1,4 +1,8 @@
 import re
+import sys
+import json
+import hashlib
+from typing import Any, Optional, Set, List, Iterable, Iterator
 
 
 def isFiltered(ID: int) -> bool:
@@ -33,3 +37,85 @@ def getMetaID(ID: int) -> int:
 
 def removeHtmlTag(code: str) -> str:
     return re.sub("<.*?>", "", code)
+
+
+def getContentHash(data: Any) -> str:
+    """
+    Calculates the hash of json-like data, equal data always have the same hash regardless of key order
+
+    :param data: json-like data (dict, list, string, number etc.)
+    :return: string, the hex digest
+    """
+    return hashlib.sha1(json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+                        .encode("utf-8")).hexdigest()
+
+
+def getDeepSize(data: Any, seen: Optional[Set[int]] = None) -> int:
+    """
+    Calculates the memory size of an object and everything it references, objects in seen are not counted again
+
+    :param data: any object, usually json-like data or a model object
+    :param seen: set of ids of objects that are already counted, it is updated in place
+    :return: integer, the size in bytes
+    """
+    if seen is None:
+        seen = set()
+    stack = [data]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(obj.__dict__)
+    return size
+
+
+def parseIdRange(idRange: str, maxCount: Optional[int] = None) -> List[int]:
+    """
+    Parses an id range such as "1-100,205,300-310"
+
+    :param idRange: string, comma separated ids or inclusive ranges
+    :param maxCount: integer or None, the largest number of ids allowed, checked before any range is expanded
+    :return: list of integers
+    """
+    boundList = []
+    for part in idRange.split(","):
+        if "-" in part:
+            start, end = part.split("-")
+            boundList.append((int(start), int(end)))
+        elif part:
+            boundList.append((int(part), int(part)))
+    if maxCount is not None and sum(max(end - start + 1, 0) for start, end in boundList) > maxCount:
+        raise ValueError("id range {} has more than {} ids".format(idRange, maxCount))
+    result = []
+    for start, end in boundList:
+        result += list(range(start, end + 1))
+    return result
+
+
+def chunked(iterable: Iterable, chunkSize: int) -> Iterator[List]:
+    """
+    Splits an iterable into lists of chunkSize elements, the last list may be shorter. Only one chunk is held at a time
+
+    :param iterable: any iterable
+    :param chunkSize: positive integer, the length of each chunk
+    :return: generator of lists
+    """
+    if chunkSize < 1:
+        raise ValueError("chunkSize must be positive, got {}".format(chunkSize))
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == chunkSize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -26,21 +26,19 @@ class Weapon:
             self.bullets = [parser.getBullet(bulletId) for bulletId in
                             weaponData.get("bullet_ID", [])] or self.base.bullets
         elif self.spawnType == "plane":
-            try:
-                self.bullets = [parser.getAircraft(bulletId) for bulletId in
-                                weaponData.get("bullet_ID", [])]
-            except KeyError:
-                try:
-                    self.bullets = [parser.getAircraft(self.id)]
-                except KeyError:
-                    self.bullets = self.base.bullets
+            if all(str(bulletId) in parser.aircraftDataDict for bulletId in weaponData.get("bullet_ID", [])):
+                self.bullets = [parser.getAircraft(bulletId) for bulletId in weaponData.get("bullet_ID", [])]
+            elif str(self.id) in parser.aircraftDataDict:
+                self.bullets = [parser.getAircraft(self.id)]
+            else:
+                self.bullets = self.base.bullets
         else:
             raise ValueError("unknown spawnType ({})".format(self.spawnType))
 
         self.bulletIdList = weaponData.get("bullet_ID") or self.base.bulletIdList
 
         self.sameBullet = all([self.bulletIdList[0] == bulletId for bulletId in self.bulletIdList])
-        self.barragesWithBullets = zip(self.barrages, self.bullets)
+        self.barragesWithBullets = list(zip(self.barrages, self.bullets))
 
         self.type = weaponData.get("type") or self.base.type
         self.damage = weaponData.get("damage") or self.base.damage
@@ -106,7 +104,7 @@ class Weapon:
         Calculates the sum of damage dealt to a certain armor type, considering both armor modifier and weapon
         coefficient but not the modifier stat
 
-        :param armorType: integer, range from 1-3, the armor type. 1 for light, 2 for medium and 3 for heavy
+        :param armorType: integer, range from 0-2, the armor type. 0 for light, 1 for medium and 2 for heavy
         :return: float, the total damage
         """
         if self.spawnType == "cannon" or self.spawnType == "torpedo":
@@ -116,7 +114,7 @@ class Weapon:
         elif self.spawnType == "plane":
             return sum([
                 barrage.getProjectileCount() * sum([
-                    weapon.getDamageSumByArmorType() for weapon in bullet.getWeapons()]) for
+                    weapon.getDamageSumByArmorType(armorType) for weapon in bullet.getWeapons()]) for
                 barrage, bullet in self.barragesWithBullets
             ]) * self.coefficient
         else:
@@ -165,7 +163,7 @@ class Weapon:
         """
         Gets the armor modifier against a certain armor type if all bullets are the same, else returns None
 
-        :param armorType: integer, range from 1-3, the armor type, see Bullets class for more info
+        :param armorType: integer, range from 0-2, the armor type, see Bullets class for more info
         :return: float or None, float represents the armor modifier and None means different bullets
         """
         if self.sameBullet:
@@ -186,12 +184,16 @@ class Aircraft:
             self.base = None
         self.name = weaponData.get("name") or self.base.name
 
-        self.type = weaponData.get("type") or self.base.type
-        self.maxHp = weaponData.get("max_hp") or self.base.maxHp
-        self.hpGrowth = weaponData.get("hp_growth") or self.base.hpGrowth  # hp = maxHp + (level - 1) * hpGrowth / 1000
-        self.crashDamage = weaponData.get("crash_DMG") or self.base.crashDamage
-        self.evaRate = weaponData.get("dodge") or self.base.evaRate
-        self.speed = weaponData.get("speed") or self.base.speed
+        def getStat(fieldName: str, attrName: str):
+            # 0 is a valid stat (no hp growth, no dodge), only missing fields are inherited from the base aircraft
+            return weaponData[fieldName] if fieldName in weaponData else getattr(self.base, attrName)
+
+        self.type = getStat("type", "type")
+        self.maxHp = getStat("max_hp", "maxHp")
+        self.hpGrowth = getStat("hp_growth", "hpGrowth")  # see getHp
+        self.crashDamage = getStat("crash_DMG", "crashDamage")
+        self.evaRate = getStat("dodge", "evaRate")
+        self.speed = getStat("speed", "speed")
         if "weapon_ID" in weaponData:
             self.weapons = [parser.getWeapon(weaponId) for weaponId in weaponData.get("weapon_ID")]
         else:
@@ -204,3 +206,22 @@ class Aircraft:
         :return: list of Weapon
         """
         return self.weapons
+
+    def getHp(self, level: int) -> float:
+        """
+        Calculates the hp of this aircraft at a certain level
+
+        :param level: integer, the level
+        :return: float, the hp, maxHp + (level - 1) * hpGrowth / 1000
+        """
+        return self.maxHp + (level - 1) * self.hpGrowth / 1000
+
+    def getOrdnanceDamageByArmorType(self, armorType: int) -> float:
+        """
+        Calculates the total damage of the weapons this aircraft is carrying against a certain armor type, see
+        Weapon.getDamageSumByArmorType
+
+        :param armorType: integer, range from 0-2, the armor type, see Bullets class for more info
+        :return: float, the total damage
+        """
+        return sum(weapon.getDamageSumByArmorType(armorType) for weapon in self.weapons)
@@ -0,0 +1,4 @@
+import sys
+from .CommandLine import main
+
+sys.exit(main())
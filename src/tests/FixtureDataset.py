@@ -0,0 +1,164 @@
+import os
+import json
+import random
+import tempfile
+import unittest
+from typing import Dict, Optional
+from main.ConfigParser import ConfigParser
+
+attrNameList = ["durability", "cannon", "torpedo", "antiaircraft", "air", "reload", "armor", "hit", "dodge", "speed",
+                "luck", "antisub"]
+
+# (groupId, metaId) of the meta ships: 2 (retrofit with a new ship), 5 (retrofit with a hull change, one filtered
+# ship), 7 (retrofit without a new ship), 20001 (research ship) and 9 (submarine)
+metaShipList = [(10101, 1), (10201, 2), (20101, 5), (30101, 7), (20301, 20001), (40101, 9)]
+
+
+def genTables() -> Dict[str, Dict]:
+    """
+    Generates the sharecfg tables of a small dataset that covers every kind of meta ship
+
+    :return: a dict, keys are table names, values are the tables
+    """
+    generator = random.Random(1)
+    tableDict = {configName: {} for configName in [
+        "ship_data_statistics", "ship_data_template", "attribute_info_by_type", "fleet_tech_ship_template",
+        "ship_data_group", "ship_data_trans", "transform_data_template", "ship_data_strengthen", "ship_data_blueprint",
+        "ship_strengthen_blueprint", "barrage_template", "bullet_template", "weapon_property", "skill_data_template",
+        "aircraft_template"]}
+
+    for statId, attrName in enumerate(attrNameList, 1):
+        tableDict["attribute_info_by_type"][str(statId)] = {"id": statId, "name": attrName}
+    for recordId in range(1, 6):
+        tableDict["barrage_template"][str(recordId)] = {
+            "id": recordId, "offset_z": 0, "delta_offset_z": 0, "offset_x": 0, "delta_offset_x": 0, "angle": 0,
+            "delta_angle": 0, "first_delay": 0, "delay": 0.1, "delta_delay": 0, "primal_repeat": recordId % 3,
+            "senior_delay": 0.2, "senior_repeat": recordId % 2, "random_angle": False, "offset_prioritise": False}
+        tableDict["bullet_template"][str(recordId)] = {
+            "id": recordId, "type": 1, "velocity": 10, "ammo_type": recordId % 4 + 1, "damage_type": [1, 0.8, 0.6],
+            "range": 50, "range_offset": 0, "pierce_count": 0, "extra_param": {}}
+    for weaponId in range(1, 11):
+        tableDict["weapon_property"][str(weaponId)] = {
+            "id": weaponId, "name": "Gun {}".format(weaponId), "spawn_bound": "cannon",
+            "barrage_ID": [weaponId % 5 + 1], "bullet_ID": [weaponId % 5 + 1], "type": 1, "damage": 10 + weaponId,
+            "attack_attribute": 2, "attack_attribute_ratio": 100, "reload_max": 1000 + weaponId, "range": 50,
+            "angle": 180, "corrected": 100}
+    tableDict["weapon_property"]["11"] = {"id": 11, "base": 3, "damage": 99}
+    tableDict["weapon_property"]["20"] = {
+        "id": 20, "name": "Plane W", "spawn_bound": "plane", "barrage_ID": [1], "bullet_ID": [30], "type": 2,
+        "damage": 1, "attack_attribute": 5, "attack_attribute_ratio": 80, "reload_max": 2000, "range": 90,
+        "angle": 360, "corrected": 100}
+    tableDict["aircraft_template"]["30"] = {"id": 30, "name": "Plane", "type": 1, "max_hp": 50, "hp_growth": 1200,
+                                            "crash_DMG": 40, "dodge": 10, "speed": 40, "weapon_ID": [1, 2]}
+    tableDict["aircraft_template"]["31"] = {"id": 31, "base": 30, "max_hp": 60}
+
+    for groupId, metaId in metaShipList:
+        hullType = 8 if metaId == 9 else 1
+        tableDict["ship_data_group"][str(metaId)] = {"code": metaId, "group_type": groupId, "type": hullType,
+                                                     "trans_type": 2 if metaId == 5 else hullType, "trans_skill": [],
+                                                     "nationality": 1}
+        shipIdList = [groupId * 10 + 1] if metaId in [1, 2] else [groupId * 10 + suffix for suffix in range(1, 5)]
+        if metaId == 5:
+            shipIdList.append(900005)  # filtered, see Utility.isFiltered
+        if metaId == 7:
+            shipIdList.append(3000007)  # the retrofit ship
+        for shipId in shipIdList:
+            tableDict["ship_data_statistics"][str(shipId)] = {
+                "id": shipId, "name": "Ship{}".format(metaId), "english_name": "USS Ship{}".format(metaId),
+                "attrs": [generator.randint(10, 1000) for _ in range(12)], "rarity": 5 if metaId > 20000 else 3,
+                "star": 5, "equipment_proficiency": [1.0, 1.15, 1.2, 1],
+                "attrs_growth": [generator.randint(0, 5000) for _ in range(12)],
+                "attrs_growth_extra": [generator.randint(0, 2000) for _ in range(12)], "type": hullType,
+                "depth_charge_list": [], "default_equip_list": [1, 2, 3], "preload_count": [0, 0, 0],
+                "fix_equip_list": [], "base_list": [1, 2, 1], "oxy_max": 100 if metaId == 9 else 0, "oxy_cost": 1,
+                "oxy_recovery": 1, "ammo": 3, "attack_duration": 10, "huntingrange_level": 2,
+                "hunting_range": [[[7, 8], [8, 7]], [[7, 9], [6, 6]], [[5, 5]]]}
+            tableDict["ship_data_template"][str(shipId)] = {
+                "id": shipId, "equip_1": [1, 2], "equip_2": [3], "equip_3": [6, 21], "equip_4": [10], "equip_5": [10],
+                "buff_list_display": [100, 101], "strengthen_id": groupId, "group_type": groupId}
+        tableDict["ship_data_strengthen"][str(groupId)] = {"durability": [5, 6, 7, 8, 9],
+                                                           "level_exp": [100, 200, 0, 150, 120],
+                                                           "attr_exp": [10, 20, 0, 5, 30]}
+        tableDict["fleet_tech_ship_template"][str(groupId)] = {
+            "id": groupId, "pt_get": 1, "pt_upgrage": 2, "pt_level": 3, "add_get_shiptype": [hullType, 2],
+            "add_get_attr": 2, "add_get_value": 1, "add_level_shiptype": [hullType], "add_level_attr": 6,
+            "add_level_value": 2}
+
+    tableDict["ship_data_trans"]["10201"] = {"transform_list": [[[1, 500]], [[1, 501], [2, 502]]]}
+    tableDict["ship_data_trans"]["20101"] = {"transform_list": [[[1, 500]]]}
+    tableDict["ship_data_trans"]["30101"] = {"transform_list": [[[1, 501]], [], [[1, 502]]]}
+    for nodeId in [500, 501, 502]:
+        tableDict["transform_data_template"][str(nodeId)] = {
+            "id": nodeId, "use_gold": 1, "level_limit": 1, "star_limit": 1, "max_level": 2, "use_ship": 0,
+            "icon": "x", "name": "Modernization" if nodeId == 502 else "Node",
+            "effect": [{"cannon": 5, "equipment_proficiency_1": 0.05}, {"reload": 3}], "use_item": [[], []],
+            "gear_score": [1, 2], "condition_id": [], "descrip": "<b>desc</b>"}
+
+    researchNodeIdList = list(range(700, 710))
+    fateSimNodeIdList = [800, 801]
+    tableDict["ship_data_blueprint"]["20301"] = {"strengthen_effect": researchNodeIdList,
+                                                 "fate_strengthen": fateSimNodeIdList}
+    for index, nodeId in enumerate(researchNodeIdList + fateSimNodeIdList):
+        tableDict["ship_strengthen_blueprint"][str(nodeId)] = {
+            "id": nodeId, "lv": index * 3 + 1 if nodeId < 800 else nodeId - 769, "need_lv": 1, "effect_desc": "",
+            "effect_dialog": "", "need_exp": 10, "effect_preload": [1, 1] if nodeId == 705 else [],
+            "effect_equipment_proficiency": [2, 0.05] if nodeId in [703, 800] else [],
+            "effect_attr": [["cannon", 3], ["reload", nodeId % 4]]}
+
+    for skillId in [100, 101]:
+        tableDict["skill_data_template"][str(skillId)] = {
+            "id": skillId, "name": "Torpedo Burn {}".format(skillId),
+            "desc": "Increase <color>reload</color> by $1 and fire $2", "desc_get": "Torpedo barrage when burning",
+            "desc_add": [[[str(5 + level)] for level in range(10)], [["a{}".format(level)] for level in range(10)]],
+            "max_level": 10, "type": 1}
+
+    for table in tableDict.values():
+        table["all"] = [int(recordId) for recordId in table]
+    return tableDict
+
+
+def writeFixtureDataset(path: str, tableDict: Optional[Dict[str, Dict]] = None):
+    """
+    Writes a small dataset (sharecfg tables and gamecfg skill and buff files) that ConfigParser can load
+
+    :param path: string, the dataset folder, it is created if needed
+    :param tableDict: the sharecfg tables, None means the tables of genTables
+    """
+    for folder in ["sharecfg", "gamecfg/skill", "gamecfg/buff"]:
+        os.makedirs(os.path.join(path, folder), exist_ok=True)
+
+    def writeJson(relativePath: str, data: Dict):
+        with open(os.path.join(path, relativePath), "w", encoding="utf-8") as outputFile:
+            json.dump(data, outputFile)
+
+    for configName, table in (genTables() if tableDict is None else tableDict).items():
+        writeJson("sharecfg/" + configName, table)
+    for skillId in [100, 101]:
+        writeJson("gamecfg/buff/buff_{}".format(skillId), {
+            "id": skillId, "name": "b{}".format(skillId), "desc": "", "icon": skillId,
+            "effect_list": [{"type": "BattleBuffCastSkill", "arg_list": {"skill_id": skillId}},
+                            {"type": "BattleBuffDOT", "arg_list": {"k": 1}}],
+            "5": {"effect_list": [{"type": "BattleBuffCastSkill", "arg_list": {"skill_id": skillId + 1000}}]}})
+        for castSkillId, weaponId in [(skillId, 1), (skillId + 1000, 20)]:
+            writeJson("gamecfg/skill/skill_{}".format(castSkillId), {
+                "id": castSkillId, "name": "s{}".format(castSkillId), "desc": "",
+                "effect_list": [{"type": "BattleSkillFire", "arg_list": {"weapon_id": weaponId}}]})
+
+
+class FixtureTestCase(unittest.TestCase):
+    """
+    FixtureTestCase writes the fixture dataset into a temporary folder once per test class and loads it with a
+    ConfigParser
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = cls.directory.name
+        writeFixtureDataset(cls.path)
+        cls.parser = ConfigParser(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.parser.close()
+        cls.directory.cleanup()
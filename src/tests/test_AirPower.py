@@ -0,0 +1,42 @@
+import os
+import unittest
+from main.AirPower import AirPowerTable
+from main.ConfigParser import ConfigParser
+from tests.FixtureDataset import FixtureTestCase, genTables, writeFixtureDataset
+
+
+class AirPowerTest(FixtureTestCase):
+    def testMatchesAircraft(self):
+        table = self.parser.getAirPowerTable()
+        self.assertEqual(table.aircraftIdList, [30, 31])
+        for aircraftId in table.aircraftIdList:
+            aircraft = self.parser.getAircraft(aircraftId)
+            for level in [1, 50, 120]:
+                self.assertEqual(table.getHp(aircraftId, level), aircraft.getHp(level))
+            self.assertEqual(table.getOrdnanceDamageColumn(1)[table.getIndex(aircraftId)],
+                             aircraft.getOrdnanceDamageByArmorType(1))
+        self.assertEqual(table.getHitsToDownTable(10)[table.getIndex(31)][0], 6)
+        for arguments in [(1, 10, 0), (1, 10, 121), (1, 0, 1), (3, 10, 1)]:
+            with self.assertRaises(ValueError):
+                table.getAirPowerRanking(*arguments)
+
+    def testZeroStatsAndFailedAircraft(self):
+        tableDict = genTables()
+        aircraftTable = tableDict["aircraft_template"]
+        # 0 is a valid hp growth and dodge, it must not be looked up in a base aircraft
+        aircraftTable["32"] = dict(aircraftTable["30"], id=32, hp_growth=0, dodge=0)
+        aircraftTable["33"] = dict(aircraftTable["30"], id=33)
+        del aircraftTable["33"]["speed"]
+        aircraftPath = os.path.join(self.path, "aircraft")
+        writeFixtureDataset(aircraftPath, tableDict)
+        with ConfigParser(aircraftPath) as parser:
+            table = AirPowerTable(parser, 10)
+            aircraft = parser.getAircraft(32)
+        self.assertEqual((aircraft.hpGrowth, aircraft.evaRate), (0, 0))
+        self.assertEqual(table.aircraftIdList, [30, 31, 32])
+        self.assertEqual(table.failedAircraftIds, [33])
+        self.assertEqual(table.getHp(32, 10), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import io
+import os
+import csv
+import json
+import unittest
+from contextlib import redirect_stderr
+from unittest import mock
+from main.CommandLine import main, dumpChunk
+from tests.FixtureDataset import FixtureTestCase
+
+
+class CommandLineTest(FixtureTestCase):
+    def runDump(self, *extraArguments) -> str:
+        outputPath = os.path.join(self.path, "dump.out")
+        self.assertEqual(main([self.path, "dump", "ships", "--output", outputPath] + list(extraArguments)), 0)
+        with open(outputPath, encoding="utf-8") as outputFile:
+            return outputFile.read()
+
+    def testParallelDumpMatchesSerialDump(self):
+        serialDump = self.runDump("--chunk-size", "3")
+        self.assertEqual(self.runDump("--chunk-size", "3", "--jobs", "2"), serialDump)
+        recordList = [json.loads(line) for line in serialDump.splitlines()]
+        self.assertEqual([record["id"] for record in recordList], sorted(self.parser.getShipIdList()))
+
+    def testCsvHasEveryColumn(self):
+        rowList = list(csv.DictReader(io.StringIO(self.runDump("--format", "csv", "--ids", "201011,401011"))))
+        self.assertEqual(len(rowList), 2)
+        # the submarine has columns the surface ship does not have
+        self.assertIn("oxygen", rowList[0])
+
+    def testFailedRecordsAreReported(self):
+        getShip = self.parser.getShip
+
+        def failingGetShip(shipId: int):
+            if shipId == 201012:
+                raise AttributeError("broken record")
+            return getShip(shipId)
+
+        with mock.patch.object(self.parser, "getShip", side_effect=failingGetShip):
+            recordList, errorList, _ = dumpChunk(self.parser, ("ships", [201011, 201012, 201013]))
+        self.assertEqual([record["id"] for record in recordList], [201011, 201013])
+        self.assertEqual(errorList, ["ships 201012: AttributeError: broken record"])
+
+    def testTimings(self):
+        stderr = io.StringIO()
+        with redirect_stderr(stderr):
+            self.assertEqual(main([self.path, "--timings", "dump", "metaships", "--output",
+                                   os.path.join(self.path, "dump.out")]), 0)
+        self.assertIn("load", stderr.getvalue())
+        self.assertIn("total", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
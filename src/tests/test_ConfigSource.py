@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+import unittest
+from main.ConfigParser import ConfigParser, configNameList
+from main.ConfigSource import ArchiveSource, StreamedArchiveSource
+from tests.FixtureDataset import FixtureTestCase
+
+
+class ConfigSourceTest(FixtureTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(ConfigSourceTest, cls).setUpClass()
+        cls.archiveDirectory = tempfile.TemporaryDirectory()
+        cls.archivePathDict = {archiveFormat: shutil.make_archive(
+            os.path.join(cls.archiveDirectory.name, "dataset"), archiveFormat, cls.path)
+            for archiveFormat in ["gztar", "xztar", "zip", "tar"]}
+        # members below an extra folder, as in an archive of the dump folder itself
+        cls.archivePathDict["nestedZip"] = shutil.make_archive(
+            os.path.join(cls.archiveDirectory.name, "nested"), "zip", os.path.dirname(cls.path),
+            os.path.basename(cls.path))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.archiveDirectory.cleanup()
+        super(ConfigSourceTest, cls).tearDownClass()
+
+    def testArchives(self):
+        for archiveFormat, archivePath in self.archivePathDict.items():
+            with self.subTest(archiveFormat=archiveFormat), ConfigParser(archivePath) as parser:
+                self.assertIsInstance(parser.configSource, StreamedArchiveSource if archiveFormat in ["gztar", "xztar"]
+                                      else ArchiveSource)
+                self.assertEqual(parser.getDatasetHash(), self.parser.getDatasetHash())
+                for configType in ["skill", "buff"]:
+                    self.assertEqual(parser.getGameConfigIdList(configType),
+                                     self.parser.getGameConfigIdList(configType))
+
+    def testArchiveClose(self):
+        for archiveFormat in ["zip", "tar"]:
+            parser = ConfigParser(self.archivePathDict[archiveFormat])
+            parser.close()
+            with self.subTest(archiveFormat=archiveFormat):
+                if archiveFormat == "zip":
+                    self.assertIsNone(parser.configSource.zipFile.fp)
+                else:
+                    self.assertTrue(parser.configSource.tarFile.closed)
+                with self.assertRaises(ValueError):
+                    parser.loadSkill(100)
+                # loaded tables stay usable
+                self.assertEqual(parser.getShip(201011).name, "Ship5")
+
+    def testStreamedArchiveKeepsOnlyGameConfig(self):
+        with ConfigParser(self.archivePathDict["gztar"]) as parser:
+            fileNameList = sorted(parser.configSource.files)
+            self.assertTrue(all(fileName.startswith("gamecfg/") for fileName in fileNameList))
+            self.assertEqual(fileNameList, sorted(
+                "gamecfg/{}/{}_{}".format(configType, configType, configId) for configType in ["skill", "buff"]
+                for configId in parser.getGameConfigIdList(configType)))
+            # released tables are streamed again when read
+            for configName in configNameList:
+                self.assertEqual(parser.loadConfig(configName), self.parser.loadConfig(configName))
+            self.assertEqual(sorted(parser.configSource.files), fileNameList)
+        with self.assertRaises(FileNotFoundError):
+            parser.loadSkill(100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from main.ConfigParser import ConfigParser
+from main.DatasetHandle import DatasetHandle
+from tests.FixtureDataset import FixtureTestCase
+
+
+class DatasetHandleTest(FixtureTestCase):
+    def testCachedValuesAreBuiltOnce(self):
+        with ConfigParser(self.path) as parser:
+            callCount = []
+            barrier = threading.Barrier(8)
+
+            def builder():
+                callCount.append(1)
+                return object()
+
+            resultList = []
+
+            def reader():
+                barrier.wait()
+                resultList.append(parser.getCached("testValue", builder))
+
+            threadList = [threading.Thread(target=reader) for _ in range(0, 8)]
+            for thread in threadList:
+                thread.start()
+            for thread in threadList:
+                thread.join()
+            self.assertEqual(len(callCount), 1)
+            self.assertTrue(all(result is resultList[0] for result in resultList))
+
+    def testSnapshotsStayConsistentWhileSwapping(self):
+        otherParser = ConfigParser(self.path)
+        otherParser.shipStatisticDict["201011"]["attrs"] = [1] * 12
+        parserList = [self.parser, otherParser]
+        handle = DatasetHandle(self.parser)
+        stopEvent = threading.Event()
+        errorList = []
+
+        def reader():
+            while not stopEvent.is_set():
+                version, parser = handle.getSnapshot()
+                # a snapshot never changes, even if the handle is swapped while it is used
+                firstStat = parser.getShip(201011).attrs[0]
+                if parser is not parserList[version % 2] or parser.getShip(201011).attrs[0] != firstStat:
+                    errorList.append(version)
+
+        threadList = [threading.Thread(target=reader) for _ in range(0, 4)]
+        for thread in threadList:
+            thread.start()
+        for version in range(1, 200):
+            self.assertIs(handle.swap(parserList[version % 2]), parserList[(version - 1) % 2])
+        stopEvent.set()
+        for thread in threadList:
+            thread.join()
+        self.assertEqual(errorList, [])
+        self.assertEqual(handle.getSnapshot()[0], 199)
+        otherParser.close()
+
+    def testReloadClosesOldParser(self):
+        with tempfile.TemporaryDirectory() as archiveFolder:
+            archivePath = shutil.make_archive(os.path.join(archiveFolder, "dataset"), "tar", self.path)
+            archiveParser = ConfigParser(archivePath)
+            handle = DatasetHandle(archiveParser)
+            self.assertIs(handle.reload(self.path), archiveParser)
+            self.assertFalse(archiveParser.configSource.tarFile.closed)
+            handle.swap(archiveParser)
+            self.assertEqual(handle.getSnapshot()[0], 2)
+            self.assertIsNot(handle.reload(self.path, closeOld=True), handle.getParser())
+            self.assertTrue(archiveParser.configSource.tarFile.closed)
+            self.assertEqual(handle.getSnapshot()[0], 3)
+            self.assertEqual(handle.getParser().getDatasetHash(), self.parser.getDatasetHash())
+            handle.getParser().close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import unittest
+from main.ConfigParser import ConfigParser
+from main.DatasetStore import DatasetStore
+from tests.FixtureDataset import FixtureTestCase, genTables, writeFixtureDataset
+
+
+class DatasetStoreTest(FixtureTestCase):
+    """
+    Records that are equal in two datasets are stored once, the views must still read like separate parsers
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(DatasetStoreTest, cls).setUpClass()
+        cls.otherPath = os.path.join(cls.path, "other")
+        tableDict = genTables()
+        tableDict["ship_data_statistics"]["201011"]["attrs"][1] += 100
+        writeFixtureDataset(cls.otherPath, tableDict)
+        cls.otherParser = ConfigParser(cls.otherPath)
+        cls.store = DatasetStore({"CN": cls.path, "EN": cls.otherPath})
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.otherParser.close()
+        for name in ["CN", "EN"]:
+            cls.store.getParser(name).close()
+        super(DatasetStoreTest, cls).tearDownClass()
+
+    def testRecordsAreShared(self):
+        firstView, secondView = self.store.getParser("CN"), self.store.getParser("EN")
+        self.assertIs(firstView.shipDataDict["201011"], secondView.shipDataDict["201011"])
+        self.assertIsNot(firstView.shipStatisticDict["201011"], secondView.shipStatisticDict["201011"])
+        referenceCount, storedCount = self.store.getRecordCount()
+        self.assertLess(storedCount, referenceCount)
+
+    def testViewsMatchParsers(self):
+        for name, parser in [("CN", self.parser), ("EN", self.otherParser)]:
+            view = self.store.getParser(name)
+            self.assertEqual(view.getDatasetHash(), parser.getDatasetHash())
+            for metaId in sorted(parser.getMetaIdList()):
+                self.assertEqual([view.getMetaShip(metaId).getStat(statId, 120, 3, 0, False, True)
+                                  for statId in range(1, 13)],
+                                 [parser.getMetaShip(metaId).getStat(statId, 120, 3, 0, False, True)
+                                  for statId in range(1, 13)])
+        self.assertNotEqual(self.store.getParser("CN").getDatasetHash(), self.store.getParser("EN").getDatasetHash())
+
+
+if __name__ == "__main__":
+    unittest.main()
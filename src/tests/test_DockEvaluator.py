@@ -0,0 +1,47 @@
+import unittest
+from main.DockEvaluator import evaluateDock, shipStates
+from tests.FixtureDataset import FixtureTestCase
+
+
+class DockEvaluatorTest(FixtureTestCase):
+    """
+    evaluateDock reads precomputed MetaShipStatTable rows, its results must equal calling the MetaShip methods
+    """
+
+    def testDockMatchesMetaShip(self):
+        rowList = [(metaId, level, lbLevel, affBonus, isRefitted, strengthenBonus)
+                   for metaId in sorted(self.parser.getMetaIdList())
+                   for level in [1, 50, 100, 101, 120]
+                   for lbLevel, isRefitted in shipStates
+                   for affBonus in [0, 6, 12]
+                   for strengthenBonus in [False, True]]
+        statMatrix, proficiencyMatrix, equipBaseMatrix = evaluateDock(self.parser, *zip(*rowList))
+        for row, stats, proficiencies, equipBases in zip(rowList, statMatrix, proficiencyMatrix, equipBaseMatrix):
+            metaId, level, lbLevel, affBonus, isRefitted, strengthenBonus = row
+            metaShip = self.parser.getMetaShip(metaId)
+            with self.subTest(row=row):
+                self.assertEqual(stats, [metaShip.getStat(statId, level, lbLevel, affBonus, isRefitted, strengthenBonus)
+                                         for statId in range(1, 13)])
+                self.assertEqual(proficiencies, [metaShip.getEquipProficiency(equipSlot, lbLevel, isRefitted)
+                                                 for equipSlot in range(1, 5)])
+                self.assertEqual(equipBases, [metaShip.getEquipBaseCount(equipSlot, lbLevel, isRefitted)
+                                              for equipSlot in range(1, 4)])
+
+    def testRowsAreNotShared(self):
+        rows = ([2, 2], [120, 120], [3, 3], [0, 0], [False, False])
+        _, proficiencyMatrix, equipBaseMatrix = evaluateDock(self.parser, *rows)
+        self.assertIsNot(proficiencyMatrix[0], proficiencyMatrix[1])
+        expectedMatrices = evaluateDock(self.parser, *rows)[1:]
+        proficiencyMatrix[0][0] = -1
+        equipBaseMatrix[1][0] = -1
+        self.assertEqual(evaluateDock(self.parser, *rows)[1:], expectedMatrices)
+
+    def testInvalidRows(self):
+        with self.assertRaises(ValueError):
+            evaluateDock(self.parser, [2], [120], [2], [0], [True])
+        with self.assertRaises(ValueError):
+            evaluateDock(self.parser, [2, 5], [120], [3], [0], [False])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+import unittest
+from main.ConfigParser import ConfigParser
+from main.EquipTypeIndex import EquipTypeIndex
+from tests.FixtureDataset import FixtureTestCase, genTables, writeFixtureDataset
+
+
+class EquipTypeIndexTest(FixtureTestCase):
+    def testMatchesMetaShips(self):
+        index = self.parser.getEquipTypeIndex()
+        self.assertEqual(index.failedMetaIds, [])
+        for metaShip in self.parser.iterMetaShips():
+            for metaId, equipSlot, lbLevel, isRefitted in index.getEntries(index.query(metaId=metaShip.id)):
+                self.assertEqual(index.getEquipTypes(metaId, equipSlot, lbLevel, isRefitted),
+                                 metaShip.getEquipType(equipSlot, lbLevel, isRefitted))
+        # every fixture ship accepts equipment type 10 in slots 4 and 5 only
+        self.assertEqual(index.query(equipType=10), index.query(equipSlot=4) | index.query(equipSlot=5))
+        self.assertEqual(index.getMetaIds(index.query(equipType=21, isRefitted=True)), {2, 5, 7})
+        with self.assertRaises(KeyError):
+            index.getEquipTypes(1, 1, 0, True)
+
+    def testFailedMetaShip(self):
+        tableDict = genTables()
+        del tableDict["ship_data_template"]["101011"]["equip_1"]
+        brokenPath = os.path.join(self.path, "broken")
+        writeFixtureDataset(brokenPath, tableDict)
+        with ConfigParser(brokenPath) as parser:
+            index = EquipTypeIndex(parser)
+        fullIndex = self.parser.getEquipTypeIndex()
+        self.assertEqual(index.failedMetaIds, [1])
+        self.assertEqual(index.query(metaId=1), 0)
+        self.assertEqual(sorted(index.entryList),
+                         sorted(entry for entry in fullIndex.entryList if entry[0] != 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
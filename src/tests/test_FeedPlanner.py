@@ -0,0 +1,66 @@
+import unittest
+from main.FeedPlanner import FeedPlanner, feedStatIdList
+from tests.FixtureDataset import FixtureTestCase
+
+
+class FeedPlannerTest(FixtureTestCase):
+    def setUp(self):
+        # ship 1 is the target, every other ship provides the attr_exp of its strengthen record
+        expDict = {1: ([0, 0, 0, 0, 0], [100, 60, 0, 30, 0]), 2: ([50, 0, 0, 0, 0], [0] * 5),
+                   3: ([0, 60, 0, 30, 0], [0] * 5), 4: ([40, 20, 0, 10, 0], [0] * 5), 5: ([0, 0, 0, 0, 0], [0] * 5),
+                   6: ([100, 60, 0, 30, 0], [0] * 5)}
+        self.planner = FeedPlanner({str(shipId): {"strengthen_id": shipId} for shipId in expDict},
+                                   {str(shipId): {"attr_exp": attrExp, "level_exp": levelExp}
+                                    for shipId, (attrExp, levelExp) in expDict.items()})
+
+    def assertValidPlan(self, plan, dockShipIdList, targetId=1, currentExp=None):
+        currentExp = currentExp or {}
+        total = {statId: sum(self.planner.expProvidedDict[shipId][index] for shipId in plan.shipIdList)
+                 for index, statId in enumerate(feedStatIdList)}
+        for index, statId in enumerate(feedStatIdList):
+            demand = max(self.planner.expNeededDict[targetId][index] - currentExp.get(statId, 0), 0)
+            self.assertEqual(plan.remainingExp[statId], max(demand - total[statId], 0))
+            self.assertEqual(plan.surplusExp[statId], max(total[statId] - demand, 0))
+        self.assertEqual(plan.shipIdList, [dockShipIdList[dockIndex] for dockIndex in plan.dockIndexList])
+        # no chosen ship can be dropped without losing exp the target still needs
+        for shipId in plan.shipIdList:
+            for index, statId in enumerate(feedStatIdList):
+                demand = max(self.planner.expNeededDict[targetId][index] - currentExp.get(statId, 0), 0)
+                if total[statId] - self.planner.expProvidedDict[shipId][index] < min(demand, total[statId]):
+                    break
+            else:
+                self.fail("ship {} is redundant in {}".format(shipId, plan.shipIdList))
+
+    def testPlans(self):
+        dockShipIdList = [5, 2, 4, 2, 3, 4]
+        plan = self.planner.plan(1, dockShipIdList)
+        self.assertTrue(plan.isComplete())
+        self.assertEqual(plan.shipIdList, [2, 2, 3])
+        self.assertEqual(plan.dockIndexList, [1, 3, 4])
+        self.assertValidPlan(plan, dockShipIdList)
+
+        self.assertEqual(self.planner.plan(1, dockShipIdList + [6]).shipIdList, [6])
+        plan = self.planner.plan(1, dockShipIdList, {2: 100})
+        self.assertEqual(plan.shipIdList, [3])
+        self.assertValidPlan(plan, dockShipIdList, currentExp={2: 100})
+
+        plan = self.planner.plan(1, [4, 5])
+        self.assertFalse(plan.isComplete())
+        self.assertEqual(plan.remainingExp, {2: 60, 3: 40, 5: 20, 6: 0})
+        self.assertValidPlan(plan, [4, 5])
+        self.assertEqual(self.planner.plan(1, []).shipIdList, [])
+
+    def testFixturePlanner(self):
+        planner = self.parser.getFeedPlanner()
+        for shipId in [101011, 401011]:
+            ship = self.parser.getShip(shipId)
+            self.assertEqual(planner.expProvidedDict[shipId],
+                             tuple(ship.strengthenExpProvides[statId] for statId in feedStatIdList))
+            self.assertEqual(planner.expNeededDict[shipId],
+                             tuple(ship.strengthenExpNeeded[statId] for statId in feedStatIdList))
+        with self.assertRaises(ValueError):
+            FeedPlanner(self.parser.shipDataDict, self.parser.shipStrengthenDict, [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from main.FleetTech import FleetTechAggregator
+from tests.FixtureDataset import FixtureTestCase
+
+
+class FleetTechTest(FixtureTestCase):
+    """
+    The incrementally updated totals of FleetTechAggregator must equal totals recomputed from the MetaShip objects
+    """
+
+    def getExpectedTotals(self, dock):
+        techPoint = 0
+        statBonus = {}
+        for metaId, (limitBroken, maxLevel) in dock.items():
+            metaShip = self.parser.getMetaShip(metaId)
+            for stage, reached in enumerate([True, limitBroken, maxLevel]):
+                if reached:
+                    techPoint += metaShip.fleetTechPoint[stage] or 0
+            for stage, reached in [(0, True), (1, maxLevel)]:
+                if not reached:
+                    continue
+                statId, value = next(iter(metaShip.fleetStatBonus[stage].items()))
+                prefix = ["get", "level"][stage]
+                techDict = self.parser.fleetTechDict[str(metaShip.groupId)]
+                for hullType in techDict["add_{}_shiptype".format(prefix)]:
+                    statBonus[(hullType, statId)] = statBonus.get((hullType, statId), 0) + value
+        return techPoint, statBonus
+
+    def testIncrementalTotals(self):
+        aggregator = FleetTechAggregator(self.parser.getFleetTechTable())
+        dock = {}
+        stepList = [("add", 1, False, False), ("add", 5, True, False), ("add", 20001, True, True),
+                    ("limitBreak", 1), ("level", 5), ("add", 1, False, False), ("remove", 20001),
+                    ("add", 9, False, True)]
+        for step in stepList:
+            if step[0] == "add":
+                _, metaId, limitBroken, maxLevel = step
+                aggregator.addShip(metaId, limitBroken, maxLevel)
+                oldState = dock.get(metaId, (False, False))
+                dock[metaId] = (limitBroken or oldState[0], maxLevel or oldState[1])
+            elif step[0] == "limitBreak":
+                aggregator.limitBreakShip(step[1])
+                dock[step[1]] = (True, dock[step[1]][1])
+            elif step[0] == "level":
+                aggregator.levelShip(step[1])
+                dock[step[1]] = (dock[step[1]][0], True)
+            else:
+                aggregator.removeShip(step[1])
+                del dock[step[1]]
+            techPoint, statBonus = self.getExpectedTotals(dock)
+            with self.subTest(step=step):
+                self.assertEqual(aggregator.getTechPoint(), techPoint)
+                self.assertEqual({key: value for key, value in aggregator.statBonus.items() if value != 0}, statBonus)
+        self.assertEqual(sorted(aggregator.getMetaIdList()), sorted(dock))
+        with self.assertRaises(KeyError):
+            aggregator.removeShip(20001)
+
+
+if __name__ == "__main__":
+    unittest.main()
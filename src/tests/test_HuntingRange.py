@@ -0,0 +1,66 @@
+import unittest
+from main.HuntingRange import HuntingRangeGrid, HuntingRangeTable, getCellBit, getMaskCells
+from tests.FixtureDataset import FixtureTestCase
+
+
+def getReferenceGrid(huntingRange):
+    # the grid as Submarine.getHuntingRange rendered it before hunting ranges were stored as masks
+    levelList = [[" " for i in range(0, 7)] for j in range(0, 7)]
+    for level, coordList in enumerate(huntingRange, 1):
+        for coord in coordList:
+            levelList[coord[0] - 4][coord[1] - 4] = str(level)
+    levelList[3][3] = "x"
+    return levelList
+
+
+class HuntingRangeTest(FixtureTestCase):
+    def setUp(self):
+        # ship 1 reaches a line to the right, ship 2 a cross, ship 3 has no hunting range
+        self.table = HuntingRangeTable({
+            "1": {"oxy_max": 100, "huntingrange_level": 1, "hunting_range": [[[7, 8]], [[7, 9], [7, 10]]]},
+            "2": {"oxy_max": 100, "huntingrange_level": 2,
+                  "hunting_range": [[[7, 8], [7, 6]], [[6, 7], [8, 7], [7, 7]]]},
+            "3": {"oxy_max": 100, "huntingrange_level": 0, "hunting_range": []},
+            "4": {"oxy_max": 0, "huntingrange_level": 0, "hunting_range": []}})
+
+    def testMasks(self):
+        grid = self.table.getGrid(2)
+        self.assertEqual(grid.getMaxLevel(), 2)
+        # the submarine's own cell is dropped
+        self.assertEqual(getMaskCells(grid.getMask()), [(6, 7), (7, 6), (7, 8), (8, 7)])
+        self.assertEqual(grid.getMask(1), getCellBit(7, 8) | getCellBit(7, 6))
+        self.assertEqual(grid.getMask(5), grid.getMask(2))
+        self.assertEqual(grid.getMask(0), 0)
+        self.assertEqual([self.table.getGrid(1).getArea(level) for level in [None, 1, 2, 3]], [1, 1, 3, 3])
+        self.assertEqual(self.table.getGrid(3).getArea(), 0)
+        self.assertNotIn(4, self.table.gridDict)
+
+    def testFleetQueries(self):
+        self.assertEqual(getMaskCells(self.table.getUnion([1, 2])), [(6, 7), (7, 6), (7, 8), (8, 7)])
+        self.assertEqual(getMaskCells(self.table.getUnion([1, 2], 2)),
+                         [(6, 7), (7, 6), (7, 8), (7, 9), (7, 10), (8, 7)])
+        self.assertEqual(getMaskCells(self.table.getIntersection([1, 2])), [(7, 8)])
+        self.assertEqual(self.table.getIntersection([]), 0)
+        self.assertEqual(self.table.getIntersection([1, 3]), 0)
+        counts = self.table.getCoverageCounts([1, 2], 2)
+        self.assertEqual(counts[3][4], 2)
+        self.assertEqual(counts[3][5], 1)
+        self.assertEqual(sum(map(sum, counts)), 7)
+        self.assertEqual(self.table.rankByArea(), {1: [(2, 2), (1, 1), (3, 0)], 2: [(2, 4), (1, 3), (3, 0)]})
+
+    def testLevelGrid(self):
+        for shipId in [401011, 401014]:
+            ship = self.parser.getShip(shipId)
+            self.assertEqual(ship.getHuntingRange(), getReferenceGrid(ship.huntingRange))
+        huntingRange = [[[7, 8], [8, 7]], [[7, 9], [6, 6]], [[5, 5], [7, 8]]]
+        grid = HuntingRangeGrid(huntingRange, 2)
+        levelGrid = grid.getLevelGrid()
+        self.assertEqual(levelGrid, getReferenceGrid(huntingRange))
+        # the grid is rendered once, callers get copies
+        levelGrid[0][0] = "9"
+        self.assertEqual(grid.getLevelGrid(), getReferenceGrid(huntingRange))
+        self.assertIs(self.parser.getShip(401011).huntingRangeGrid, self.parser.getShip(401011).huntingRangeGrid)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from main.ConfigParser import ConfigParser
+from main.Interning import InternPool
+from main.Utility import getDeepSize
+from tests.FixtureDataset import FixtureTestCase
+
+
+class InternPoolTest(unittest.TestCase):
+    def testScalarsKeepTheirTypes(self):
+        pool = InternPool(shareSequences=True)
+        valueList = pool.intern([1, 1.0, True, "1", None])
+        self.assertEqual([type(value) for value in valueList], [int, float, bool, str, type(None)])
+        self.assertIsNot(pool.intern([1, 2]), pool.intern([1.0, 2]))
+        self.assertEqual(pool.intern([1.0, 2]), (1.0, 2))
+
+    def testSequencesAreSharedOnlyWhenAsked(self):
+        record = {"a": [1, 2], "b": [1, 2], "c": [[7, 8], [8, 7]], "d": [{"k": 1}]}
+        pool = InternPool()
+        result = pool.intern(record)
+        self.assertEqual(result, record)
+        self.assertIsNot(result["a"], result["b"])
+        self.assertIsInstance(result["a"], list)
+
+        pool = InternPool(shareSequences=True)
+        result = pool.intern(record)
+        self.assertIs(result["a"], result["b"])
+        self.assertEqual(result["c"], ((7, 8), (8, 7)))
+        self.assertIs(result["c"], pool.intern({"c": [[7, 8], [8, 7]]})["c"])
+        # lists of records stay lists of separate records
+        self.assertEqual(result["d"], [{"k": 1}])
+
+
+class InternedParserTest(FixtureTestCase):
+    def getTableNames(self):
+        return [attrName for attrName in sorted(vars(self.parser)) if attrName.endswith("Dict")]
+
+    def checkParser(self, parser: ConfigParser):
+        self.assertEqual(parser.getDatasetHash(), self.parser.getDatasetHash())
+        for metaId in sorted(self.parser.getMetaIdList()):
+            self.assertEqual([parser.getMetaShip(metaId).getStat(statId, 120, 3, 12, False, True)
+                              for statId in range(1, 13)],
+                             [self.parser.getMetaShip(metaId).getStat(statId, 120, 3, 12, False, True)
+                              for statId in range(1, 13)])
+        # savedBytes is the real difference of the table sizes
+        self.assertEqual(parser.getInternReport()["savedBytes"],
+                         sum(getDeepSize(getattr(self.parser, attrName)) for attrName in self.getTableNames()) -
+                         sum(getDeepSize(getattr(parser, attrName)) for attrName in self.getTableNames()))
+
+    def testInternValues(self):
+        with ConfigParser(self.path, internValues=True) as parser:
+            self.checkParser(parser)
+            self.assertIsInstance(parser.shipDataDict["201011"]["equip_1"], list)
+            self.assertIsNot(parser.shipDataDict["201011"]["equip_1"], parser.shipDataDict["201012"]["equip_1"])
+
+    def testShareSequences(self):
+        with ConfigParser(self.path, internValues=True, shareSequences=True) as parser:
+            self.checkParser(parser)
+            self.assertIs(parser.shipDataDict["201011"]["equip_1"], parser.shipDataDict["201012"]["equip_1"])
+            self.assertIs(parser.bulletDataDict["1"]["damage_type"], parser.bulletDataDict["2"]["damage_type"])
+            self.assertIs(parser.shipStatisticDict["401011"]["hunting_range"],
+                          parser.shipStatisticDict["401012"]["hunting_range"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from unittest import mock
+from main.Utility import chunked
+from tests.FixtureDataset import FixtureTestCase
+
+
+class LazyIteratorTest(FixtureTestCase):
+    def testIteratedIds(self):
+        self.assertEqual(sorted(ship.id for ship in self.parser.iterShips()), sorted(self.parser.getShipIdList()))
+        self.assertEqual(sorted(metaShip.id for metaShip in self.parser.iterMetaShips()),
+                         sorted(self.parser.getMetaIdList()))
+        self.assertEqual(sorted(weapon.id for weapon in self.parser.iterWeapons()),
+                         sorted(int(weaponId) for weaponId in self.parser.weaponDataDict))
+        self.assertEqual(sorted(rootBuff.id for rootBuff in self.parser.iterRootBuffs()), [100, 101])
+
+    def testShipsAreBuiltOnDemand(self):
+        with mock.patch.object(self.parser, "getShip", wraps=self.parser.getShip) as getShip:
+            ships = self.parser.iterShips()
+            self.assertEqual(getShip.call_count, 0)
+            next(ships)
+            self.assertEqual(getShip.call_count, 1)
+            next(self.parser.iterShips(chunkSize=3))
+            self.assertEqual(getShip.call_count, 4)
+
+    def testPredicateAndChunks(self):
+        submarineIdList = [ship.id for ship in self.parser.iterShips(lambda ship: ship.hullType == 8)]
+        self.assertEqual(submarineIdList, [401011, 401012, 401013, 401014])
+        chunkList = list(self.parser.iterWeapons(chunkSize=4))
+        self.assertEqual([len(chunk) for chunk in chunkList], [4, 4, 4])
+        self.assertEqual([weapon.id for chunk in chunkList for weapon in chunk],
+                         [weapon.id for weapon in self.parser.iterWeapons()])
+        self.assertEqual(list(chunked(iter(range(0, 5)), 2)), [[0, 1], [2, 3], [4]])
+        with self.assertRaises(ValueError):
+            next(chunked(iter(range(0, 5)), 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
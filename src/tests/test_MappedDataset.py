@@ -0,0 +1,77 @@
+import os
+import unittest
+from main.ConfigParser import configNameList
+from main.MappedDataset import MappedConfigParser, writeMappedDataset
+from main.Serialization import toJsonable
+from tests.FixtureDataset import FixtureTestCase
+
+
+class MappedDatasetTest(FixtureTestCase):
+    """
+    A MappedConfigParser must give the same tables, objects and dataset hash as the ConfigParser it was packed from
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super(MappedDatasetTest, cls).setUpClass()
+        cls.mappedPath = os.path.join(cls.path, "dataset.almap")
+        writeMappedDataset(cls.parser, cls.mappedPath)
+        # a record cache smaller than the tables, so records are decoded again while the tests run
+        cls.mappedParser = MappedConfigParser(cls.path, cls.mappedPath, cacheSize=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.mappedParser.close()
+        super(MappedDatasetTest, cls).tearDownClass()
+
+    def testTables(self):
+        for configName in configNameList:
+            table, mappedTable = self.parser.loadConfig(configName), self.mappedParser.loadConfig(configName)
+            self.assertEqual(len(mappedTable), len(table))
+            self.assertEqual(dict(mappedTable), dict(table))
+            self.assertNotIn("missing", mappedTable)
+            with self.assertRaises(KeyError):
+                mappedTable["missing"]
+
+    def testDatasetHash(self):
+        self.assertEqual(self.mappedParser.getDatasetHash(), self.parser.getDatasetHash())
+
+    def testIdMaps(self):
+        self.assertEqual(self.mappedParser.getGroupIdToShipId(), self.parser.getGroupIdToShipId())
+        for metaId in self.parser.getMetaIdList():
+            self.assertEqual(self.mappedParser.getGroupIdFromMetaId(metaId), self.parser.getGroupIdFromMetaId(metaId))
+
+    def testSharedIdMapIsNotModified(self):
+        groupIdToShipId = self.mappedParser.getGroupIdToShipId()
+        groupIdToShipId[20101].clear()
+        groupIdToShipId[1] = [1]
+        self.assertEqual(self.mappedParser.getGroupIdToShipId()[20101], [201011, 201012, 201013, 201014])
+        self.assertNotIn(1, self.mappedParser.getGroupIdToShipId())
+        sharedMap = self.mappedParser.getSharedGroupIdToShipId()
+        with self.assertRaises(TypeError):
+            sharedMap[1] = (1,)
+        self.assertEqual(sharedMap[20101], (201011, 201012, 201013, 201014))
+
+    def testUnsupportedOptions(self):
+        for kwargs in [{"internValues": True}, {"shareSequences": True}, {"projection": "stats"}]:
+            with self.subTest(kwargs=kwargs), self.assertRaises(ValueError):
+                MappedConfigParser(self.path, self.mappedPath, **kwargs)
+
+    def testObjects(self):
+        for shipId in sorted(self.parser.getShipIdList()):
+            self.assertEqual(toJsonable(self.mappedParser.getShip(shipId)), toJsonable(self.parser.getShip(shipId)))
+        for weaponId in [1, 5, 20]:
+            self.assertEqual(toJsonable(self.mappedParser.getWeapon(weaponId)),
+                             toJsonable(self.parser.getWeapon(weaponId)))
+
+    def testMetaShipStats(self):
+        for metaId in sorted(self.parser.getMetaIdList()):
+            metaShip, mappedMetaShip = self.parser.getMetaShip(metaId), self.mappedParser.getMetaShip(metaId)
+            for lbLevel, isRefitted in [(0, False), (3, False), (3, True)]:
+                for statId in range(1, 13):
+                    self.assertEqual(mappedMetaShip.getStat(statId, 120, lbLevel, 12, isRefitted, True),
+                                     metaShip.getStat(statId, 120, lbLevel, 12, isRefitted, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from main.ConfigParser import ConfigParser
+from main.MemoryProfiler import profileMemory
+from main.Utility import getDeepSize
+from tests.FixtureDataset import FixtureTestCase
+
+
+class MemoryProfilerTest(FixtureTestCase):
+    def testTableSizesAddUp(self):
+        with ConfigParser(self.path, internValues=True) as parser:
+            report = profileMemory(parser, includeObjects=False)
+            self.assertEqual(report.tableTotal, sum(entry.size for entry in report.tableEntries))
+            # interned values are shared by the tables and only counted once
+            self.assertLess(report.tableTotal, sum(getDeepSize(getattr(parser, entry.name))
+                                                   for entry in report.tableEntries))
+
+    def testGameConfigFilesAreAllCounted(self):
+        with ConfigParser(self.path) as parser:
+            report = profileMemory(parser, includeGameConfig=True, includeObjects=False)
+            seen = set()
+            for entry in report.tableEntries:
+                getDeepSize(getattr(parser, entry.name), seen)
+            for entry in report.gameConfigEntries:
+                loader = parser.loadSkill if entry.name == "skill" else parser.loadBuff
+                # every file is kept alive, so no id is reused while measuring
+                configList = [loader(configId) for configId in parser.getGameConfigIdList(entry.name)]
+                self.assertEqual(entry.count, len(configList))
+                self.assertEqual(entry.size, sum(getDeepSize(config, seen) for config in configList))
+
+    def testObjectCounts(self):
+        report = profileMemory(self.parser)
+        countDict = {entry.name: entry.count for entry in report.objectEntries}
+        self.assertEqual(countDict["MetaShip"], len(self.parser.getMetaIdList()))
+        self.assertEqual(countDict["RootBuff"], 2)
+        # every ship is built once, except the filtered ship 900005
+        self.assertEqual(countDict["SurfaceShip"] + countDict["Submarine"], len(self.parser.shipDataDict) - 1)
+        self.assertTrue(all(entry.size > 0 for entry in report.objectEntries))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from main.ConfigParser import ConfigParser
+from main.ObjectGraph import buildObjectGraph, loadObjectGraph, getGraphCacheKey
+from main.Serialization import toJsonable
+from tests.FixtureDataset import FixtureTestCase
+
+
+class ObjectGraphCacheTest(FixtureTestCase):
+    def setUp(self):
+        self.cacheDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cacheDir)
+
+    def testWarmBootReadsNoDatasetFile(self):
+        coldGraph = loadObjectGraph(self.parser, self.cacheDir)
+        self.assertEqual(len(os.listdir(self.cacheDir)), 1)
+        with ConfigParser(self.path) as parser:
+            # the key comes from file stamps, nothing is hashed and no gamecfg file is loaded
+            with mock.patch.object(parser, "getDatasetHash", side_effect=AssertionError("hashed")), \
+                    mock.patch.object(parser, "loadSkill", side_effect=AssertionError("skill loaded")), \
+                    mock.patch.object(parser, "loadBuff", side_effect=AssertionError("buff loaded")):
+                warmGraph = loadObjectGraph(parser, self.cacheDir)
+        self.assertIsNot(warmGraph, coldGraph)
+        self.assertEqual(toJsonable(list(warmGraph.metaShips.values())),
+                         toJsonable(list(buildObjectGraph(self.parser).metaShips.values())))
+        self.assertEqual(sorted(warmGraph.rootBuffs), sorted(coldGraph.rootBuffs))
+
+    def testKeyFollowsFilesAndOptions(self):
+        cacheKey = getGraphCacheKey(self.parser)
+        with ConfigParser(self.path) as parser:
+            self.assertEqual(getGraphCacheKey(parser), cacheKey)
+        with ConfigParser(self.path, projection="ships") as parser:
+            self.assertNotEqual(getGraphCacheKey(parser), cacheKey)
+        filePath = os.path.join(self.path, "sharecfg", "ship_data_statistics")
+        fileStat = os.stat(filePath)
+        try:
+            os.utime(filePath, ns=(fileStat.st_atime_ns, fileStat.st_mtime_ns + 1000000000))
+            with ConfigParser(self.path) as parser:
+                self.assertNotEqual(getGraphCacheKey(parser), cacheKey)
+        finally:
+            os.utime(filePath, ns=(fileStat.st_atime_ns, fileStat.st_mtime_ns))
+
+    def testBrokenCacheFileIsRebuilt(self):
+        cachePath = os.path.join(self.cacheDir, "objectGraph_{}.pickle".format(getGraphCacheKey(self.parser)))
+        with open(cachePath, "wb") as cacheFile:
+            cacheFile.write(b"not a pickle")
+        graph = loadObjectGraph(self.parser, self.cacheDir)
+        self.assertEqual(sorted(graph.metaShips), sorted(self.parser.getMetaIdList()))
+        self.assertEqual(loadObjectGraph(self.parser, self.cacheDir).cacheKey, graph.cacheKey)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import unittest
+from main.ConfigParser import ConfigParser
+from main.DatasetStore import DatasetStore
+from main.MappedDataset import MappedConfigParser, writeMappedDataset
+from main.Parallel import mapWithParser
+from tests.FixtureDataset import FixtureTestCase
+
+
+def describeParser(parser: ConfigParser, shipId: int):
+    return (type(parser).__name__, parser.getConstructorArgs(), sorted(parser.shipStatisticDict[str(shipId)]),
+            parser.internReport is not None)
+
+
+def describeParserWithSharedData(parser: ConfigParser, sharedData: int, shipId: int):
+    return sharedData, describeParser(parser, shipId)
+
+
+class ParallelTest(FixtureTestCase):
+    def assertSameResults(self, parser: ConfigParser, function=describeParser, **kwargs):
+        shipIdList = sorted(parser.getShipIdList())
+        serialList = list(mapWithParser(parser, function, shipIdList, 1, **kwargs))
+        self.assertEqual(list(mapWithParser(parser, function, shipIdList, 2, **kwargs)), serialList)
+        return serialList
+
+    def testWorkersRebuildTheParser(self):
+        with ConfigParser(self.path, internValues=True, projection="stats") as parser:
+            resultList = self.assertSameResults(parser)
+        self.assertLess(len(resultList[0][2]), len(self.parser.shipStatisticDict["101011"]))
+        self.assertTrue(resultList[0][3])
+        self.assertEqual(self.assertSameResults(self.parser, describeParserWithSharedData, sharedData=7)[0][0], 7)
+
+    def testMappedParser(self):
+        mappedPath = os.path.join(self.path, "parallel.almap")
+        writeMappedDataset(self.parser, mappedPath)
+        with MappedConfigParser(self.path, mappedPath, cacheSize=8) as parser:
+            resultList = self.assertSameResults(parser)
+        self.assertEqual(resultList[0][:2], ("MappedConfigParser", ((self.path, mappedPath), {"cacheSize": 8})))
+
+    def testDatasetViewIsRejected(self):
+        store = DatasetStore({"fixture": self.path})
+        with self.assertRaises(ValueError):
+            list(mapWithParser(store.getParser("fixture"), describeParser, [101011], 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
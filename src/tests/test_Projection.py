@@ -0,0 +1,45 @@
+import pickle
+import unittest
+from main.ConfigParser import ConfigParser
+from main.Projection import ProjectedFieldError, projectionProfileDict
+from main.Serialization import toJsonable
+from tests.FixtureDataset import FixtureTestCase
+
+
+class ProjectionTest(FixtureTestCase):
+    def testShipsProfile(self):
+        with ConfigParser(self.path, projection="ships") as parser:
+            for shipId in sorted(self.parser.getShipIdList()):
+                self.assertEqual(toJsonable(parser.getShip(shipId)), toJsonable(self.parser.getShip(shipId)))
+            # tables outside the profile are not projected
+            self.assertEqual(parser.weaponDataDict, self.parser.weaponDataDict)
+
+    def testDroppedFields(self):
+        with ConfigParser(self.path, projection={"ship_data_statistics": ["id", "attrs"]}) as parser:
+            record = parser.shipStatisticDict["101011"]
+            self.assertEqual(dict(record), {"id": 101011, "attrs": self.parser.shipStatisticDict["101011"]["attrs"]})
+            for lookup in [lambda: record["oxy_max"], lambda: record.get("oxy_max"), lambda: "oxy_max" in record]:
+                with self.assertRaises(ProjectedFieldError) as context:
+                    lookup()
+                self.assertIn("ship_data_statistics", str(context.exception))
+            # a dropped field is a KeyError, not a silently missing value
+            with self.assertRaises(KeyError):
+                parser.getShip(101011)
+            copiedRecord = pickle.loads(pickle.dumps(record))
+            self.assertEqual(copiedRecord, record)
+            with self.assertRaises(ProjectedFieldError):
+                copiedRecord.get("name")
+
+    def testStatsProfile(self):
+        with ConfigParser(self.path, projection="stats") as parser:
+            fieldSet = set(projectionProfileDict["stats"]["ship_data_statistics"])
+            self.assertTrue(all(set(record) == fieldSet for record in parser.shipStatisticDict.values()))
+
+    def testInvalidProjection(self):
+        for projection in ["unknown", {"unknown_table": ["id"]}]:
+            with self.assertRaises(ValueError):
+                ConfigParser(self.path, projection=projection)
+
+
+if __name__ == "__main__":
+    unittest.main()
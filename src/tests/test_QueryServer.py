@@ -0,0 +1,82 @@
+import json
+import unittest
+from http.client import HTTPConnection
+from threading import Thread
+from unittest import mock
+from main.DatasetHandle import DatasetHandle
+from main.QueryServer import QueryService, createServer
+from tests.FixtureDataset import FixtureTestCase
+
+
+class QueryServiceTest(FixtureTestCase):
+    def setUp(self):
+        self.service = QueryService(DatasetHandle(self.parser), maxBatchSize=5)
+
+    def testSingleQuery(self):
+        status, body, eTag = self.service.getResponse("/metaship/5/stats?level=100&lb=2")
+        self.assertEqual(status, 200)
+        stats = json.loads(body)
+        self.assertEqual(stats["stats"]["cannon"], self.parser.getMetaShip(5).getStat(2, 100, 2, 0, False, True))
+        # parameter order does not change the cache key
+        self.assertEqual(self.service.getResponse("/metaship/5/stats?lb=2&level=100"), (status, body, eTag))
+        self.assertEqual(self.service.getResponse("/ship/1")[0], 404)
+        self.assertEqual(self.service.getResponse("/unknown/1")[0], 404)
+
+    def testBatchQuery(self):
+        status, body, _ = self.service.getResponse("/weapons?ids=1-3")
+        self.assertEqual(status, 200)
+        batch = json.loads(body)
+        self.assertEqual(sorted(batch), ["1", "2", "3"])
+        for weaponId in ["1", "2", "3"]:
+            self.assertEqual(batch[weaponId], json.loads(self.service.getResponse("/weapon/" + weaponId)[1]))
+        # the single object responses of the batch are cached and shared with single queries
+        self.assertEqual(len(self.service.cache), 3)
+
+    def testInvalidBatchQuery(self):
+        for url in ["/ships", "/ships?ids=abc", "/ships?ids=1-100", "/ships?ids=1-3,7-9"]:
+            with self.subTest(url=url):
+                status, body, _ = self.service.getResponse(url)
+                self.assertEqual(status, 400)
+                self.assertIn("error", json.loads(body))
+        self.assertEqual(len(self.service.cache), 0)
+
+    def testBrokenObject(self):
+        with mock.patch.object(self.parser, "getWeapon", side_effect=AttributeError("broken record")):
+            status, body, _ = self.service.getResponse("/weapon/1")
+        self.assertEqual(status, 500)
+        self.assertEqual(json.loads(body), {"error": "AttributeError: broken record"})
+        self.assertEqual(len(self.service.cache), 0)
+        # the batch answers the broken object with its error body
+        with mock.patch.object(self.parser, "getWeapon", side_effect=AttributeError("broken record")):
+            status, body, _ = self.service.getResponse("/weapons?ids=1")
+        self.assertEqual(json.loads(body), {"1": {"error": "AttributeError: broken record"}})
+
+    def testHttpServer(self):
+        server = createServer(self.parser, port=0)
+        thread = Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            connection = HTTPConnection(*server.server_address[:2])
+            connection.request("GET", "/weapon/1")
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            eTag = response.getheader("ETag")
+            self.assertEqual(json.loads(response.read())["id"], 1)
+            connection.request("GET", "/weapon/1", headers={"If-None-Match": eTag})
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 304)
+            with mock.patch.object(self.parser, "getWeapon", side_effect=AttributeError("broken record")):
+                connection.request("GET", "/weapon/2")
+                response = connection.getresponse()
+                self.assertEqual(response.status, 500)
+                self.assertIn("error", json.loads(response.read()))
+            connection.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
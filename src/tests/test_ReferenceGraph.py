@@ -0,0 +1,46 @@
+import os
+import unittest
+from main.ConfigParser import ConfigParser
+from tests.FixtureDataset import FixtureTestCase, genTables, writeFixtureDataset
+
+
+class ReferenceGraphTest(FixtureTestCase):
+    def testFixtureReferences(self):
+        graph = self.parser.getReferenceGraph()
+        self.assertEqual(graph.getReferences("weapon", 20), [("aircraft", 30), ("barrage", 1)])
+        self.assertEqual(graph.getReferences("weapon", 11), [("weapon", 3)])
+        self.assertEqual(graph.getReferences("weapon", 11, True, "bullet"), [("bullet", 4)])
+        # aircraft 31 carries the weapons of its base aircraft 30
+        self.assertEqual(graph.getReferrers("weapon", 1, False, "aircraft"), [("aircraft", 30)])
+        self.assertEqual(graph.getReferrers("weapon", 1, True, "aircraft"), [("aircraft", 30), ("aircraft", 31)])
+        # buffs 100 and 101 cast skills 1100 and 1101 at level 5, which fire plane weapon 20
+        self.assertEqual(graph.getReferrers("aircraft", 30, True, "buff"), [("buff", 100), ("buff", 101)])
+        self.assertEqual(graph.getReferrers("weapon", 20, True, "ship"),
+                         sorted(("ship", int(shipId)) for shipId in self.parser.shipDataDict))
+
+    def testSpawnTypes(self):
+        tableDict = genTables()
+        weaponTable = tableDict["weapon_property"]
+        # a cannon whose bullet id is also an aircraft id fires a bullet
+        tableDict["bullet_template"]["30"] = dict(tableDict["bullet_template"]["1"], id=30)
+        weaponTable["40"] = dict(weaponTable["1"], id=40, bullet_ID=[30])
+        # spawn_bound is inherited from the plane weapon 20, so the bullets of weapon 41 are aircraft
+        weaponTable["41"] = {"id": 41, "base": 20, "bullet_ID": [31]}
+        # a plane weapon with a non aircraft bullet launches the aircraft of its own id instead
+        weaponTable["31"] = dict(weaponTable["20"], id=31, bullet_ID=[1])
+        graphPath = os.path.join(self.path, "spawnTypes")
+        writeFixtureDataset(graphPath, tableDict)
+        with ConfigParser(graphPath) as parser:
+            graph = parser.getReferenceGraph()
+            for weaponId in [40, 41, 31]:
+                weapon = parser.getWeapon(weaponId)
+                projectileList = [("aircraft" if weapon.spawnType == "plane" else "bullet", bullet.id)
+                                  for bullet in weapon.bullets]
+                with self.subTest(weaponId=weaponId):
+                    self.assertEqual(graph.getReferences("weapon", weaponId, False, "aircraft")
+                                     + graph.getReferences("weapon", weaponId, False, "bullet"), projectileList)
+        self.assertEqual(graph.getReferences("weapon", 31, False, "aircraft"), [("aircraft", 31)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import os
+import unittest
+from main.ConfigParser import ConfigParser
+from tests.FixtureDataset import FixtureTestCase, genTables, writeFixtureDataset
+
+
+class ReferenceValidatorTest(FixtureTestCase):
+    def testValidDataset(self):
+        for includeGameConfig in [False, True]:
+            report = self.parser.validateReferences(includeGameConfig)
+            self.assertTrue(report.isValid(), report.toString())
+            self.assertGreater(report.checkedCount, 0)
+
+    def testBrokenReferences(self):
+        tableDict = genTables()
+        tableDict["weapon_property"]["11"]["base"] = 99
+        tableDict["weapon_property"]["5"]["bullet_ID"] = [1, 77]
+        tableDict["ship_data_template"]["201011"]["strengthen_id"] = 1
+        tableDict["ship_data_template"]["201012"]["buff_list_display"] = [100, 102]
+        brokenPath = os.path.join(self.path, "broken")
+        writeFixtureDataset(brokenPath, tableDict)
+        with ConfigParser(brokenPath) as parser:
+            report = parser.validateReferences()
+        self.assertFalse(report.isValid())
+        self.assertEqual(sorted(issue.toString() for issue in report.issues), [
+            "ship_data_template[201011].strengthen_id -> ship_data_strengthen[1] does not exist",
+            "ship_data_template[201012].buff_list_display -> skill_data_template[102] does not exist",
+            "weapon_property[11].base -> weapon_property[99] does not exist",
+            "weapon_property[5].bullet_ID -> bullet_template/aircraft_template[77] does not exist"])
+        self.assertEqual(report.getIssueCounts()["weapon_property.base -> weapon_property"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import math
+import unittest
+from tests.FixtureDataset import FixtureTestCase
+
+
+class ResearchBonusTableTest(FixtureTestCase):
+    """
+    ResearchBonusTable must give the same bonuses as summing the research nodes of a research ship directly
+    """
+
+    def testBonusesMatchNodes(self):
+        metaShip = self.parser.getMetaShip(20001)
+        self.assertTrue(metaShip.isResearchShip)
+        table = metaShip.researchBonusTable
+        for devLevel in range(0, table.maxDevLevel + 1):
+            nodeList = [node for node in metaShip.researchNodeList if node.devLevel <= devLevel]
+            for statId in range(1, 13):
+                self.assertEqual(table.getStatBonus(statId, devLevel),
+                                 sum(node.getStatBonus(statId) for node in nodeList))
+            for equipSlot in range(1, 5):
+                self.assertAlmostEqual(table.getEquipProficiencyBonus(equipSlot, devLevel),
+                                       sum(node.getEquipProficiencyBonus(equipSlot) for node in nodeList))
+            for equipSlot in range(1, 4):
+                self.assertEqual(table.getPreloadBonus(equipSlot, devLevel),
+                                 sum(node.getPreloadBonus(equipSlot) for node in nodeList))
+        for fateSimStage in range(1, table.maxFateSimStage + 1):
+            nodeList = metaShip.researchNodeList + metaShip.fateSimNodeList[:fateSimStage]
+            for statId in range(1, 13):
+                self.assertEqual(table.getStatBonus(statId, table.maxDevLevel, fateSimStage),
+                                 sum(node.getStatBonus(statId) for node in nodeList))
+
+    def testBoundsAreChecked(self):
+        table = self.parser.getMetaShip(20001).researchBonusTable
+        with self.assertRaises(ValueError):
+            table.getStatBonus(1, table.maxDevLevel + 1)
+        with self.assertRaises(ValueError):
+            table.getStatBonus(1, 0, 1)
+
+    def testResearchStatListMatchesGetStat(self):
+        metaShip = self.parser.getMetaShip(20001)
+        for statId in range(1, 13):
+            statList = metaShip.getResearchStatList(statId, 120, 3, 12, False, True)
+            self.assertEqual(statList, [metaShip.getStat(statId, 120, 3, 12, False, True, devLevel)
+                                        for devLevel in range(0, len(statList))])
+            researchStat = sum(node.getStatBonus(statId) for node in metaShip.researchNodeList)
+            baseStat, refitStat = metaShip.getBaseAndRefitStat(statId, 120, 3, 12, False, True)
+            self.assertEqual(statList[-1], math.floor((baseStat + researchStat) * 1.12 + refitStat))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from main.ShipNameIndex import ShipNameIndex, trieTopSize
+from tests.FixtureDataset import FixtureTestCase
+
+
+class ShipNameIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = ShipNameIndex([], {}, {}, {})
+        wordList = ["ab", "abc", "b", "ba", "c", "ca", "cab", "a"]
+        for number in range(0, 600):
+            # a deterministic mix of one to three word names, many share their prefixes
+            name = " ".join(wordList[(number // 8 ** position) % 8] + "abc"[position] for position in range(
+                0, number % 3 + 1))
+            self.index.addName(name, None, [number])
+
+    def getAllCompletions(self, prefix: str):
+        return self.index.complete(prefix, len(self.index.displayNames))
+
+    def testCompleteUsesShortestNames(self):
+        for prefix in ["", "a", "ab", "b", "ca", "cab", "aa b", "x"]:
+            allCompletions = self.getAllCompletions(prefix)
+            for limit in [1, 10, trieTopSize]:
+                with self.subTest(prefix=prefix, limit=limit):
+                    self.assertEqual(self.index.complete(prefix, limit), allCompletions[:limit])
+                    self.assertEqual(allCompletions, sorted(allCompletions, key=lambda x: (len(x), x.lower())))
+
+    def testAlias(self):
+        name = self.getAllCompletions("a")[0]
+        self.index.addAlias("Q", name)
+        self.assertEqual(self.index.complete("q", 1), ["Q"])
+        # names added after the index was built still update the stored completions
+        self.assertEqual(self.index.complete("", 1), ["Q"])
+        self.assertEqual(self.index.lookup("q"), self.index.lookup(name))
+
+
+class FixtureShipNameIndexTest(FixtureTestCase):
+    def testLookup(self):
+        index = self.parser.getShipNameIndex()
+        shipIdList = [201011, 201012, 201013, 201014]  # 900005 is filtered
+        for name in ["Ship5 (USS Ship5)", "ship5", "USS  Ship5"]:
+            self.assertEqual(index.lookup(name), ([5], shipIdList))
+        self.assertEqual(index.lookup("Ship6"), ([], []))
+        self.assertEqual(index.complete("ship2", 3), ["Ship2", "Ship20001", "USS Ship2"])
+        self.assertEqual(index.fuzzySearch("Shp5", 1), [("Ship5", 1)])
+        self.assertEqual(index.search("Shp5", 1), ["Ship5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+from main.Triggerable import RootBuff
+from tests.FixtureDataset import FixtureTestCase
+
+
+class SkillLevelsTest(FixtureTestCase):
+    def testLevelsMatchRootBuffs(self):
+        skillLevels = self.parser.getSkillLevels(100)
+        skillData = self.parser.skillDataDict["100"]
+        self.assertEqual(skillLevels.maxLevel, 10)
+        for level in range(1, 11):
+            rootBuff = RootBuff(self.parser.loadBuff(100), skillData, self.parser, level)
+            with self.subTest(level=level):
+                self.assertEqual(skillLevels.getLevel(level).getDescription(), rootBuff.getDescription())
+                self.assertEqual([weapon.id for weapon in skillLevels.getLevel(level).getWeaponList()],
+                                 [weapon.id for weapon in rootBuff.getWeaponList()])
+        self.assertEqual(skillLevels.getDescriptionList()[2], "Increase <color>reload</color> by 7 and fire a2")
+        self.assertEqual(skillLevels.summaryDescription, self.parser.getRootBuff(100).getDescription())
+        # the buff casts skill 1100 (plane weapon 20) at level 5 and skill 100 at every other level
+        self.assertEqual([[weapon.id for weapon in weaponList] for weaponList in skillLevels.getWeaponListByLevel()],
+                         [[1]] * 4 + [[20]] + [[1]] * 5)
+        self.assertEqual(skillLevels.nodeCount, 2)
+
+    def testLevelBounds(self):
+        skillLevels = self.parser.getSkillLevels(101)
+        for level in [0, 11]:
+            with self.assertRaises(ValueError):
+                skillLevels.getLevel(level)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import copy
+import unittest
+from main.SkillSearchIndex import SkillSearchIndex
+from tests.FixtureDataset import FixtureTestCase
+
+
+class SkillSearchIndexTest(FixtureTestCase):
+    def testSearch(self):
+        index = self.parser.getSkillSearchIndex()
+        # "torpedo" is in the name (weight 3) and in desc_get (weight 1) of both fixture skills
+        self.assertEqual(index.search("torpedo"), [(100, 4), (101, 4)])
+        self.assertEqual(index.search("Torpedo 101"), [(101, 7), (100, 4)])
+        self.assertEqual(index.search("torp"), [(100, 4), (101, 4)])
+        self.assertEqual(index.search("torp", prefix=False), [])
+        self.assertEqual(index.search("torpedo", limit=1), [(100, 4)])
+        # html tags and description placeholders are not indexed
+        self.assertEqual(index.search("color"), [])
+        self.assertEqual(index.search("$1"), [])
+        # desc_add parameters are indexed too
+        self.assertEqual([skillId for skillId, _ in index.search("a9")], [100, 101])
+
+    def testUpdate(self):
+        skillDataDict = copy.deepcopy(dict(self.parser.skillDataDict))
+        index = SkillSearchIndex(skillDataDict)
+        self.assertEqual(index.update(skillDataDict), (0, 0))
+
+        skillDataDict["101"]["name"] = "Airstrike"
+        del skillDataDict["100"]
+        self.assertEqual(index.update(skillDataDict), (1, 1))
+        self.assertEqual(index.search("torpedo"), [(101, 1)])
+        self.assertEqual(index.search("air"), [(101, 3)])
+        self.assertEqual(index.search("100"), [])
+
+        rebuiltIndex = SkillSearchIndex(skillDataDict)
+        self.assertEqual(index.postings, rebuiltIndex.postings)
+        self.assertEqual(index.sortedTokens, rebuiltIndex.sortedTokens)
+
+
+if __name__ == "__main__":
+    unittest.main()